@@ -6,7 +6,6 @@ from typing import List, Optional
 
 import typer
 from importlib.metadata import version as _version
-from bfcl_eval._llm_response_generation import main as generation_main
 from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING
 from bfcl_eval.constants.eval_config import (
     DOTENV_PATH,
@@ -15,7 +14,6 @@ from bfcl_eval.constants.eval_config import (
     SCORE_PATH,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
 from dotenv import load_dotenv
 from tabulate import tabulate
 
@@ -120,6 +118,27 @@ def generate(
     ),
     num_gpus: int = typer.Option(1, help="The number of GPUs to use."),
     num_threads: int = typer.Option(1, help="The number of threads to use."),
+    num_concurrent_models: int = typer.Option(
+        1,
+        help="The number of models to generate results for at the same time, when multiple models are given.",
+    ),
+    async_mode: bool = typer.Option(
+        False,
+        "--async-mode",
+        help="Use the asyncio generation engine instead of a thread pool; only relevant for API-based models.",
+    ),
+    max_concurrency: Optional[int] = typer.Option(
+        None,
+        help="The maximum number of test entries in flight when using `--async-mode` (default 100) or locally-hosted models (default estimated from the server's KV cache capacity).",
+    ),
+    requests_per_minute: Optional[float] = typer.Option(
+        None,
+        help="Cap the request rate sent to the model provider. By default, the rate is only adapted to the provider's throttling responses.",
+    ),
+    tokens_per_minute: Optional[float] = typer.Option(
+        None,
+        help="Cap the token throughput (input + output) sent to the model provider.",
+    ),
     gpu_memory_utilization: float = typer.Option(0.9, help="The GPU memory utilization."),
     backend: str = typer.Option("vllm", help="The backend to use for the model."),
     skip_server_setup: bool = typer.Option(
@@ -127,6 +146,15 @@ def generate(
         "--skip-server-setup",
         help="Skip vLLM/SGLang server setup and use existing endpoint specified by the VLLM_ENDPOINT and VLLM_PORT environment variables.",
     ),
+    server_pool: bool = typer.Option(
+        False,
+        "--server-pool",
+        help="Keep the vLLM/SGLang server running after generation, and reuse it in later runs with the same model, dtype and number of GPUs.",
+    ),
+    server_idle_timeout: float = typer.Option(
+        30,
+        help="With `--server-pool`, shut a pooled server down after it has not been used for this many minutes.",
+    ),
     local_model_path: Optional[str] = typer.Option(
         None,
         "--local-model-path",
@@ -137,6 +165,19 @@ def generate(
         "--result-dir",
         help="Path to the folder where output files will be stored; Path should be relative to the `berkeley-function-call-leaderboard` root folder",
     ),
+    result_store: str = typer.Option(
+        "jsonl",
+        help="How to store the generated results: `jsonl` for one result file per test category, or `sqlite` for a single SQLite database per model.",
+    ),
+    cache_dir: Optional[str] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Cache model responses in this folder, so that identical requests in later runs are served from disk instead of calling the model; Path should be relative to the `berkeley-function-call-leaderboard` root folder",
+    ),
+    cache_max_size_gb: float = typer.Option(
+        10,
+        help="The maximum size of the response cache, in GB. The least recently used responses are evicted beyond this size.",
+    ),
     allow_overwrite: bool = typer.Option(
         False,
         "--allow-overwrite",
@@ -161,15 +202,28 @@ def generate(
         exclude_state_log=exclude_state_log,
         num_gpus=num_gpus,
         num_threads=num_threads,
+        num_concurrent_models=num_concurrent_models,
+        async_mode=async_mode,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
         gpu_memory_utilization=gpu_memory_utilization,
         backend=backend,
         skip_server_setup=skip_server_setup,
+        server_pool=server_pool,
+        server_idle_timeout=server_idle_timeout,
         local_model_path=local_model_path,
         result_dir=result_dir,
+        result_store=result_store,
+        cache_dir=cache_dir,
+        cache_max_size_gb=cache_max_size_gb,
         allow_overwrite=allow_overwrite,
         run_ids=run_ids,
     )
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
+    # Imported here rather than at the top, so that the other commands don't pay for loading the handlers and their SDKs
+    from bfcl_eval._llm_response_generation import main as generation_main
+
     generation_main(args)
 
 
@@ -251,13 +305,19 @@ def evaluate(
         "--score-dir",
         help="Relative path to the evaluation score folder, if different from the default; Path should be relative to the `berkeley-function-call-leaderboard` root folder",
     ),
+    num_processes: int = typer.Option(
+        1,
+        help="The number of processes to evaluate (model, test category) pairs in parallel.",
+    ),
 ):
     """
     Evaluate results from run of one or more models on a test-category (same as eval_runner.py).
     """
 
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
-    evaluation_main(model, test_category, result_dir, score_dir)
+    from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+
+    evaluation_main(model, test_category, result_dir, score_dir, num_processes)
 
 
 @cli.command()
@@ -1,7 +1,8 @@
 import argparse
+import asyncio
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 import traceback
 
@@ -10,6 +11,7 @@ from bfcl_eval.constants.category_mapping import (
     TEST_FILE_MAPPING,
 )
 from bfcl_eval.constants.eval_config import (
+    DEFAULT_MAX_CONCURRENCY,
     MULTI_TURN_FUNC_DOC_PATH,
     PROJECT_ROOT,
     PROMPT_PATH,
@@ -18,13 +20,25 @@ from bfcl_eval.constants.eval_config import (
 )
 from bfcl_eval.eval_checker.eval_runner_helper import load_file
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
+from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+from bfcl_eval.model_handler.local_inference.server_pool import check_server_pool_supported
 from bfcl_eval.model_handler.model_style import ModelStyle
-from bfcl_eval.utils import is_multi_turn, parse_test_category_argument, sort_key
+from bfcl_eval.model_handler.rate_limiter import is_rate_limit_error
+from bfcl_eval.model_handler.response_cache import ResponseCache
+from bfcl_eval.model_handler.result_store import ResultStore
+from bfcl_eval.utils import (
+    TEST_CATEGORY_CATALOGUE,
+    compact_result_log,
+    is_multi_turn,
+    load_result_ids,
+    parse_test_category_argument,
+    sort_key,
+)
 from tqdm import tqdm
 
 RETRY_LIMIT = 3
-# 60s for the timer to complete. But often we find that even with 60 there is a conflict. So 65 is a safe no.
-RETRY_DELAY = 65  # Delay in seconds
+RETRY_DELAY = 65  # Delay in seconds, after a server error
+SERVER_ERROR_STATUS_CODES = {500}
 
 
 def get_args():
@@ -39,10 +53,18 @@ def get_args():
     parser.add_argument("--include-input-log", action="store_true", default=False)
     parser.add_argument("--exclude-state-log", action="store_true", default=False)
     parser.add_argument("--num-threads", default=1, type=int)
+    parser.add_argument("--num-concurrent-models", default=1, type=int)
+    parser.add_argument("--async-mode", action="store_true", default=False)
+    parser.add_argument("--max-concurrency", default=None, type=int)
+    parser.add_argument("--requests-per-minute", default=None, type=float)
+    parser.add_argument("--tokens-per-minute", default=None, type=float)
+    parser.add_argument("--cache-dir", default=None, type=str)
+    parser.add_argument("--cache-max-size-gb", default=10, type=float)
     parser.add_argument("--num-gpus", default=1, type=int)
     parser.add_argument("--backend", default="vllm", type=str, choices=["vllm", "sglang"])
     parser.add_argument("--gpu-memory-utilization", default=0.9, type=float)
     parser.add_argument("--result-dir", default=None, type=str)
+    parser.add_argument("--result-store", default="jsonl", type=str, choices=["jsonl", "sqlite"])
     parser.add_argument("--run-ids", action="store_true", default=False)
     parser.add_argument("--allow-overwrite", "-o", action="store_true", default=False)
     # Add the new skip_vllm argument
@@ -52,6 +74,8 @@ def get_args():
         default=False,
         help="Skip vLLM/SGLang server setup and use existing endpoint specified by the VLLM_ENDPOINT and VLLM_PORT environment variables."
     )
+    parser.add_argument("--server-pool", action="store_true", default=False)
+    parser.add_argument("--server-idle-timeout", default=30, type=float)
     # Optional local model path
     parser.add_argument(
         "--local-model-path",
@@ -66,7 +90,7 @@ def get_args():
 
 def build_handler(model_name, temperature):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(model_name, temperature)
+    handler = config.handler_class(model_name, temperature)
     # Propagate config flags to the handler instance
     handler.is_fc_model = config.is_fc_model
     return handler
@@ -112,14 +136,27 @@ def collect_test_cases(
     model_name_dir = model_name.replace("/", "_")
     model_result_dir = args.result_dir / model_name_dir
 
-    existing_result = []
+    result_store = None
+    if args.result_store == "sqlite":
+        result_store = ResultStore(model_result_dir)
+
+    existing_ids = set()
     for test_category, file_to_open in zip(all_test_categories, all_test_file_paths):
 
-        result_file_path = model_result_dir / file_to_open.replace(".json", "_result.json")
+        if result_store is not None:
+            if not args.allow_overwrite:
+                existing_ids.update(result_store.load_ids(test_category))
+            elif not args.run_ids:
+                result_store.delete_test_category(test_category)
+            continue
+
+        result_file_path = model_result_dir / TEST_CATEGORY_CATALOGUE[test_category].result_file_name
+        # Recover entries that a previous, interrupted run finished but never merged into the result file
+        compact_result_log(result_file_path)
         if result_file_path.exists():
-            # Not allowing overwrite, we will load the existing results
+            # Not allowing overwrite, we will skip the entries that already have results
             if not args.allow_overwrite:
-                existing_result.extend(load_file(result_file_path))
+                existing_ids.update(load_result_ids(result_file_path))
             # Allow overwrite and not running specific test ids, we will delete the existing result file before generating new results
             elif not args.run_ids:
                 result_file_path.unlink()
@@ -127,10 +164,9 @@ def collect_test_cases(
             else:
                 pass
 
-        existing_ids = [entry["id"] for entry in existing_result]
-
+    # Copy the entries, since `process_multi_turn_test_case` modifies them in place and they are shared by all models
     test_cases_to_generate = [
-        test_case
+        deepcopy(test_case)
         for test_case in all_test_entries_involved
         if test_case["id"] not in existing_ids
     ]
@@ -171,6 +207,19 @@ def process_multi_turn_test_case(test_cases):
     return test_cases
 
 
+def get_retry_delay(handler, error: Exception):
+    """
+    How long to wait before retrying a test case that failed with `error`, or None if it should not be retried.
+    Only throttling slows down the other requests to the provider; server errors are retried after a fixed delay.
+    """
+    if is_rate_limit_error(error):
+        # The shared rate limiter decides the delay (honoring Retry-After), and holds back the other workers hitting the same provider too
+        return handler.rate_limiter.on_rate_limited(error)
+    if getattr(error, "status_code", None) in SERVER_ERROR_STATUS_CODES:
+        return RETRY_DELAY
+    return None
+
+
 def multi_threaded_inference(handler, test_case, include_input_log, exclude_state_log):
 
     assert type(test_case["function"]) is list
@@ -186,14 +235,12 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
         except Exception as e:
             # TODO: It might be better to handle the exception in the handler itself rather than a universal catch block here, as each handler use different ways to call the endpoint.
             # OpenAI has openai.RateLimitError while Anthropic has anthropic.RateLimitError. It would be more robust in the long run.
-            if retry_count < RETRY_LIMIT and (
-                "rate limit reached" in str(e).lower()
-                or (hasattr(e, "status_code") and (e.status_code in {429, 503, 500}))
-            ):
+            retry_delay = get_retry_delay(handler, e) if retry_count < RETRY_LIMIT else None
+            if retry_delay is not None:
                 print(
-                    f"Rate limit reached. Sleeping for 65 seconds. Retry {retry_count + 1}/{RETRY_LIMIT}"
+                    f"Rate limit or server error. Sleeping for {retry_delay:.2f} seconds. Retry {retry_count + 1}/{RETRY_LIMIT}"
                 )
-                time.sleep(RETRY_DELAY)
+                time.sleep(retry_delay)
                 retry_count += 1
             else:
                 # This is usually the case when the model getting stuck on one particular test case.
@@ -224,9 +271,115 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
     return result_to_write
 
 
-def generate_results(args, model_name, test_cases_total):
-    update_mode = args.allow_overwrite
+async def async_inference(
+    handler, test_case, include_input_log, exclude_state_log, semaphore
+):
+
+    assert type(test_case["function"]) is list
+
+    retry_count = 0
+
+    # The semaphore bounds the number of entries in flight; entries waiting on it hold no copy of the test case
+    async with semaphore:
+        while True:
+            try:
+                result, metadata = await handler.inference_async(
+                    deepcopy(test_case), include_input_log, exclude_state_log
+                )
+                break  # Success, exit the loop
+            except Exception as e:
+                retry_delay = (
+                    get_retry_delay(handler, e) if retry_count < RETRY_LIMIT else None
+                )
+                if retry_delay is not None:
+                    print(
+                        f"Rate limit or server error. Sleeping for {retry_delay:.2f} seconds. Retry {retry_count + 1}/{RETRY_LIMIT}"
+                    )
+                    await asyncio.sleep(retry_delay)
+                    retry_count += 1
+                else:
+                    # Same as `multi_threaded_inference`: record the error as the model response and move on
+                    print("-" * 100)
+                    print(
+                        "❗️❗️ Error occurred during inference. Maximum reties reached for rate limit or other error. Continuing to next test case."
+                    )
+                    print(f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}")
+                    traceback.print_exc(limit=10)
+                    print("-" * 100)
+
+                    return {
+                        "id": test_case["id"],
+                        "result": f"Error during inference: {str(e)}",
+                        "traceback": traceback.format_exc(),
+                    }
+
+    result_to_write = {
+        "id": test_case["id"],
+        "result": result,
+    }
+
+    result_to_write.update(metadata)
+
+    return result_to_write
+
+
+async def generate_results_async(
+    args, model_name, handler, test_cases_total, progress_position, overall_pbar
+):
+    # Handlers without a native async client run their blocking SDK call in the loop's default executor,
+    # which would otherwise cap the number of requests in flight at min(32, os.cpu_count() + 4)
+    max_concurrency = args.max_concurrency or DEFAULT_MAX_CONCURRENCY
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max_concurrency)
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with tqdm(
+        total=len(test_cases_total),
+        desc=f"Generating results for {model_name}",
+        position=progress_position,
+    ) as pbar:
+        tasks = [
+            asyncio.create_task(
+                async_inference(
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                    semaphore,
+                )
+            )
+            for test_case in test_cases_total
+        ]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                # Persist each result as soon as it completes, so a slow entry never holds back the ones behind it
+                result = await task
+                handler.write_to_result_log(result, result_dir=args.result_dir)
+                pbar.update()
+                if overall_pbar is not None:
+                    overall_pbar.update()
+        finally:
+            # Merge the logs into the ID-sorted result files, also keeping whatever finished if we are interrupted
+            handler.compact_result_logs(args.result_dir)
+
+
+def generate_results(
+    args, model_name, test_cases_total, progress_position=0, overall_pbar=None
+):
     handler = build_handler(model_name, args.temperature)
+    handler.rate_limiter.configure(
+        requests_per_minute=args.requests_per_minute,
+        tokens_per_minute=args.tokens_per_minute,
+    )
+    if args.cache_dir is not None:
+        handler.response_cache = ResponseCache(
+            cache_dir=args.cache_dir,
+            max_size_bytes=int(args.cache_max_size_gb * 1024**3),
+        )
+    if args.result_store == "sqlite":
+        handler.result_store = ResultStore(args.result_dir / model_name.replace("/", "_"))
 
     if handler.model_style == ModelStyle.OSSMODEL:
         # batch_inference will handle the writing of results
@@ -239,15 +392,33 @@ def generate_results(args, model_name, test_cases_total):
             local_model_path=args.local_model_path,
             include_input_log=args.include_input_log,
             exclude_state_log=args.exclude_state_log,
+            use_server_pool=args.server_pool,
+            server_idle_timeout=args.server_idle_timeout * 60,
+            max_concurrency=args.max_concurrency,
             result_dir=args.result_dir,
-            update_mode=update_mode,
+        )
+        if overall_pbar is not None:
+            overall_pbar.update(len(test_cases_total))
+
+    elif args.async_mode:
+        asyncio.run(
+            generate_results_async(
+                args,
+                model_name,
+                handler,
+                test_cases_total,
+                progress_position,
+                overall_pbar,
+            )
         )
 
     else:
         futures = []
         with ThreadPoolExecutor(max_workers=args.num_threads) as executor:
             with tqdm(
-                total=len(test_cases_total), desc=f"Generating results for {model_name}"
+                total=len(test_cases_total),
+                desc=f"Generating results for {model_name}",
+                position=progress_position,
             ) as pbar:
 
                 for test_case in test_cases_total:
@@ -260,13 +431,63 @@ def generate_results(args, model_name, test_cases_total):
                     )
                     futures.append(future)
 
-                for future in futures:
-                    # This will wait for the task to complete, so that we are always writing in order
-                    result = future.result()
-                    handler.write(
-                        result, result_dir=args.result_dir, update_mode=args.run_ids
-                    )  # Only when we run specific test ids, we will need update_mode=True to keep entries in the same order
-                    pbar.update()
+                try:
+                    for future in as_completed(futures):
+                        # Persist each result as soon as it completes, so a slow entry never holds back the ones behind it
+                        result = future.result()
+                        handler.write_to_result_log(result, result_dir=args.result_dir)
+                        pbar.update()
+                        if overall_pbar is not None:
+                            overall_pbar.update()
+                finally:
+                    # Merge the logs into the ID-sorted result files, also keeping whatever finished if we are interrupted
+                    handler.compact_result_logs(args.result_dir)
+
+
+def generate_results_concurrently(args, models_to_generate):
+    """
+    Generate results for several models at the same time, with a shared progress bar for the whole sweep.
+    Each API model runs independently, with its own thread pool (or event loop) and rate limiter.
+    Locally-hosted models all need the GPUs and the same server port, so they run one after another in a single lane.
+    """
+    api_model_lanes = []
+    local_model_lane = []
+    for model_name, test_cases_total in models_to_generate:
+        if issubclass(MODEL_CONFIG_MAPPING[model_name].handler_class, OSSHandler):
+            local_model_lane.append((model_name, test_cases_total))
+        else:
+            api_model_lanes.append([(model_name, test_cases_total)])
+    lanes = api_model_lanes + ([local_model_lane] if local_model_lane else [])
+
+    def run_lane(lane, progress_position, overall_pbar):
+        for model_name, test_cases_total in lane:
+            generate_results(
+                args, model_name, test_cases_total, progress_position, overall_pbar
+            )
+
+    with tqdm(
+        total=sum(len(test_cases_total) for _, test_cases_total in models_to_generate),
+        desc="Generating results for all models",
+        position=0,
+    ) as overall_pbar:
+        with ThreadPoolExecutor(max_workers=args.num_concurrent_models) as executor:
+            futures = {
+                executor.submit(run_lane, lane, progress_position, overall_pbar): lane
+                for progress_position, lane in enumerate(lanes, start=1)
+            }
+            failed_models = []
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    # Let the other models finish before reporting the failure
+                    lane_model_names = [model_name for model_name, _ in futures[future]]
+                    print(f"❗️❗️ Error occurred while generating results for {lane_model_names}.")
+                    traceback.print_exc()
+                    failed_models.extend(lane_model_names)
+
+    if failed_models:
+        raise RuntimeError(f"Generation failed for models: {failed_models}")
 
 
 def main(args):
@@ -289,6 +510,9 @@ def main(args):
                         "• For officially supported models, please refer to `SUPPORTED_MODELS.md`.\n"
                         "• For running new models, please refer to `README.md` and `CONTRIBUTING.md`."
                     )
+    if args.server_pool:
+        # Fail before any work is done, rather than once the first OSS model gets to launch its server
+        check_server_pool_supported()
     print(f"Generating results for {args.model}")
     if args.run_ids:
         print("Running specific test cases. Ignoring `--test-category` argument.")
@@ -300,6 +524,10 @@ def main(args):
     else:
         args.result_dir = RESULT_PATH
 
+    if args.cache_dir is not None:
+        args.cache_dir = PROJECT_ROOT / args.cache_dir
+
+    models_to_generate = []
     for model_name in args.model:
         test_cases_total = collect_test_cases(
             args,
@@ -314,4 +542,10 @@ def main(args):
                 f"All selected test cases have been previously generated for {model_name}. No new test cases to generate."
             )
         else:
+            models_to_generate.append((model_name, test_cases_total))
+
+    if args.num_concurrent_models > 1 and len(models_to_generate) > 1:
+        generate_results_concurrently(args, models_to_generate)
+    else:
+        for model_name, test_cases_total in models_to_generate:
             generate_results(args, model_name, test_cases_total)
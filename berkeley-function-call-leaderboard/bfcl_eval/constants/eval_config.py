@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 
 VLLM_PORT = 1053
+# The default number of requests in flight for `--async-mode` and locally-hosted models
+DEFAULT_MAX_CONCURRENCY = 100
 
 # Price got from Lambda Cloud, 23.92 per hour for 8x H100, on-demand pay as you go total price
 # Reference: https://lambda.ai/pricing
@@ -21,6 +23,8 @@ RESULT_PATH = PROJECT_ROOT / "result"
 SCORE_PATH = PROJECT_ROOT / "score"
 DOTENV_PATH = PROJECT_ROOT / ".env"
 TEST_IDS_TO_GENERATE_PATH = PROJECT_ROOT / "test_case_ids_to_generate.json"
+SERVER_POOL_PATH = PROJECT_ROOT / ".server_pool"
+GROUND_TRUTH_CACHE_PATH = PROJECT_ROOT / ".ground_truth_cache"
 
 PROMPT_PATH = PACKAGE_ROOT / "data"
 MULTI_TURN_FUNC_DOC_PATH = PROMPT_PATH / "multi_turn_func_doc"
@@ -1,75 +1,8 @@
+import importlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
-from bfcl_eval.model_handler.api_inference.claude import ClaudeHandler
-from bfcl_eval.model_handler.api_inference.cohere import CohereHandler
-from bfcl_eval.model_handler.api_inference.databricks import DatabricksHandler
-from bfcl_eval.model_handler.api_inference.deepseek import DeepSeekAPIHandler
-from bfcl_eval.model_handler.api_inference.dm_cito import DMCitoHandler
-from bfcl_eval.model_handler.api_inference.fireworks import FireworksHandler
-from bfcl_eval.model_handler.api_inference.functionary import FunctionaryHandler
-from bfcl_eval.model_handler.api_inference.gemini import GeminiHandler
-from bfcl_eval.model_handler.api_inference.gogoagent import GoGoAgentHandler
-from bfcl_eval.model_handler.api_inference.gorilla import GorillaHandler
-from bfcl_eval.model_handler.api_inference.grok import GrokHandler
-from bfcl_eval.model_handler.api_inference.ling import LingAPIHandler
-from bfcl_eval.model_handler.api_inference.mining import MiningHandler
-from bfcl_eval.model_handler.api_inference.mistral import MistralHandler
-from bfcl_eval.model_handler.api_inference.nemotron import NemotronHandler
-from bfcl_eval.model_handler.api_inference.nexus import NexusHandler
-from bfcl_eval.model_handler.api_inference.nova import NovaHandler
-from bfcl_eval.model_handler.api_inference.novita import NovitaHandler
-from bfcl_eval.model_handler.api_inference.nvidia import NvidiaHandler
-from bfcl_eval.model_handler.api_inference.openai_completion import (
-    OpenAICompletionsHandler,
-)
-from bfcl_eval.model_handler.api_inference.openai_response import OpenAIResponsesHandler
-from bfcl_eval.model_handler.api_inference.qwen import (
-    QwenAgentNoThinkHandler,
-    QwenAgentThinkHandler,
-    QwenAPIHandler,
-)
-from bfcl_eval.model_handler.api_inference.writer import WriterHandler
-from bfcl_eval.model_handler.api_inference.yi import YiHandler
-from bfcl_eval.model_handler.api_inference.glm import GLMAPIHandler
-from bfcl_eval.model_handler.local_inference.arch import ArchHandler
-from bfcl_eval.model_handler.local_inference.bielik import BielikHandler
-from bfcl_eval.model_handler.local_inference.bitagent import BitAgentHandler
-from bfcl_eval.model_handler.local_inference.deepseek import DeepseekHandler
-from bfcl_eval.model_handler.local_inference.deepseek_coder import DeepseekCoderHandler
-from bfcl_eval.model_handler.local_inference.deepseek_reasoning import (
-    DeepseekReasoningHandler,
-)
-from bfcl_eval.model_handler.local_inference.falcon_fc import Falcon3FCHandler
-from bfcl_eval.model_handler.local_inference.gemma import GemmaHandler
-from bfcl_eval.model_handler.local_inference.glaive import GlaiveHandler
-from bfcl_eval.model_handler.local_inference.glm import GLMHandler
-from bfcl_eval.model_handler.local_inference.granite import (
-    GraniteFunctionCallingHandler,
-)
-from bfcl_eval.model_handler.local_inference.granite_3 import Granite3FCHandler
-from bfcl_eval.model_handler.local_inference.hammer import HammerHandler
-from bfcl_eval.model_handler.local_inference.hermes import HermesHandler
-from bfcl_eval.model_handler.local_inference.llama import LlamaHandler
-from bfcl_eval.model_handler.local_inference.llama_3_1 import LlamaHandler_3_1
-from bfcl_eval.model_handler.local_inference.minicpm import MiniCPMHandler
-from bfcl_eval.model_handler.local_inference.minicpm_fc import MiniCPMFCHandler
-from bfcl_eval.model_handler.local_inference.mistral_fc import MistralFCHandler
-from bfcl_eval.model_handler.local_inference.phi import PhiHandler
-from bfcl_eval.model_handler.local_inference.phi_fc import PhiFCHandler
-from bfcl_eval.model_handler.local_inference.quick_testing_oss import (
-    QuickTestingOSSHandler,
-)
-from bfcl_eval.model_handler.local_inference.qwen import QwenHandler
-from bfcl_eval.model_handler.local_inference.qwen_fc import QwenFCHandler
-from bfcl_eval.model_handler.local_inference.salesforce_llama import (
-    SalesforceLlamaHandler,
-)
-from bfcl_eval.model_handler.local_inference.salesforce_qwen import (
-    SalesforceQwenHandler,
-)
-from bfcl_eval.model_handler.local_inference.think_agent import ThinkAgentHandler
-from bfcl_eval.model_handler.api_inference.kimi import KimiHandler
 
 # -----------------------------------------------------------------------------
 # A mapping of model identifiers to their respective model configurations.
@@ -90,7 +23,7 @@ class ModelConfig:
         url (str): Reference URL for the model or hosting service.
         org (str): Organization providing the model.
         license (str): License under which the model is released.
-        model_handler (str): Handler name for invoking the model.
+        model_handler (str): Dotted import path of the handler class for invoking the model. The handler module is only imported on first use, see `handler_class`.
         input_price (Optional[float]): USD per million input tokens (None for open source models).
         output_price (Optional[float]): USD per million output tokens (None for open source models).
         is_fc_model (bool): True if this model is used in Function-Calling mode, otherwise False for Prompt-based mode.
@@ -116,6 +49,20 @@ class ModelConfig:
     # True if this model does not allow '.' in function names
     underscore_to_dot: bool = False
 
+    @property
+    def handler_class(self) -> type:
+        """
+        The handler class named by `model_handler`, imported on first use.
+        Importing every handler (and their SDKs) up front would make even `bfcl --help` pay for all of them.
+        """
+        return _import_handler_class(self.model_handler)
+
+
+@lru_cache(maxsize=None)
+def _import_handler_class(dotted_path: str) -> type:
+    module_name, _, class_name = dotted_path.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 # Inference through API calls
 api_inference_model_map = {
@@ -125,7 +72,7 @@ api_inference_model_map = {
         url="https://gorilla.cs.berkeley.edu/blogs/7_open_functions_v2.html",
         org="Gorilla LLM",
         license="Apache 2.0",
-        model_handler=GorillaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gorilla.GorillaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -137,7 +84,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -149,7 +96,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -161,7 +108,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250325",
         org="DeepSeek",
         license="DeepSeek License",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -173,7 +120,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-4-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=75,
         output_price=150,
         is_fc_model=False,
@@ -185,7 +132,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-4-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=75,
         output_price=150,
         is_fc_model=True,
@@ -197,7 +144,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -209,7 +156,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -221,7 +168,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=True,
@@ -233,7 +180,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=False,
@@ -245,7 +192,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -257,7 +204,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -269,7 +216,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=False,
@@ -281,7 +228,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -293,7 +240,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=False,
@@ -305,7 +252,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=True,
@@ -317,7 +264,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -329,7 +276,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -341,7 +288,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=False,
@@ -353,7 +300,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=True,
@@ -365,7 +312,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=False,
@@ -377,7 +324,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=True,
@@ -389,7 +336,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -401,7 +348,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -413,7 +360,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=False,
@@ -425,7 +372,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=True,
@@ -437,7 +384,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.8,
         output_price=3.2,
         is_fc_model=False,
@@ -449,7 +396,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.06,
         output_price=0.24,
         is_fc_model=False,
@@ -461,7 +408,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.035,
         output_price=0.14,
         is_fc_model=False,
@@ -473,7 +420,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=False,
@@ -485,7 +432,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=True,
@@ -497,7 +444,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=False,
@@ -509,7 +456,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=True,
@@ -521,7 +468,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=False,
@@ -533,7 +480,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=True,
@@ -545,7 +492,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=False,
@@ -557,7 +504,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=True,
@@ -569,7 +516,7 @@ api_inference_model_map = {
         url="https://huggingface.co/fireworks-ai/firefunction-v2",
         org="Fireworks",
         license="Apache 2.0",
-        model_handler=FireworksHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.fireworks.FireworksHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -581,7 +528,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Nexusflow/NexusRaven-V2-13B",
         org="Nexusflow",
         license="Apache 2.0",
-        model_handler=NexusHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nexus.NexusHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -593,7 +540,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -605,7 +552,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -617,7 +564,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -629,7 +576,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=False,
@@ -641,7 +588,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=True,
@@ -653,7 +600,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=False,
@@ -665,7 +612,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-small-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -677,7 +624,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-medium-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -689,7 +636,7 @@ api_inference_model_map = {
         url="https://www.databricks.com/blog/introducing-dbrx-new-state-art-open-llm",
         org="Databricks",
         license="Databricks Open Model",
-        model_handler=DatabricksHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.databricks.DatabricksHandler",
         input_price=2.25,
         output_price=6.75,
         is_fc_model=False,
@@ -701,7 +648,7 @@ api_inference_model_map = {
         url="https://txt.cohere.com/command-r-plus-microsoft-azure",
         org="Cohere For AI",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -713,7 +660,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-r7b",
         org="Cohere",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=0.0375,
         output_price=0.15,
         is_fc_model=True,
@@ -725,7 +672,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -737,7 +684,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Snowflake/snowflake-arctic-instruct",
         org="Snowflake",
         license="apache-2.0",
-        model_handler=NvidiaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nvidia.NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -749,7 +696,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/Llama-3_1-Nemotron-Ultra-253B-v1",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NemotronHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nemotron.NemotronHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -761,7 +708,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/nemotron-4-340b-instruct",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NvidiaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nvidia.NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -773,7 +720,7 @@ api_inference_model_map = {
         url="https://gogoagent.ai",
         org="BitAgent",
         license="Proprietary",
-        model_handler=GoGoAgentHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gogoagent.GoGoAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -785,7 +732,7 @@ api_inference_model_map = {
         url="https://writer.com/engineering/actions-with-palmyra-x-004/",
         org="Writer",
         license="Proprietary",
-        model_handler=WriterHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.writer.WriterHandler",
         input_price=5,
         output_price=12,
         is_fc_model=False,
@@ -797,7 +744,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -809,7 +756,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -821,7 +768,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -833,7 +780,7 @@ api_inference_model_map = {
         url="https://huggingface.co/phronetic-ai/RZN-T",
         org="Phronetic AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -845,7 +792,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -857,7 +804,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -869,7 +816,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -881,7 +828,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -893,7 +840,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -905,7 +852,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -917,7 +864,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -929,7 +876,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -941,7 +888,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -953,7 +900,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -965,7 +912,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -977,7 +924,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -989,7 +936,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1001,7 +948,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1013,7 +960,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1025,7 +972,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1037,7 +984,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1049,7 +996,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=MiningHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mining.MiningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1061,7 +1008,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1073,7 +1020,7 @@ api_inference_model_map = {
         url="https://huggingface.co/inclusionAI/Ling-lite-1.5",
         org="Ling",
         license="MIT",
-        model_handler=LingAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.ling.LingAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1085,7 +1032,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="zai-org",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1097,7 +1044,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5-Air",
         org="zai-org",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1109,7 +1056,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1121,7 +1068,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1137,7 +1084,7 @@ local_inference_model_map = {
         url="https://huggingface.co/deepseek-ai/DeepSeek-R1",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepseekReasoningHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.deepseek_reasoning.DeepseekReasoningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1149,7 +1096,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1161,7 +1108,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1173,7 +1120,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1185,7 +1132,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1197,7 +1144,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1209,7 +1156,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1221,7 +1168,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1233,7 +1180,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1245,7 +1192,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1257,7 +1204,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1269,7 +1216,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1281,7 +1228,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1293,7 +1240,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1305,7 +1252,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-70b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1317,7 +1264,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-8b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1329,7 +1276,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-32b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1341,7 +1288,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-3b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1353,7 +1300,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-1b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1365,7 +1312,7 @@ local_inference_model_map = {
         url="https://huggingface.co/mistralai/Ministral-8B-Instruct-2410",
         org="Mistral AI",
         license="Mistral AI Research License",
-        model_handler=MistralFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.mistral_fc.MistralFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1377,7 +1324,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/phi-4",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1389,7 +1336,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1401,7 +1348,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi_fc.PhiFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1413,7 +1360,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.2-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1425,7 +1372,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.1-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1437,7 +1384,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-20b-functioncalling",
         org="IBM",
         license="Apache-2.0",
-        model_handler=GraniteFunctionCallingHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite.GraniteFunctionCallingHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1449,7 +1396,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-7b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1461,7 +1408,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-3b",
         org="MadeAgents",
         license="qwen-research",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1473,7 +1420,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-1.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1485,7 +1432,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-0.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1497,7 +1444,7 @@ local_inference_model_map = {
         url="https://huggingface.co/THUDM/glm-4-9b-chat",
         org="THUDM",
         license="glm-4",
-        model_handler=GLMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.glm.GLMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1509,7 +1456,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1521,7 +1468,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1533,7 +1480,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1545,7 +1492,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1557,7 +1504,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1569,7 +1516,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1581,7 +1528,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1593,7 +1540,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1605,7 +1552,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1617,7 +1564,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1629,7 +1576,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1641,7 +1588,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1653,7 +1600,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1665,7 +1612,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1677,7 +1624,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1689,7 +1636,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1701,7 +1648,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Team-ACE/ToolACE-2-8B",
         org="Huawei Noah & USTC",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1713,7 +1660,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm.MiniCPMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1725,7 +1672,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm_fc.MiniCPMFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1737,7 +1684,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-8B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1749,7 +1696,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-70B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1761,7 +1708,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ZJared/Haha-7B",
         org="TeleAI",
         license="Apache 2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1773,7 +1720,7 @@ local_inference_model_map = {
         url="https://huggingface.co/speakleash/Bielik-11B-v2.3-Instruct",
         org="SpeakLeash & ACK Cyfronet AGH",
         license="Apache 2.0",
-        model_handler=BielikHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bielik.BielikHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1785,7 +1732,7 @@ local_inference_model_map = {
         url="https://huggingface.co/NovaSky-AI/Sky-T1-32B-Preview",
         org="NovaSky-AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1797,7 +1744,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-10B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1809,7 +1756,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-7B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1821,7 +1768,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-3B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1833,7 +1780,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-1B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1845,7 +1792,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-8B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1857,7 +1804,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-70B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1869,7 +1816,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-405B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1881,7 +1828,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-8B/",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1893,7 +1840,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-Bounty-8B",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=BitAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bitagent.BitAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1905,7 +1852,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ThinkAgents/ThinkAgent-1B",
         org="ThinkAgents",
         license="apache-2.0",
-        model_handler=ThinkAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.think_agent.ThinkAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1922,7 +1869,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=False,
@@ -1934,7 +1881,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=True,
@@ -1946,7 +1893,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=False,
@@ -1958,7 +1905,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=True,
@@ -1970,7 +1917,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=True,
@@ -1982,7 +1929,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=False,
@@ -1994,7 +1941,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2006,7 +1953,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentNoThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentNoThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2018,7 +1965,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-1.5B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2030,7 +1977,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-3B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2042,7 +1989,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-7B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2054,7 +2001,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-32B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -6,6 +6,8 @@ from bfcl_eval.constants.type_mappings import (
 from bfcl_eval.eval_checker.ast_eval.type_convertor.java_type_converter import java_type_converter
 from bfcl_eval.eval_checker.ast_eval.type_convertor.js_type_converter import js_type_converter
 import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
 #### Constants ####
 PYTHON_TYPE_MAPPING = {
@@ -25,19 +27,130 @@ PYTHON_NESTED_TYPE_CHECK_LIST = ["array", "tuple"]
 
 NESTED_CONVERSION_TYPE_LIST = ["Array", "ArrayList", "array"]
 
+# Characters ignored when comparing strings, see `standardize_string`
+STANDARDIZE_STRING_PATTERN = re.compile(r"[ \,\.\/\-\_\*\^]")
+
+
+#### Compiled possible answers ####
+class CompiledParamType(NamedTuple):
+    # The type in the function doc, eg, "array"
+    expected_type_description: str
+    # The Python type that value should have (after conversion, for Java and JavaScript)
+    expected_type_converted: type
+    # The item type in the function doc, only set for the types whose items are checked too
+    nested_type: Optional[str]
+    nested_type_converted: Optional[type]
+    # The type of the first non-optional possible answer, see `get_possible_answer_type`
+    possible_answer_type: Optional[type]
+    # The possible answers are variable names rather than values of the expected type
+    is_variable: bool
+
+
+class CompiledFunctionAnswer:
+    """
+    The possible answer for one function call and the function doc it is checked against, together with the expected
+    parameter types and normalized forms the checkers compare model outputs against.
+    These are derived on first use and then reused for every model output checked against this answer.
+    """
+
+    def __init__(self, possible_answer: dict, func_description: dict) -> None:
+        # possible_answer is a dictionary with only one key, the function name
+        self.possible_answer = possible_answer
+        self.param_possible_answers: dict = list(possible_answer.values())[0]
+        self.func_description = func_description
+        self._param_types: dict[tuple[str, str], CompiledParamType] = {}
+        self._standardized_strings: dict[str, set] = {}
+        self._standardized_lists: dict[str, list] = {}
+
+    def param_type(self, param: str, language: str) -> CompiledParamType:
+        if (param, language) not in self._param_types:
+            self._param_types[(param, language)] = compile_param_type(
+                self.func_description["parameters"]["properties"][param],
+                self.param_possible_answers[param],
+                language,
+            )
+        return self._param_types[(param, language)]
+
+    def standardized_strings(self, param: str) -> set:
+        if param not in self._standardized_strings:
+            self._standardized_strings[param] = {
+                standardize_string(answer)
+                for answer in self.param_possible_answers[param]
+                if type(answer) == str
+            }
+        return self._standardized_strings[param]
+
+    def standardized_lists(self, param: str) -> list:
+        if param not in self._standardized_lists:
+            self._standardized_lists[param] = standardize_list_possible_answer(
+                self.param_possible_answers[param]
+            )
+        return self._standardized_lists[param]
+
+
+class CompiledASTEntry:
+    """
+    The function docs and possible answers of one test entry, indexed for checking.
+    Build it once per entry and pass it to `ast_checker` for every model evaluated on the entry.
+    """
+
+    def __init__(self, func_descriptions, possible_answers: list) -> None:
+        self.func_descriptions = func_descriptions
+        if type(func_descriptions) == list:
+            self._descriptions_by_name = {}
+            for func_description in func_descriptions:
+                # Same as `find_description`, the first function with the name wins
+                self._descriptions_by_name.setdefault(func_description["name"], func_description)
+        self.function_answers = [
+            CompiledFunctionAnswer(possible_answer, self._answer_description(possible_answer))
+            for possible_answer in possible_answers
+        ]
+
+    def find_description(self, name: str):
+        if type(self.func_descriptions) == list:
+            return self._descriptions_by_name.get(name)
+        # it is a dict, there is only one function
+        return self.func_descriptions
+
+    def _answer_description(self, possible_answer: dict):
+        func_description = self.find_description(list(possible_answer.keys())[0])
+        # The simple categories check the only function of the entry, even when the possible answer names another one
+        if func_description is None and len(self.func_descriptions) == 1:
+            return self.func_descriptions[0]
+        return func_description
+
 
 #### Main function ####
 def ast_checker(
-    func_description, model_output, possible_answer, language, test_category, model_name
+    func_description,
+    model_output,
+    possible_answer,
+    language,
+    test_category,
+    model_name,
+    compiled_entry: Optional[CompiledASTEntry] = None,
 ):
+    if compiled_entry is None:
+        compiled_entry = CompiledASTEntry(func_description, possible_answer)
+
     if "parallel" in test_category:
         return parallel_function_checker_no_order(
-            func_description, model_output, possible_answer, language, model_name
+            func_description,
+            model_output,
+            possible_answer,
+            language,
+            model_name,
+            compiled_entry,
         )
         
     elif "multiple" in test_category:
         return multiple_function_checker(
-            func_description, model_output, possible_answer, language, model_name
+            func_description,
+            model_output,
+            possible_answer,
+            language,
+            model_name,
+            compiled_entry,
         )
         
     else:
@@ -49,7 +162,12 @@ def ast_checker(
             }
 
         return simple_function_checker(
-            func_description[0], model_output[0], possible_answer[0], language, model_name
+            func_description[0],
+            model_output[0],
+            possible_answer[0],
+            language,
+            model_name,
+            compiled_entry.function_answers[0],
         )
 
 
@@ -72,6 +190,7 @@ def get_possible_answer_type(possible_answer: list):
     return None
 
 
+@lru_cache(maxsize=None)
 def convert_func_name(function_name, model_name: str):
     model_name_escaped = model_name.replace("_", "/")
     if "." in function_name:
@@ -82,6 +201,51 @@ def convert_func_name(function_name, model_name: str):
     return function_name
 
 
+def compile_param_type(
+    full_param_details: dict, possible_answer: list, language: str
+) -> CompiledParamType:
+    expected_type_description = full_param_details["type"]  # This is a string
+    nested_type = None
+    nested_type_converted = None
+
+    if language == "Java":
+        expected_type_converted = JAVA_TYPE_CONVERSION[expected_type_description]
+        if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
+            nested_type = full_param_details["items"]["type"]
+            nested_type_converted = JAVA_TYPE_CONVERSION[nested_type]
+
+    elif language == "JavaScript":
+        expected_type_converted = JS_TYPE_CONVERSION[expected_type_description]
+        if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
+            nested_type = full_param_details["items"]["type"]
+            nested_type_converted = JS_TYPE_CONVERSION[nested_type]
+
+    elif language == "Python":
+        expected_type_converted = PYTHON_TYPE_MAPPING[expected_type_description]
+        if expected_type_description in PYTHON_NESTED_TYPE_CHECK_LIST:
+            nested_type = full_param_details["items"]["type"]
+            nested_type_converted = PYTHON_TYPE_MAPPING[nested_type]
+
+    # check for the case where a variable is used instead of a actual value.
+    # use the type in possible_answer as the expected type
+    possible_answer_type = get_possible_answer_type(possible_answer)
+    # if possible_answer only contains optional parameters, we can't determine the type
+    # we are being precise here.
+    # in fact, possible_answer_type should always be string, as that's how we treat varibale in possible_answer
+    is_variable = (
+        possible_answer_type != None and possible_answer_type != expected_type_converted
+    )
+
+    return CompiledParamType(
+        expected_type_description,
+        expected_type_converted,
+        nested_type,
+        nested_type_converted,
+        possible_answer_type,
+        is_variable,
+    )
+
+
 def type_checker(
     param: str,
     value,
@@ -89,6 +253,29 @@ def type_checker(
     expected_type_description: str,
     expected_type_converted,
     nested_type_converted,
+):
+    possible_answer_type = get_possible_answer_type(possible_answer)
+    return compiled_type_checker(
+        param,
+        value,
+        possible_answer,
+        CompiledParamType(
+            expected_type_description,
+            expected_type_converted,
+            None,
+            nested_type_converted,
+            possible_answer_type,
+            possible_answer_type != None
+            and possible_answer_type != expected_type_converted,
+        ),
+    )
+
+
+def compiled_type_checker(
+    param: str,
+    value,
+    possible_answer: list,
+    param_type: CompiledParamType,
 ):
     # NOTE: This type checker only supports nested type checking for one level deep.
     # We didn't implement recursive type checking for nested types, as it's not needed for the current use case and it's very complex.
@@ -100,19 +287,11 @@ def type_checker(
         "error_type": "type_error:simple",
     }
 
-    is_variable = False
-    # check for the case where a variable is used instead of a actual value.
-    # use the type in possible_answer as the expected type
-    possible_answer_type = get_possible_answer_type(possible_answer)
-    # if possible_answer only contains optional parameters, we can't determine the type
-    if possible_answer_type != None:
-        # we are being precise here.
-        # in fact, possible_answer_type should always be string, as that's how we treat varibale in possible_answer
-        if possible_answer_type != expected_type_converted:
-            is_variable = True
+    is_variable = param_type.is_variable
+    nested_type_converted = param_type.nested_type_converted
 
     # value is the same type as in function description
-    if type(value) == expected_type_converted:
+    if type(value) == param_type.expected_type_converted:
         # We don't need to do recursive check for simple types
         if nested_type_converted == None:
             result["is_variable"] = is_variable
@@ -140,44 +319,48 @@ def type_checker(
 
             result["valid"] = False
             result["error"] = [
-                f"Nested type checking failed for parameter {repr(param)}. Expected outer type {expected_type_description} with inner type {str(nested_type_converted)}. Parameter value: {repr(value)}."
+                f"Nested type checking failed for parameter {repr(param)}. Expected outer type {param_type.expected_type_description} with inner type {str(nested_type_converted)}. Parameter value: {repr(value)}."
             ]
             result["error_type"] = "type_error:nested"
 
     # value is not as expected, check for the case where a variable is used instead of a actual value
     # use the type in possible_answer as the expected type
-    possible_answer_type = get_possible_answer_type(possible_answer)
     # if possible_answer only contains optional parameters, we can't determine the type
-    if possible_answer_type != None:
+    if param_type.possible_answer_type != None:
         # we are being precise here.
         # in fact, possible_answer_type should always be string, as that's how we treat varibale in possible_answer
-        if type(value) == possible_answer_type:
+        if type(value) == param_type.possible_answer_type:
             result["is_variable"] = True
             return result
 
     result["valid"] = False
     result["error"].append(
-        f"Incorrect type for parameter {repr(param)}. Expected type {expected_type_description}, got {type(value).__name__}. Parameter value: {repr(value)}."
+        f"Incorrect type for parameter {repr(param)}. Expected type {param_type.expected_type_description}, got {type(value).__name__}. Parameter value: {repr(value)}."
     )
     result["error_type"] = "type_error:simple"
     return result
 
 
+@lru_cache(maxsize=65536)
 def standardize_string(input_string: str):
     # This function standardizes the string by removing all the spaces, ",./-_*^" punctuation, and converting it to lowercase
     # It will also convert all the single quotes to double quotes
     # This is used to compare the model output with the possible answers
     # We don't want to punish model for answer like April 1, 2024 vs April 1,2024, vs April 1 2024
-    regex_string = r"[ \,\.\/\-\_\*\^]"
-    return re.sub(regex_string, "", input_string).lower().replace("'", '"')
+    return STANDARDIZE_STRING_PATTERN.sub("", input_string).lower().replace("'", '"')
 
 
-def string_checker(param: str, model_output: str, possible_answer: list):
-    standardize_possible_answer = []
+def string_checker(
+    param: str,
+    model_output: str,
+    possible_answer: list,
+    standardize_possible_answer: Optional[set] = None,
+):
+    if standardize_possible_answer is None:
+        standardize_possible_answer = {
+            standardize_string(answer) for answer in possible_answer if type(answer) == str
+        }
     standardize_model_output = standardize_string(model_output)
-    for i in range(len(possible_answer)):
-        if type(possible_answer[i]) == str:
-            standardize_possible_answer.append(standardize_string(possible_answer[i]))
 
     if standardize_model_output not in standardize_possible_answer:
         return {
@@ -191,18 +374,8 @@ def string_checker(param: str, model_output: str, possible_answer: list):
     return {"valid": True, "error": []}
 
 
-def list_checker(param: str, model_output: list, possible_answer: list):
-    # Convert the tuple to a list
-
-    standardize_model_output = list(model_output)
-
-    # If the element in the list is a string, we need to standardize it
-    for i in range(len(standardize_model_output)):
-        if type(standardize_model_output[i]) == str:
-            standardize_model_output[i] = standardize_string(model_output[i])
-
+def standardize_list_possible_answer(possible_answer: list) -> list:
     standardize_possible_answer = []
-    # We also need to standardize the possible answers
     for i in range(len(possible_answer)):
         standardize_possible_answer.append([])
         for j in range(len(possible_answer[i])):
@@ -212,6 +385,27 @@ def list_checker(param: str, model_output: list, possible_answer: list):
                 )
             else:
                 standardize_possible_answer[i].append(possible_answer[i][j])
+    return standardize_possible_answer
+
+
+def list_checker(
+    param: str,
+    model_output: list,
+    possible_answer: list,
+    standardize_possible_answer: Optional[list] = None,
+):
+    # Convert the tuple to a list
+
+    standardize_model_output = list(model_output)
+
+    # If the element in the list is a string, we need to standardize it
+    for i in range(len(standardize_model_output)):
+        if type(standardize_model_output[i]) == str:
+            standardize_model_output[i] = standardize_string(model_output[i])
+
+    # We also need to standardize the possible answers
+    if standardize_possible_answer is None:
+        standardize_possible_answer = standardize_list_possible_answer(possible_answer)
 
     if standardize_model_output not in standardize_possible_answer:
         return {
@@ -326,8 +520,11 @@ def simple_function_checker(
     possible_answer: dict,
     language: str,
     model_name: str,
+    compiled_answer: Optional[CompiledFunctionAnswer] = None,
 ):
-    possible_answer = list(possible_answer.values())[0]
+    if compiled_answer is None:
+        compiled_answer = CompiledFunctionAnswer(possible_answer, func_description)
+    possible_answer = compiled_answer.param_possible_answers
     # Extract function name and parameters details
     func_name = func_description["name"]
     param_details = func_description["parameters"]["properties"]
@@ -369,58 +566,36 @@ def simple_function_checker(
             result["error_type"] = "simple_function_checker:unexpected_param"
             return result
 
-        full_param_details = param_details[param]
-        expected_type_description = full_param_details["type"]  # This is a string
-        is_variable = False
-        nested_type_converted = None
+        param_type = compiled_answer.param_type(param, language)
+        expected_type_description = param_type.expected_type_description  # This is a string
+        expected_type_converted = param_type.expected_type_converted
+        nested_type_converted = param_type.nested_type_converted
 
         if language == "Java":
-            expected_type_converted = JAVA_TYPE_CONVERSION[expected_type_description]
-
-            if expected_type_description in JAVA_TYPE_CONVERSION:
-                if type(value) != str:
-                    result["valid"] = False
-                    result["error"].append(
-                        f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
-                    )
-                    result["error_type"] = "type_error:java"
-                    return result
+            if type(value) != str:
+                result["valid"] = False
+                result["error"].append(
+                    f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
+                )
+                result["error_type"] = "type_error:java"
+                return result
 
-                if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
-                    nested_type = param_details[param]["items"]["type"]
-                    nested_type_converted = JAVA_TYPE_CONVERSION[nested_type]
-                    value = java_type_converter(
-                        value, expected_type_description, nested_type
-                    )
-                else:
-                    value = java_type_converter(value, expected_type_description)
+            value = java_type_converter(
+                value, expected_type_description, param_type.nested_type
+            )
 
         elif language == "JavaScript":
-            expected_type_converted = JS_TYPE_CONVERSION[expected_type_description]
-
-            if expected_type_description in JS_TYPE_CONVERSION:
-                if type(value) != str:
-                    result["valid"] = False
-                    result["error"].append(
-                        f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
-                    )
-                    result["error_type"] = "type_error:js"
-                    return result
-
-                if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
-                    nested_type = param_details[param]["items"]["type"]
-                    nested_type_converted = JS_TYPE_CONVERSION[nested_type]
-                    value = js_type_converter(
-                        value, expected_type_description, nested_type
-                    )
-                else:
-                    value = js_type_converter(value, expected_type_description)
+            if type(value) != str:
+                result["valid"] = False
+                result["error"].append(
+                    f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
+                )
+                result["error_type"] = "type_error:js"
+                return result
 
-        elif language == "Python":
-            expected_type_converted = PYTHON_TYPE_MAPPING[expected_type_description]
-            if expected_type_description in PYTHON_NESTED_TYPE_CHECK_LIST:
-                nested_type = param_details[param]["items"]["type"]
-                nested_type_converted = PYTHON_TYPE_MAPPING[nested_type]
+            value = js_type_converter(
+                value, expected_type_description, param_type.nested_type
+            )
 
         # We convert all tuple value to list when the expected type is tuple.
         # The conversion is necessary because any tuple in the possible answer would become a list after being processed through json.dump() and json.load().
@@ -439,13 +614,8 @@ def simple_function_checker(
         # Type checking
         # In fact, we only check for Python here.
         # Type check for other languages are handled by the type converter, and so their value (after conversion) is always correct.
-        type_check_result = type_checker(
-            param,
-            value,
-            possible_answer[param],
-            expected_type_description,
-            expected_type_converted,
-            nested_type_converted,
+        type_check_result = compiled_type_checker(
+            param, value, possible_answer[param], param_type
         )
         is_variable = type_check_result["is_variable"]
         if not type_check_result["valid"]:
@@ -471,13 +641,23 @@ def simple_function_checker(
             # Special handle for strings
             elif expected_type_converted == str:
                 # We don't check for case sensitivity for string, as long as it's not a variable
-                result = string_checker(param, value, possible_answer[param])
+                result = string_checker(
+                    param,
+                    value,
+                    possible_answer[param],
+                    compiled_answer.standardized_strings(param),
+                )
                 if not result["valid"]:
                     return result
                 continue
 
             elif expected_type_converted == list:
-                result = list_checker(param, value, possible_answer[param])
+                result = list_checker(
+                    param,
+                    value,
+                    possible_answer[param],
+                    compiled_answer.standardized_lists(param),
+                )
                 if not result["valid"]:
                     return result
                 continue
@@ -546,6 +726,7 @@ def parallel_function_checker_no_order(
     possible_answers: list,
     language: str,
     model_name: str,
+    compiled_entry: Optional[CompiledASTEntry] = None,
 ):
     if len(model_output) != len(possible_answers):
         return {
@@ -554,58 +735,94 @@ def parallel_function_checker_no_order(
             "error_type": "parallel_function_checker_no_order:wrong_count",
         }
 
-    matched_indices = []
+    if compiled_entry is None:
+        compiled_entry = CompiledASTEntry(func_descriptions, possible_answers)
 
-    # We go throught the possible answers one by one, and eliminate the model output that matches the possible answer
-    # It must be this way because we need ground truth to fetch the correct function description
+    # We go throught the possible answers one by one, and match each of them to a distinct model output.
+    # It must be this way because we need ground truth to fetch the correct function description.
+    # A greedy first-fit can get stuck when one model output is compatible with several possible answers, so we find a maximum bipartite matching with augmenting paths instead.
+    func_descriptions_expected = []
+    candidate_indices = []
     for i in range(len(possible_answers)):
         # possible_answers[i] is a dictionary with only one key
         func_name_expected = list(possible_answers[i].keys())[0]
-        func_description = find_description(func_descriptions, func_name_expected)
-
-
-        all_errors = []
+        func_description = compiled_entry.find_description(func_name_expected)
+        func_descriptions_expected.append(func_description)
+
+        # Only the model outputs calling the expected function can match, so the other pairs never go through the full check.
+        # The output at the same position is tried first, since models mostly keep the order of the calls.
+        func_name = convert_func_name(func_description["name"], model_name)
+        candidate_indices.append(
+            sorted(
+                (
+                    index
+                    for index in range(len(model_output))
+                    if func_name in model_output[index]
+                ),
+                key=lambda index: index != i,
+            )
+        )
 
-        for index in range(len(model_output)):
-            if index in matched_indices:
-                continue
+    # Each (possible answer, model output) pair is checked at most once
+    pair_results = {}
 
-            result = simple_function_checker(
-                func_description,
-                model_output[index],
-                possible_answers[i],
+    def check_pair(answer_index: int, output_index: int) -> dict:
+        if (answer_index, output_index) not in pair_results:
+            pair_results[(answer_index, output_index)] = simple_function_checker(
+                func_descriptions_expected[answer_index],
+                model_output[output_index],
+                possible_answers[answer_index],
                 language,
                 model_name,
+                compiled_entry.function_answers[answer_index],
             )
+        return pair_results[(answer_index, output_index)]
 
-            if result["valid"]:
-                matched_indices.append(index)
-                break
-            else:
-                all_errors.append(
-                    {
-                        f"Model Result Index {index}": {
-                            "sub_error": result["error"],
-                            "sub_error_type": result["error_type"],
-                            "model_output_item": model_output[index],
-                            "possible_answer_item": possible_answers[i],
-                        }
-                    }
-                )
+    # Model output index -> index of the possible answer it is matched to
+    matched_answer_indices = {}
 
-        if not result["valid"]:
-            considered_indices = [
-                i for i in range(len(model_output)) if i not in matched_indices
-            ]
-            all_errors.insert(
-                0,
-                f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers.",
+    def try_match(answer_index: int, visited_indices: set) -> bool:
+        for index in candidate_indices[answer_index]:
+            if index in visited_indices:
+                continue
+            visited_indices.add(index)
+            if not check_pair(answer_index, index)["valid"]:
+                continue
+            # Either the model output is still free, or the possible answer holding it can move to another one
+            if index not in matched_answer_indices or try_match(
+                matched_answer_indices[index], visited_indices
+            ):
+                matched_answer_indices[index] = answer_index
+                return True
+        return False
+
+    for i in range(len(possible_answers)):
+        if try_match(i, set()):
+            continue
+
+        considered_indices = [
+            index for index in range(len(model_output)) if index not in matched_answer_indices
+        ]
+        all_errors = [
+            f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers."
+        ]
+        for index in considered_indices:
+            result = check_pair(i, index)
+            all_errors.append(
+                {
+                    f"Model Result Index {index}": {
+                        "sub_error": result["error"],
+                        "sub_error_type": result["error_type"],
+                        "model_output_item": model_output[index],
+                        "possible_answer_item": possible_answers[i],
+                    }
+                }
             )
-            return {
-                "valid": False,
-                "error": all_errors,
-                "error_type": "parallel_function_checker_no_order:cannot_find_match",
-            }
+        return {
+            "valid": False,
+            "error": all_errors,
+            "error_type": "parallel_function_checker_no_order:cannot_find_match",
+        }
 
     return {"valid": True, "error": []}
 
@@ -616,6 +833,7 @@ def multiple_function_checker(
     possible_answers: list,
     language: str,
     model_name: str,
+    compiled_entry: Optional[CompiledASTEntry] = None,
 ):
     if len(model_output) != len(possible_answers):
         return {
@@ -624,13 +842,17 @@ def multiple_function_checker(
             "error_type": "multiple_function_checker:wrong_count",
         }
 
+    if compiled_entry is None:
+        compiled_entry = CompiledASTEntry(func_descriptions, possible_answers)
+
     # possible_answers is a list of only one dictionary with only one key
     func_name_expected = list(possible_answers[0].keys())[0]
-    func_description = find_description(func_descriptions, func_name_expected)
+    func_description = compiled_entry.find_description(func_name_expected)
     return simple_function_checker(
         func_description,
         model_output[0],
         possible_answers[0],
         language,
         model_name,
+        compiled_entry.function_answers[0],
     )
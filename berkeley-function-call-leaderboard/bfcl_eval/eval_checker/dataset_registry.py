@@ -0,0 +1,58 @@
+import threading
+from functools import lru_cache
+
+from bfcl_eval.eval_checker.ast_eval.ast_checker import CompiledASTEntry
+from bfcl_eval.utils import TEST_CATEGORY_CATALOGUE, load_file
+
+
+class Dataset:
+    """
+    The entries of one dataset file, sorted by ID and indexed by ID.
+    Datasets are shared by every evaluation in the process, so the entries must be treated as read-only.
+    """
+
+    def __init__(self, entries: list[dict]) -> None:
+        self.entries = entries
+        self.entries_by_id = {entry["id"]: entry for entry in entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# `lru_cache` doesn't prevent two threads from loading the same file at the same time; this does.
+# Reentrant, because compiling the AST matchers loads the datasets.
+_registry_lock = threading.RLock()
+
+
+@lru_cache(maxsize=None)
+def _load_dataset(file_path) -> Dataset:
+    return Dataset(load_file(file_path, sort_by_id=True))
+
+
+def get_prompt_dataset(test_category: str) -> Dataset:
+    with _registry_lock:
+        return _load_dataset(TEST_CATEGORY_CATALOGUE[test_category].prompt_path)
+
+
+def get_possible_answer_dataset(test_category: str) -> Dataset:
+    with _registry_lock:
+        return _load_dataset(TEST_CATEGORY_CATALOGUE[test_category].possible_answer_path)
+
+
+@lru_cache(maxsize=None)
+def _compile_ast_entries(test_category: str) -> list[CompiledASTEntry]:
+    prompt = get_prompt_dataset(test_category).entries
+    possible_answer = get_possible_answer_dataset(test_category).entries
+    return [
+        CompiledASTEntry(prompt_entry["function"], possible_answer_entry["ground_truth"])
+        for prompt_entry, possible_answer_entry in zip(prompt, possible_answer)
+    ]
+
+
+def get_compiled_ast_entries(test_category: str) -> list[CompiledASTEntry]:
+    """
+    The compiled AST matchers of a single-turn category, in the same order as its dataset entries.
+    They are built once per process and reused for every model evaluated on the category.
+    """
+    with _registry_lock:
+        return _compile_ast_entries(test_category)
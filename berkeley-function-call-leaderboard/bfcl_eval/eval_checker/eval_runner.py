@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from bfcl_eval.constants.category_mapping import (
     TEST_COLLECTION_MAPPING,
@@ -7,13 +8,16 @@ from bfcl_eval.constants.category_mapping import (
 )
 from bfcl_eval.constants.eval_config import (
     DOTENV_PATH,
-    POSSIBLE_ANSWER_PATH,
     PROJECT_ROOT,
-    PROMPT_PATH,
     RESULT_PATH,
     SCORE_PATH,
 )
-from bfcl_eval.eval_checker.ast_eval.ast_checker import ast_checker
+from bfcl_eval.eval_checker.ast_eval.ast_checker import CompiledASTEntry, ast_checker
+from bfcl_eval.eval_checker.dataset_registry import (
+    get_compiled_ast_entries,
+    get_possible_answer_dataset,
+    get_prompt_dataset,
+)
 from bfcl_eval.eval_checker.eval_runner_helper import *
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_checker import (
     multi_turn_checker,
@@ -21,6 +25,7 @@ from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_checker import (
 )
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import is_empty_execute_response
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
+from bfcl_eval.model_handler.result_store import ResultStore, get_result_store_path
 from bfcl_eval.utils import *
 from dotenv import load_dotenv
 from tqdm import tqdm
@@ -28,7 +33,7 @@ from tqdm import tqdm
 
 def get_handler(model_name):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(
+    handler = config.handler_class(
         model_name, temperature=0
     )  # Temperature doesn't matter for evaluation
     handler.is_fc_model = config.is_fc_model
@@ -49,11 +54,9 @@ def multi_turn_runner(
         # Model result is stored as a list of list of model responses. Each inner list represents a turn.
         multi_turn_model_result_list: list[list] = model_result[i]["result"]
         multi_turn_ground_truth_list: list[list[str]] = possible_answer[i]["ground_truth"]
-        test_entry: dict = prompt[i]
-
         # Remove the function doc from the score file for better readability; they are repeated and way too long
-        if "function" in test_entry:
-            del test_entry["function"]
+        # The prompt entries are shared with other evaluations, so leave them untouched
+        test_entry: dict = {key: value for key, value in prompt[i].items() if key != "function"}
 
         if type(multi_turn_model_result_list) != list:
             result.append(
@@ -161,9 +164,7 @@ def multi_turn_runner(
             "total_count": len(model_result),
         },
     )
-    output_file_name = f"{VERSION_PREFIX}_{test_category}_score.json"
-    output_file_dir = score_dir / model_name
-    write_list_of_dicts_to_file(output_file_name, result, output_file_dir)
+    write_score_file(result, score_dir, model_name, test_category)
 
     return accuracy, len(model_result)
 
@@ -236,9 +237,7 @@ def relevance_file_runner(
             "total_count": len(model_result),
         },
     )
-    output_file_name = f"{VERSION_PREFIX}_{test_category}_score.json"
-    output_file_dir = score_dir / model_name
-    write_list_of_dicts_to_file(output_file_name, result, output_file_dir)
+    write_score_file(result, score_dir, model_name, test_category)
 
     return accuracy, len(model_result)
 
@@ -252,6 +251,7 @@ def ast_file_runner(
     test_category,
     model_name,
     score_dir,
+    compiled_entries=None,
 ):
     assert (
         len(model_result) == len(prompt) == len(possible_answer)
@@ -311,6 +311,11 @@ def ast_file_runner(
             language,
             test_category,
             model_name,
+            (
+                compiled_entries[i]
+                if compiled_entries is not None
+                else CompiledASTEntry(prompt_item, possible_answer_item)
+            ),
         )
 
         if checker_result["valid"]:
@@ -338,15 +343,13 @@ def ast_file_runner(
             "total_count": len(model_result),
         },
     )
-    output_file_name = f"{VERSION_PREFIX}_{test_category}_score.json"
-    output_file_dir = score_dir / model_name
-    write_list_of_dicts_to_file(output_file_name, result, output_file_dir)
+    write_score_file(result, score_dir, model_name, test_category)
 
     return accuracy, len(model_result)
 
 
 #### Main runner function ####
-def runner(model_names, test_categories, result_dir, score_dir):
+def runner(model_names, test_categories, result_dir, score_dir, num_processes=1):
 
     # State udpated by each eval subtask.
     state = dict(
@@ -362,40 +365,59 @@ def runner(model_names, test_categories, result_dir, score_dir):
     # Filter out the subdirectories
     subdirs = [entry for entry in entries if entry.is_dir()]
 
-    # Traverse each subdirectory
-    for subdir in tqdm(subdirs, desc="Number of models evaluated"):
+    # Each (model, test category) pair is evaluated independently; sort them so that the results are always merged in the same order
+    work_units = []
+    for subdir in sorted(subdirs):
 
         model_name = subdir.relative_to(result_dir).name
         if model_names is not None and model_name not in model_names:
             continue
 
-        model_name_escaped = model_name.replace("_", "/")
-
-        print(f"🦍 Model: {model_name}")
-
+        model_results = []
+        stored_test_categories = []
+        if ResultStore.exists(subdir):
+            stored_test_categories = ResultStore(subdir).get_test_categories()
+            model_results.extend(
+                (get_result_store_path(subdir), test_category)
+                for test_category in stored_test_categories
+            )
         # Find and process all JSON files in the subdirectory
-        for model_result_json in subdir.glob("*.json"):
+        for model_result_json in sorted(subdir.glob("*.json")):
             test_category = extract_test_category(model_result_json)
+            # The result store takes precedence; the result files may just be an export of it
+            if test_category not in stored_test_categories:
+                model_results.append((model_result_json, test_category))
+
+        for model_result_path, test_category in model_results:
             if test_category not in test_categories:
                 continue
 
-            handler = get_handler(model_name_escaped)
-
             # We don't evaluate the following categories in the current iteration of the benchmark
-            if is_chatable(test_category) or is_sql(test_category) or is_executable(test_category):
+            if not TEST_CATEGORY_CATALOGUE[test_category].is_evaluated:
                 continue
 
-            model_result = load_file(model_result_json, sort_by_id=True)
+            work_units.append((model_name, model_result_path, test_category))
 
-            state = evaluate_task(
-                test_category,
-                result_dir,
-                score_dir,
-                model_result,
-                model_name,
-                handler,
-                state,
+    if num_processes <= 1:
+        for work_unit in tqdm(work_units, desc="Number of test categories evaluated"):
+            merge_leaderboard_tables(
+                state["leaderboard_table"],
+                evaluate_work_unit(*work_unit, result_dir, score_dir),
             )
+    else:
+        with ProcessPoolExecutor(max_workers=num_processes) as executor:
+            futures = [
+                executor.submit(evaluate_work_unit, *work_unit, result_dir, score_dir)
+                for work_unit in work_units
+            ]
+            for _ in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Number of test categories evaluated",
+            ):
+                pass
+            for future in futures:
+                merge_leaderboard_tables(state["leaderboard_table"], future.result())
 
     # This function reads all the score files from local folder and updates the
     # leaderboard table. This is helpful when you only want to run the
@@ -407,6 +429,42 @@ def runner(model_names, test_categories, result_dir, score_dir):
     )
 
 
+def evaluate_work_unit(model_name, model_result_path, test_category, result_dir, score_dir):
+    """
+    Evaluate one model on one test category, and return the leaderboard table entries it produced.
+    This runs in a worker process when `num_processes` > 1, so it must not rely on any state from the parent process.
+
+    If neither the model results, the dataset nor the evaluation code changed since the score file was written, the evaluation
+    is skipped and the leaderboard table entries recorded back then are returned instead.
+    """
+    model_name_escaped = model_name.replace("_", "/")
+
+    print(f"🦍 Model: {model_name}")
+
+    score_file_path = get_score_file_path(score_dir, model_name, test_category)
+    fingerprint = get_evaluation_fingerprint(model_result_path, test_category)
+    recorded_leaderboard_table = load_evaluation_record(score_file_path, fingerprint)
+    if recorded_leaderboard_table is not None:
+        print(f"⏩ Skipping test: {test_category}. Nothing changed since it was last evaluated.")
+        return recorded_leaderboard_table
+
+    handler = get_handler(model_name_escaped)
+    model_result = load_model_result(model_result_path, test_category)
+
+    state = evaluate_task(
+        test_category,
+        result_dir,
+        score_dir,
+        model_result,
+        model_name,
+        handler,
+        dict(leaderboard_table={}),
+    )
+    write_evaluation_record(score_file_path, fingerprint, state["leaderboard_table"])
+
+    return state["leaderboard_table"]
+
+
 def evaluate_task(
     test_category,
     result_dir,
@@ -416,32 +474,30 @@ def evaluate_task(
     handler,
     state,
 ):
+    category_info = TEST_CATEGORY_CATALOGUE[test_category]
 
     language = "Python"
-    if is_java(test_category):
+    if category_info.is_java:
         language = "Java"
-    if is_js(test_category):
+    if category_info.is_js:
         language = "JavaScript"
 
     print(f"🔍 Running test: {test_category}")
 
     record_cost_latency(state["leaderboard_table"], model_name, model_result)
 
-    # Find the corresponding test file.
-    prompt_file = find_file_with_suffix(PROMPT_PATH, test_category)
-    prompt = load_file(prompt_file, sort_by_id=True)
+    # The datasets are loaded once per process and shared by every model evaluated on the category
+    prompt = get_prompt_dataset(test_category).entries
 
-    if is_relevance_or_irrelevance(test_category):
+    if category_info.is_relevance_or_irrelevance:
         accuracy, total_count = relevance_file_runner(
             handler, model_result, prompt, model_name, test_category, score_dir
         )
 
     else:
-        # Find the corresponding possible answer file
-        possible_answer_file = find_file_with_suffix(POSSIBLE_ANSWER_PATH, test_category)
-        possible_answer = load_file(possible_answer_file, sort_by_id=True)
+        possible_answer = get_possible_answer_dataset(test_category).entries
 
-        if is_multi_turn(test_category):
+        if category_info.is_multi_turn:
             accuracy, total_count = multi_turn_runner(
                 handler,
                 model_result,
@@ -463,6 +519,7 @@ def evaluate_task(
                 test_category,
                 model_name,
                 score_dir,
+                get_compiled_ast_entries(test_category),
             )
 
     record_result(state["leaderboard_table"], model_name, test_category, accuracy, total_count)
@@ -471,7 +528,7 @@ def evaluate_task(
     return state
 
 
-def main(model, test_categories, result_dir, score_dir):
+def main(model, test_categories, result_dir, score_dir, num_processes=1):
     if result_dir is None:
         result_dir = RESULT_PATH
     else:
@@ -499,7 +556,7 @@ def main(model, test_categories, result_dir, score_dir):
             model_names.append(model_name.replace("/", "_"))
 
     # Driver function to run the evaluation for all categories involved.
-    runner(model_names, all_test_categories, result_dir, score_dir)
+    runner(model_names, all_test_categories, result_dir, score_dir, num_processes)
 
     print(
         f"🏁 Evaluation completed. See {score_dir / 'data_overall.csv'} for overall evaluation results on BFCL V3."
@@ -535,6 +592,12 @@ if __name__ == "__main__":
         type=str,
         help="Path to the folder where the evaluation score files will be stored; relative to the `berkeley-function-call-leaderboard` root folder",
     )
+    parser.add_argument(
+        "--num-processes",
+        default=1,
+        type=int,
+        help="The number of processes to evaluate (model, test category) pairs in parallel",
+    )
 
     args = parser.parse_args()
 
@@ -544,4 +607,5 @@ if __name__ == "__main__":
         args.test_category,
         args.result_dir,
         args.score_dir,
+        args.num_processes,
     )
@@ -1,15 +1,32 @@
+import hashlib
+import itertools
+import json
 import os
 import statistics
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 import pandas as pd
-from bfcl_eval.constants.category_mapping import TEST_FILE_MAPPING
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.column_headers import *
 from bfcl_eval.constants.eval_config import *
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.utils import extract_test_category, load_file
+from bfcl_eval.eval_checker.dataset_registry import get_prompt_dataset
+from bfcl_eval.model_handler.result_store import (
+    PROJECTED_FIELDS,
+    RESULT_STORE_FILE_NAME,
+    ResultStore,
+)
+from bfcl_eval.utils import (
+    TEST_CATEGORY_CATALOGUE,
+    extract_test_category,
+    is_multi_turn,
+    load_file,
+    write_list_of_dicts_to_file,
+)
 
 
 def calculate_weighted_accuracy(accuracy_dict_list, display_na_if_category_missing=True):
@@ -71,6 +88,174 @@ def record_result(leaderboard_table, model_name, test_category, accuracy, total_
     }
 
 
+def merge_leaderboard_tables(leaderboard_table, partial_leaderboard_table):
+    """
+    Merge the leaderboard table produced by evaluating a subset of the (model, test category) pairs into the main one.
+    """
+    for model_name, model_records in partial_leaderboard_table.items():
+        if model_name not in leaderboard_table:
+            leaderboard_table[model_name] = {}
+            leaderboard_table[model_name]["cost"] = {"input_data": [], "output_data": []}
+            leaderboard_table[model_name]["latency"] = {"data": []}
+
+        for key, value in model_records.items():
+            if key == "cost":
+                leaderboard_table[model_name]["cost"]["input_data"].extend(value["input_data"])
+                leaderboard_table[model_name]["cost"]["output_data"].extend(value["output_data"])
+            elif key == "latency":
+                leaderboard_table[model_name]["latency"]["data"].extend(value["data"])
+            else:
+                leaderboard_table[model_name][key] = value
+
+
+def get_file_hash(file_path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_checker_version_hash() -> str:
+    """
+    Hash of all the code that can affect a score: the checkers, the handlers (which decode the model output) and the constants.
+    """
+    hasher = hashlib.sha256()
+    source_files = [PACKAGE_ROOT / "utils.py"]
+    for package in ["constants", "eval_checker", "model_handler"]:
+        source_files.extend(sorted((PACKAGE_ROOT / package).rglob("*.py")))
+    for source_file in source_files:
+        hasher.update(str(source_file.relative_to(PACKAGE_ROOT)).encode("utf-8"))
+        hasher.update(get_file_hash(source_file).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_dataset_hash(test_category: str) -> str:
+    hasher = hashlib.sha256()
+    test_category_info = TEST_CATEGORY_CATALOGUE[test_category]
+    for dataset_file in [test_category_info.prompt_path, test_category_info.possible_answer_path]:
+        # The relevance categories have no possible answer file
+        if dataset_file.exists():
+            hasher.update(get_file_hash(dataset_file).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def is_result_store_path(model_result_path: Path) -> bool:
+    return model_result_path.name == RESULT_STORE_FILE_NAME
+
+
+def load_model_result(model_result_path: Path, test_category: str) -> list[dict]:
+    """
+    Load the model results of a test category, sorted by ID, from either its result file or the model's result store.
+    """
+    if not is_result_store_path(model_result_path):
+        return load_file(model_result_path, sort_by_id=True)
+
+    result_store = ResultStore(model_result_path.parent)
+    # Only the multi-turn checker reports the inference log, so the single-turn checkers don't even read it
+    if is_multi_turn(test_category):
+        return result_store.load_entries(test_category)
+    return result_store.load_entries(test_category, fields=PROJECTED_FIELDS)
+
+
+def get_model_result_hash(model_result_path: Path, test_category: str) -> str:
+    if is_result_store_path(model_result_path):
+        return ResultStore(model_result_path.parent).get_fingerprint(test_category)
+    return get_file_hash(model_result_path)
+
+
+def get_evaluation_fingerprint(model_result_path: Path, test_category: str) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [
+                get_model_result_hash(model_result_path, test_category),
+                get_dataset_hash(test_category),
+                get_checker_version_hash(),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def get_score_file_path(score_dir: Path, model_name: str, test_category: str) -> Path:
+    return score_dir / model_name / f"{VERSION_PREFIX}_{test_category}_score.json"
+
+
+def get_score_summary_path(score_file_path: Path) -> Path:
+    """
+    The summary that sits next to a score file, holding just its first line (accuracy and counts).
+    It doesn't end with `.json`, so it is never picked up as a score file.
+    """
+    return score_file_path.with_name(score_file_path.name + ".summary")
+
+
+def write_score_file(
+    result: list[dict], score_dir: Path, model_name: str, test_category: str
+) -> None:
+    """
+    Write the score file, whose first entry is the summary and the rest are the failed entries, together with its summary sidecar.
+    """
+    score_file_path = get_score_file_path(score_dir, model_name, test_category)
+    write_list_of_dicts_to_file(score_file_path.name, result, score_file_path.parent)
+    summary_path = get_score_summary_path(score_file_path)
+    temp_path = summary_path.with_name(summary_path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(result[0], f)
+    temp_path.replace(summary_path)
+
+
+def load_score_summary(score_file_path: Path) -> dict:
+    """
+    Read the summary of a score file without loading the failed entries that follow it.
+    Score files written before summaries existed (or rewritten since) fall back to reading just their first line.
+    """
+    summary_path = get_score_summary_path(score_file_path)
+    try:
+        if summary_path.stat().st_mtime_ns >= score_file_path.stat().st_mtime_ns:
+            with open(summary_path, encoding="utf-8") as f:
+                return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    with open(score_file_path, encoding="utf-8") as f:
+        return json.loads(f.readline())
+
+
+def get_evaluation_record_path(score_file_path: Path) -> Path:
+    """
+    The record that sits next to a score file and remembers what it was computed from.
+    It doesn't end with `.json`, so it is never picked up as a score file.
+    """
+    return score_file_path.with_name(score_file_path.name + ".fingerprint")
+
+
+def load_evaluation_record(score_file_path: Path, fingerprint: str) -> Optional[dict]:
+    """
+    Return the leaderboard table entries recorded when the score file was written, if it was computed from the same
+    result file, dataset and checker code as identified by `fingerprint`. Otherwise, return None.
+    """
+    if not score_file_path.exists():
+        return None
+    try:
+        with open(get_evaluation_record_path(score_file_path), encoding="utf-8") as f:
+            record = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if record.get("fingerprint") != fingerprint:
+        return None
+    return record["leaderboard_table"]
+
+
+def write_evaluation_record(
+    score_file_path: Path, fingerprint: str, leaderboard_table: dict
+) -> None:
+    record_path = get_evaluation_record_path(score_file_path)
+    temp_path = record_path.with_name(record_path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "leaderboard_table": leaderboard_table}, f)
+    temp_path.replace(record_path)
+
+
 def record_cost_latency(leaderboard_table, model_name, model_output_data):
     def process_data(key, data, output_list):
         # All entries are either a list of list (in multi-turn), or a single value (in single-turn)
@@ -78,7 +263,7 @@ def record_cost_latency(leaderboard_table, model_name, model_output_data):
             if isinstance(data[key], list) and all(
                 isinstance(inner_item, list) for inner_item in data[key]
             ):
-                flattened_list = sum(data[key], [])
+                flattened_list = itertools.chain.from_iterable(data[key])
                 output_list.extend(
                     [
                         item
@@ -151,8 +336,7 @@ def get_category_score(score_dict: dict, test_category: str) -> dict:
         score["display_accuracy"] = score["accuracy"]
         return score
     else:
-        test_file_path = TEST_FILE_MAPPING[test_category]
-        num_entry = len(load_file(PROMPT_PATH / test_file_path))
+        num_entry = len(get_prompt_dataset(test_category))
         # If a category is not being evaluated, it needs to be distinguished from the situation where the evaluation score is 0
         # It will still be considered 0 in the overall score calculation though
         # We use `display_accuracy` to special handle
@@ -182,7 +366,7 @@ def write_score_csv_file(
 
     data.insert(0, header)
 
-    with open(file_path, "w") as f:
+    with open(file_path, "w", encoding="utf-8") as f:
         for i, row in enumerate(data):
             if i < len(data) - 1:
                 f.write(",".join(row) + "\n")
@@ -498,7 +682,7 @@ def update_leaderboard_table_with_local_score_file(
         model_name = subdir.relative_to(score_path).name
         # Find and process all JSON files in the subdirectory
         for model_score_json in subdir.glob("*.json"):
-            metadata = load_file(model_score_json)[0]
+            metadata = load_score_summary(model_score_json)
             accuracy, total_count = metadata["accuracy"], metadata["total_count"]
             test_category = extract_test_category(model_score_json)
             if model_name not in leaderboard_table:
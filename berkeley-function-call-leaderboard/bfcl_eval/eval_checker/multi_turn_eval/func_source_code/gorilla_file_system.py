@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Union
 
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import (
     FILE_CONTENT_EXTENSION, FILES_TAIL_USED, POPULATE_FILE_EXTENSION)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
 
 
 class File:
@@ -249,6 +250,7 @@ class GorillaFileSystem:
             file_name = f"{name}"
             directory._add_file(file_name)
 
+    @writes_state()
     def pwd(self):
         """
         Return the current working directory path.
@@ -265,6 +267,7 @@ class GorillaFileSystem:
             dir = dir.parent
         return {"current_working_directory": "/" + "/".join(reversed(path))}
 
+    @writes_state()
     def ls(self, a: bool = False) -> Dict[str, List[str]]:
         """
         List the contents of the current directory.
@@ -280,6 +283,7 @@ class GorillaFileSystem:
             contents = [item for item in contents if not item.startswith(".")]
         return {"current_directory_content": contents}
 
+    @writes_state()
     def cd(self, folder: str) -> Union[None, Dict[str, str]]:
         """
         Change the current working directory to the specified folder.
@@ -314,6 +318,7 @@ class GorillaFileSystem:
             return False
         return True
 
+    @writes_state("root")
     def mkdir(self, dir_name: str) -> Union[None, Dict[str, str]]:
         """
         Create a new directory in the current directory.
@@ -331,6 +336,7 @@ class GorillaFileSystem:
         self._current_dir._add_directory(dir_name)
         return None
 
+    @writes_state("root")
     def touch(self, file_name: str) -> Union[None, Dict[str, str]]:
         """
         Create a new file of any extension in the current directory.
@@ -347,6 +353,7 @@ class GorillaFileSystem:
         self._current_dir._add_file(file_name)
         return None
 
+    @writes_state("root")
     def echo(
         self, content: str, file_name: Optional[str] = None
     ) -> Union[Dict[str, str], None]:
@@ -373,6 +380,7 @@ class GorillaFileSystem:
         else:
             return {"terminal_output": content}
 
+    @writes_state()
     def cat(self, file_name: str) -> Dict[str, str]:
         """
         Display the contents of a file of any extension from currrent directory.
@@ -395,6 +403,7 @@ class GorillaFileSystem:
         else:
             return {"error": f"cat: {file_name}: No such file or directory"}
 
+    @writes_state()
     def find(self, path: str = ".", name: Optional[str] = None) -> Dict[str, List[str]]:
         """
         Find any file or directories under specific path that contain name in its file name.
@@ -426,6 +435,7 @@ class GorillaFileSystem:
         recursive_search(target_dir, path.rstrip("/"))
         return {"matches": matches}
 
+    @writes_state()
     def wc(self, file_name: str, mode: str = "l") -> Dict[str, Union[int, str]]:
         """
         Count the number of lines, words, and characters in a file of any extension from current directory.
@@ -460,6 +470,7 @@ class GorillaFileSystem:
 
         return {"error": f"wc: {file_name}: No such file or directory"}
 
+    @writes_state()
     def sort(self, file_name: str) -> Dict[str, str]:
         """
         Sort the contents of a file line by line.
@@ -481,6 +492,7 @@ class GorillaFileSystem:
 
         return {"error": f"sort: {file_name}: No such file or directory"}
 
+    @writes_state()
     def grep(self, file_name: str, pattern: str) -> Dict[str, List[str]]:
         """
         Search for lines in a file of any extension at current directory that contain the specified pattern.
@@ -503,6 +515,7 @@ class GorillaFileSystem:
 
         return {"error": f"grep: {file_name}: No such file or directory"}
 
+    @writes_state()
     def du(self, human_readable: bool = False) -> Dict[str, str]:
         """
         Estimate the disk usage of a directory and its contents.
@@ -540,6 +553,7 @@ class GorillaFileSystem:
 
         return {"disk_usage": size_str}
 
+    @writes_state()
     def tail(self, file_name: str, lines: int = 10) -> Dict[str, str]:
         """
         Display the last part of a file of any extension.
@@ -564,6 +578,7 @@ class GorillaFileSystem:
 
         return {"error": f"tail: {file_name}: No such file or directory"}
 
+    @writes_state()
     def diff(self, file_name1: str, file_name2: str) -> Dict[str, str]:
         """
         Compare two files of any extension line by line at the current directory.
@@ -596,6 +611,7 @@ class GorillaFileSystem:
 
         return {"error": f"diff: {file_name1} or {file_name2}: No such file or directory"}
 
+    @writes_state("root")
     def mv(self, source: str, destination: str) -> Dict[str, str]:
         """
         Move a file or directory from one location to another. so
@@ -652,6 +668,7 @@ class GorillaFileSystem:
                 self._current_dir.contents[destination].contents = item.contents
             return {"result": f"'{source}' moved to '{destination}'"}
 
+    @writes_state("root")
     def rm(self, file_name: str) -> Dict[str, str]:
         """
         Remove a file or directory.
@@ -674,6 +691,7 @@ class GorillaFileSystem:
         else:
             return {"error": f"rm: cannot remove '{file_name}': No such file or directory"}
 
+    @writes_state("root")
     def rmdir(self, dir_name: str) -> Dict[str, str]:
         """
         Remove a directory at current directory.
@@ -701,6 +719,7 @@ class GorillaFileSystem:
                 "error": f"rmdir: cannot remove '{dir_name}': No such file or directory"
             }
 
+    @writes_state("root")
     def cp(self, source: str, destination: str) -> Dict[str, str]:
         """
         Copy a file or directory from one location to another.
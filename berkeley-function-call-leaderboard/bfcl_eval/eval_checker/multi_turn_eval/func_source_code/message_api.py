@@ -2,6 +2,8 @@ import random
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
+
 DEFAULT_STATE = {
     "generated_ids": set(),
     "user_count": 4,
@@ -116,6 +118,7 @@ class MessageAPI:
         self.generated_ids.add(new_id)
         return {"new_id": new_id}
 
+    @writes_state()
     def list_users(self) -> Dict[str, List[str]]:
         """
         List all users in the workspace.
@@ -125,6 +128,7 @@ class MessageAPI:
         """
         return {"user_list": list(self.user_map.keys())}
 
+    @writes_state()
     def get_user_id(self, user: str) -> Dict[str, Optional[str]]:
         """
         Get user ID from user name.
@@ -139,6 +143,7 @@ class MessageAPI:
             return {"error": f"User '{user}' not found in the workspace."}
         return {"user_id": self.user_map.get(user)}
 
+    @writes_state("current_user")
     def message_login(self, user_id: str) -> Dict[str, Union[str, bool]]:
         """
         Log in a user with the given user ID to messeage application.
@@ -158,6 +163,7 @@ class MessageAPI:
             "message": f"User '{user_id}' logged in successfully.",
         }
 
+    @writes_state()
     def message_get_login_status(self) -> Dict[str, bool]:
         """
         Get the login status of the current user.
@@ -167,6 +173,7 @@ class MessageAPI:
         """
         return {"login_status": bool(self.current_user)}
 
+    @writes_state("generated_ids", "inbox", "message_count")
     def send_message(self, receiver_id: str, message: str) -> Dict[str, Union[str, bool]]:
         """
         Send a message to a user.
@@ -195,6 +202,7 @@ class MessageAPI:
             "message": f"Message sent to '{receiver_id}' successfully.",
         }
 
+    @writes_state("inbox")
     def delete_message(self, receiver_id: str) -> Dict[str, Union[bool, str]]:
         """
         Delete the latest message sent to a receiver.
@@ -221,6 +229,7 @@ class MessageAPI:
                 }
         return {"error": f"Receiver ID {receiver_id} not found."}
 
+    @writes_state()
     def view_messages_sent(self) -> Dict[str, Union[Dict[str, List[str]], str]]:
         """
         View all historical messages sent by the current user.
@@ -242,6 +251,7 @@ class MessageAPI:
                 sent_messages[receiver].append(message_content)
         return {"messages": sent_messages}
 
+    @writes_state("user_count", "user_map")
     def add_contact(self, user_name: str) -> Dict[str, Union[bool, str]]:
         """
         Add a contact to the workspace.
@@ -265,6 +275,7 @@ class MessageAPI:
             "message": f"Contact '{user_name}' added successfully.",
         }
 
+    @writes_state()
     def search_messages(
         self, keyword: str
     ) -> Dict[str, Union[List[Dict[str, Union[str, List[str]]]], str]]:
@@ -294,6 +305,7 @@ class MessageAPI:
                 )
         return {"results": results}
 
+    @writes_state()
     def get_message_stats(self) -> Dict[str, Union[Dict[str, int], str]]:
         """
         Get statistics about messages for the current user.
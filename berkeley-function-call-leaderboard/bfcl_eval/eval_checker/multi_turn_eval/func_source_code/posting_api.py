@@ -1,6 +1,8 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
+
 DEFAULT_STATE = {
     "username": "john",
     "password": "john123",
@@ -49,6 +51,7 @@ class TwitterAPI:
             "tweet_counter", DEFAULT_STATE_COPY["tweet_counter"]
         )
 
+    @writes_state("authenticated")
     def authenticate_twitter(self, username: str, password: str) -> Dict[str, bool]:
         """
         Authenticate a user with username and password.
@@ -64,6 +67,7 @@ class TwitterAPI:
             return {"authentication_status": True}
         return {"authentication_status": False}
 
+    @writes_state()
     def posting_get_login_status(self) -> Dict[str, Union[bool, str]]:
         """
         Get the login status of the current user.
@@ -73,6 +77,7 @@ class TwitterAPI:
         """
         return {"login_status": bool(self.authenticated)}
 
+    @writes_state("tweets", "tweet_counter")
     def post_tweet(
         self, content: str, tags: List[str] = [], mentions: List[str] = []
     ) -> Dict[str, Union[int, str, List[str]]]:
@@ -97,13 +102,15 @@ class TwitterAPI:
             "id": self.tweet_counter,
             "username": self.username,
             "content": content,
-            "tags": tags,
-            "mentions": mentions,
+            # Copied, so that `mention` never extends the shared default list
+            "tags": list(tags),
+            "mentions": list(mentions),
         }
         self.tweets[self.tweet_counter] = tweet
         self.tweet_counter += 1
         return tweet
 
+    @writes_state("retweets")
     def retweet(self, tweet_id: int) -> Dict[str, str]:
         """
         Retweet a tweet for the authenticated user.
@@ -128,6 +135,7 @@ class TwitterAPI:
         self.retweets[self.username].append(tweet_id)
         return {"retweet_status": "Successfully retweeted"}
 
+    @writes_state("comments")
     def comment(self, tweet_id: int, comment_content: str) -> Dict[str, str]:
         """
         Comment on a tweet for the authenticated user.
@@ -153,6 +161,7 @@ class TwitterAPI:
         )
         return {"comment_status": "Comment added successfully"}
 
+    @writes_state("tweets")
     def mention(self, tweet_id: int, mentioned_usernames: List[str]) -> Dict[str, str]:
         """
         Mention specified users in a tweet.
@@ -171,6 +180,7 @@ class TwitterAPI:
 
         return {"mention_status": "Users mentioned successfully"}
 
+    @writes_state("following_list")
     def follow_user(self, username_to_follow: str) -> Dict[str, bool]:
         """
         Follow a user for the authenticated user.
@@ -189,6 +199,7 @@ class TwitterAPI:
         self.following_list.append(username_to_follow)
         return {"follow_status": True}
 
+    @writes_state()
     def list_all_following(self) -> List[str]:
         """
         List all users that the authenticated user is following.
@@ -201,6 +212,7 @@ class TwitterAPI:
 
         return self.following_list
 
+    @writes_state("following_list")
     def unfollow_user(self, username_to_unfollow: str) -> Dict[str, bool]:
         """
         Unfollow a user for the authenticated user.
@@ -219,6 +231,7 @@ class TwitterAPI:
         self.following_list.remove(username_to_unfollow)
         return {"unfollow_status": True}
 
+    @writes_state()
     def get_tweet(self, tweet_id: int) -> Dict[str, Union[int, str, List[str]]]:
         """
         Retrieve a specific tweet.
@@ -237,6 +250,7 @@ class TwitterAPI:
 
         return self.tweets[tweet_id]
 
+    @writes_state()
     def get_user_tweets(self, username: str) -> List[Dict[str, Union[int, str, List[str]]]]:
         """
         Retrieve all tweets from a specific user.
@@ -253,6 +267,7 @@ class TwitterAPI:
         """
         return [tweet for tweet in self.tweets.values() if tweet["username"] == username]
 
+    @writes_state()
     def search_tweets(self, keyword: str) -> List[Dict[str, Union[int, str, List[str]]]]:
         """
         Search for tweets containing a specific keyword.
@@ -274,6 +289,7 @@ class TwitterAPI:
             or keyword.lower() in [tag.lower() for tag in tweet["tags"]]
         ]
 
+    @writes_state()
     def get_tweet_comments(self, tweet_id: int) -> List[Dict[str, str]]:
         """
         Retrieve all comments for a specific tweet.
@@ -289,6 +305,7 @@ class TwitterAPI:
             return {"error": f"Tweet with ID {tweet_id} not found."}
         return self.comments.get(tweet_id, [])
 
+    @writes_state()
     def get_user_stats(self, username: str) -> Dict[str, int]:
         """
         Get statistics for a specific user.
@@ -0,0 +1,19 @@
+# Set on a backend method by `writes_state`; a method without it may change any public attribute of its instance
+STATE_WRITES_ATTRIBUTE = "_state_writes"
+
+
+def writes_state(*attr_names: str):
+    """
+    Declare the public attributes of its instance that a backend method may change, eg, `@writes_state("inbox", "message_count")`.
+    A method declared with no attribute at all never changes the state.
+
+    After each call, `ExecutionSession` bumps a version counter for every attribute that the method declares, and a state
+    snapshot only copies the attributes whose version moved since the previous snapshot. A declaration must therefore list
+    every public attribute that the method assigns or mutates in place, including through the helpers it calls.
+    """
+
+    def decorator(method):
+        setattr(method, STATE_WRITES_ATTRIBUTE, frozenset(attr_names))
+        return method
+
+    return decorator
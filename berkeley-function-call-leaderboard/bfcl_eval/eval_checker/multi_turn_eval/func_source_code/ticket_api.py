@@ -1,6 +1,8 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
+
 DEFAULT_STATE = {
     "ticket_queue": [],
     "ticket_counter": 1,
@@ -46,6 +48,7 @@ class TicketAPI:
         )
         self.current_user = scenario.get("current_user", DEFAULT_STATE_COPY["current_user"])
 
+    @writes_state("ticket_queue", "ticket_counter")
     def create_ticket(
         self, title: str, description: str = "", priority: int = 1
     ) -> Dict[str, Union[int, str]]:
@@ -80,6 +83,7 @@ class TicketAPI:
         self.ticket_counter += 1
         return ticket
 
+    @writes_state()
     def get_ticket(self, ticket_id: int) -> Dict[str, Union[int, str]]:
         """
         Get a specific ticket by its ID.
@@ -100,6 +104,7 @@ class TicketAPI:
             return {"error": f"Ticket with ID {ticket_id} not found."}
         return ticket
 
+    @writes_state("ticket_queue")
     def close_ticket(self, ticket_id: int) -> Dict[str, str]:
         """
         Close a ticket.
@@ -118,6 +123,7 @@ class TicketAPI:
         ticket["status"] = "Closed"
         return {"status": f"Ticket {ticket_id} has been closed successfully."}
 
+    @writes_state("ticket_queue")
     def resolve_ticket(self, ticket_id: int, resolution: str) -> Dict[str, str]:
         """
         Resolve a ticket with a resolution.
@@ -138,6 +144,7 @@ class TicketAPI:
         ticket["resolution"] = resolution
         return {"status": f"Ticket {ticket_id} has been resolved successfully."}
 
+    @writes_state("ticket_queue")
     def edit_ticket(
         self, ticket_id: int, updates: Dict[str, Optional[Union[str, int]]]
     ) -> Dict[str, str]:
@@ -190,6 +197,7 @@ class TicketAPI:
                 return ticket
         return None
 
+    @writes_state("current_user")
     def ticket_login(self, username: str, password: str) -> Dict[str, bool]:
         """
         Authenticate a user for ticket system.
@@ -207,6 +215,7 @@ class TicketAPI:
             return {"success": True}
         return {"success": False}
 
+    @writes_state()
     def ticket_get_login_status(self) -> Dict[str, bool]:
         """
         Get the username of the currently authenticated user.
@@ -217,6 +226,7 @@ class TicketAPI:
         """
         return {"username": bool(self.current_user)}
 
+    @writes_state("current_user")
     def logout(self) -> Dict[str, bool]:
         """
         Log out the current user.
@@ -229,6 +239,7 @@ class TicketAPI:
             return {"success": True}
         return {"success": False}
 
+    @writes_state()
     def get_user_tickets(
         self, status: Optional[str] = None
     ) -> List[Dict[str, Union[int, str]]]:
@@ -12,6 +12,7 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     TRANSACTION_HISTORY_EXTENSION,
     WATCH_LIST_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
 
 CURRENT_TIME = datetime(2024, 9, 1, 10, 30)
 
@@ -212,6 +213,7 @@ class TradingBot:
 
         return random_date.strftime("%Y-%m-%d %H:%M:%S")
 
+    @writes_state()
     def get_current_time(self) -> Dict[str, str]:
         """
         Get the current time.
@@ -221,6 +223,7 @@ class TradingBot:
         """
         return {"current_time": CURRENT_TIME.strftime("%I:%M %p")}
 
+    @writes_state("market_status")
     def update_market_status(self, current_time_str: str) -> Dict[str, str]:
         """
         Update the market status based on the current time.
@@ -243,6 +246,7 @@ class TradingBot:
             self.market_status = "Closed"
             return {"status": "Closed"}
 
+    @writes_state()
     def get_symbol_by_name(self, name: str) -> Dict[str, str]:
         """
         Get the symbol of a stock by company name.
@@ -270,6 +274,7 @@ class TradingBot:
 
         return {"symbol": symbol_map.get(name, "Stock not found")}
 
+    @writes_state()
     def get_stock_info(self, symbol: str) -> Dict[str, Union[float, int, str]]:
         """
         Get the details of a stock.
@@ -293,6 +298,7 @@ class TradingBot:
             return stock
         return self.stocks[symbol]
 
+    @writes_state()
     def get_order_details(self, order_id: int) -> Dict[str, Union[str, float, int]]:
         """
         Get the details of an order.
@@ -332,6 +338,7 @@ class TradingBot:
 
         return self.orders[order_id]
 
+    @writes_state("orders")
     def cancel_order(self, order_id: int) -> Dict[str, Union[int, str]]:
         """
         Cancel an order.
@@ -350,6 +357,7 @@ class TradingBot:
         self.orders[order_id]["status"] = "Cancelled"
         return {"order_id": order_id, "status": "Cancelled"}
 
+    @writes_state("orders", "order_counter")
     def place_order(
         self, order_type: str, symbol: str, price: float, amount: int
     ) -> Dict[str, Union[int, str, float]]:
@@ -397,6 +405,7 @@ class TradingBot:
             "amount": amount,
         }
 
+    @writes_state("account_info", "transaction_history")
     def make_transaction(
         self, account_id: int, xact_type: str, amount: float
     ) -> Dict[str, Union[str, float]]:
@@ -451,6 +460,7 @@ class TradingBot:
             }
         return {"error": "Invalid transaction type. Use 'deposit' or 'withdrawal'."}
 
+    @writes_state()
     def get_account_info(self) -> Dict[str, Union[int, float]]:
         """
         Get account information.
@@ -466,6 +476,7 @@ class TradingBot:
             }
         return self.account_info
 
+    @writes_state("authenticated")
     def trading_login(self, username: str, password: str) -> Dict[str, str]:
         """
         Handle user login.
@@ -483,6 +494,7 @@ class TradingBot:
         self.authenticated = True
         return {"status": "Logged in successfully"}
 
+    @writes_state()
     def trading_get_login_status(self) -> Dict[str, bool]:
         """
         Get the login status.
@@ -493,6 +505,7 @@ class TradingBot:
 
         return {"status": bool(self.authenticated)}
 
+    @writes_state("authenticated")
     def trading_logout(self) -> Dict[str, str]:
         """
         Handle user logout for trading system.
@@ -505,6 +518,7 @@ class TradingBot:
         self.authenticated = False
         return {"status": "Logged out successfully"}
 
+    @writes_state("account_info", "transaction_history")
     def fund_account(self, amount: float) -> Dict[str, Union[str, float]]:
         """
         Fund the account with the specified amount.
@@ -529,6 +543,7 @@ class TradingBot:
             "new_balance": self.account_info["balance"],
         }
 
+    @writes_state("watch_list")
     def remove_stock_from_watchlist(self, symbol: str) -> Dict[str, str]:
         """
         Remove a stock from the watchlist.
@@ -548,6 +563,7 @@ class TradingBot:
         self.watch_list.remove(symbol)
         return {"status": f"Stock {symbol} removed from watchlist successfully."}
 
+    @writes_state()
     def get_watchlist(self) -> Dict[str, List[str]]:
         """
         Get the watchlist.
@@ -564,6 +580,7 @@ class TradingBot:
             return watch_list
         return {"watchlist": self.watch_list}
 
+    @writes_state()
     def get_order_history(self) -> Dict[str, List[Dict[str, Union[str, int, float]]]]:
         """
         Get the stock order ID history.
@@ -580,6 +597,7 @@ class TradingBot:
 
         return {"history": list(self.orders.keys())}
 
+    @writes_state()
     def get_transaction_history(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> Dict[str, List[Dict[str, Union[str, float]]]]:
@@ -626,6 +644,7 @@ class TradingBot:
 
         return {"transaction_history": filtered_history}
 
+    @writes_state("stocks")
     def update_stock_price(
         self, symbol: str, new_price: float
     ) -> Dict[str, Union[str, float]]:
@@ -653,6 +672,7 @@ class TradingBot:
         return {"symbol": symbol, "old_price": old_price, "new_price": new_price}
 
     # below contains a list of functions to be nested
+    @writes_state()
     def get_available_stocks(self, sector: str) -> Dict[str, List[str]]:
         """
         Get a list of stock symbols in the given sector.
@@ -673,6 +693,7 @@ class TradingBot:
             sector_map["Automobile"].extend(AUTOMOBILE_EXTENSION)
         return {"stock_list": sector_map.get(sector, [])}
 
+    @writes_state()
     def filter_stocks_by_price(
         self, stocks: List[str], min_price: float, max_price: float
     ) -> Dict[str, List[str]]:
@@ -695,6 +716,7 @@ class TradingBot:
         ]
         return {"filtered_stocks": filtered_stocks}
 
+    @writes_state("watch_list")
     def add_to_watchlist(self, stock: str) -> Dict[str, List[str]]:
         """
         Add a stock to the watchlist.
@@ -710,6 +732,7 @@ class TradingBot:
                 self.watch_list.append(stock)
         return {"symbol": self.watch_list}
 
+    @writes_state()
     def notify_price_change(self, stocks: List[str], threshold: float) -> Dict[str, str]:
         """
         Notify if there is a significant price change in the stocks.
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import (
     BOOKING_RECORD_EXTENSION, CREDIT_CARD_EXTENSION)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
 
 DEFAULT_STATE = {
     "random_seed": 141053,
@@ -97,7 +98,8 @@ class TravelAPI:
         """
         for card_id, card_info in CREDIT_CARD_EXTENSION.items():
             if card_id not in self.credit_card_list:
-                self.credit_card_list[card_id] = card_info
+                # Copied, so that payments never change the shared extension
+                self.credit_card_list[card_id] = deepcopy(card_info)
 
     def _add_booking_records(self) -> None:
         """
@@ -106,7 +108,8 @@ class TravelAPI:
         """
         for booking_id, booking_info in BOOKING_RECORD_EXTENSION.items():
             if booking_id not in self.booking_record:
-                self.booking_record[booking_id] = booking_info
+                # Copied like the credit cards, so that the session owns all of its state
+                self.booking_record[booking_id] = deepcopy(booking_info)
 
     def _cache_flight_cost_entry(self, travel_from, travel_to, cost, travel_class, travel_date):
         key = f"{travel_from}|{travel_to}|{travel_class}|{travel_date}"
@@ -114,6 +117,7 @@ class TravelAPI:
             "cost": cost
         }
 
+    @writes_state("access_token", "token_expires_in", "token_scope", "token_type", "user_first_name", "user_last_name")
     def authenticate_travel(
         self,
         client_id: str,
@@ -152,6 +156,7 @@ class TravelAPI:
             "scope": grant_type,
         }
 
+    @writes_state()
     def travel_get_login_status(self) -> Dict[str, bool]:
         """
         Get the status of the login
@@ -162,6 +167,7 @@ class TravelAPI:
         is_not_loggedin = self.token_expires_in is None or self.token_expires_in == 0
         return {"status": not is_not_loggedin}
 
+    @writes_state()
     def get_budget_fiscal_year(
         self,
         lastModifiedAfter: Optional[str] = None,
@@ -178,6 +184,7 @@ class TravelAPI:
         """
         return {"budget_fiscal_year": "2018"}
 
+    @writes_state("credit_card_list", "token_expires_in")
     def register_credit_card(
         self,
         access_token: str,
@@ -228,6 +235,7 @@ class TravelAPI:
         """
         self.credit_card_list[card_id]["balance"] = balance
 
+    @writes_state()
     def get_flight_cost(
         self, travel_from: str, travel_to: str, travel_date: str, travel_class: str
     ) -> Dict[str, List[float]]:
@@ -440,6 +448,7 @@ class TravelAPI:
 
         return {"travel_cost_list": travel_cost_list}
 
+    @writes_state("token_expires_in")
     def get_credit_card_balance(
         self, access_token: str, card_id: str
     ) -> Dict[str, Union[float, str]]:
@@ -463,6 +472,7 @@ class TravelAPI:
             }
         return {"card_balance": self.credit_card_list[card_id]["balance"]}
 
+    @writes_state("booking_record", "credit_card_list", "token_expires_in")
     def book_flight(
         self,
         access_token: str,
@@ -572,6 +582,7 @@ class TravelAPI:
             "booking_history": {},
         }
 
+    @writes_state("token_expires_in")
     def retrieve_invoice(
         self,
         access_token: str,
@@ -613,6 +624,7 @@ class TravelAPI:
         }
         return {"invoice": invoice}
 
+    @writes_state()
     def list_all_airports(self) -> List[str]:
         """
         List all available airports
@@ -646,6 +658,7 @@ class TravelAPI:
             "BOS",
         ]
 
+    @writes_state("booking_record", "credit_card_list", "token_expires_in")
     def cancel_booking(
         self, access_token: str, booking_id: str
     ) -> Dict[str, Union[bool, str]]:
@@ -671,6 +684,7 @@ class TravelAPI:
         del self.booking_record[booking_id]
         return {"cancel_status": True}
 
+    @writes_state()
     def compute_exchange_rate(
         self, base_currency: str, target_currency: str, value: float
     ) -> float:
@@ -704,6 +718,7 @@ class TravelAPI:
                 return {"exchanged_value": round(value / val, 2)}
         raise ValueError("No available exchange rate for the given currencies.")
 
+    @writes_state()
     def verify_traveler_information(
         self, first_name: str, last_name: str, date_of_birth: str, passport_number: str
     ) -> Dict[str, Union[bool, str]]:
@@ -758,6 +773,7 @@ class TravelAPI:
         # If all checks pass
         return {"verification_status": True}
 
+    @writes_state("budget_limit", "token_expires_in")
     def set_budget_limit(
         self, access_token: str, budget_limit: float
     ) -> Dict[str, Union[float, str]]:
@@ -779,6 +795,7 @@ class TravelAPI:
         self.budget_limit = budget_limit
         return {"budget_limit": budget_limit}
 
+    @writes_state()
     def get_nearest_airport_by_city(self, location: str) -> Dict[str, str]:
         """
         Get the nearest airport to the given location
@@ -816,6 +833,7 @@ class TravelAPI:
 
         return {"nearest_airport": airport_map.get(location, "Unknown")}
 
+    @writes_state("credit_card_list", "token_expires_in")
     def purchase_insurance(
         self,
         access_token: str,
@@ -854,6 +872,7 @@ class TravelAPI:
             "insurance_status": True,
         }
 
+    @writes_state()
     def contact_customer_support(self, booking_id: str, message: str) -> Dict[str, str]:
         """
         Contact travel booking customer support, get immediate support on an issue with an online call.
@@ -871,6 +890,7 @@ class TravelAPI:
             "customer_support_message": "Thank you for contacting customer support. Your message has been received and we will get back to you shortly."
         }
 
+    @writes_state()
     def get_all_credit_cards(self) -> Dict[str, Dict[str, Union[str, int, float]]]:
         """
         Get all registered credit cards
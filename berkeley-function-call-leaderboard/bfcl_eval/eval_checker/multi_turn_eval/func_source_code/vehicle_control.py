@@ -8,6 +8,7 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     LONG_WEATHER_EXTENSION,
     PARKING_BRAKE_INSTRUCTION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import writes_state
 
 MAX_FUEL_LEVEL = 50
 MIN_FUEL_LEVEL = 0.0
@@ -172,6 +173,7 @@ class VehicleControlAPI:
 
         return True
 
+    @writes_state("engine_state")
     def startEngine(self, ignitionMode: str) -> Dict[str, Union[str, float]]:
         """
         Starts the engine of the vehicle.
@@ -212,6 +214,7 @@ class VehicleControlAPI:
             "batteryVoltage": self.batteryVoltage,
         }
 
+    @writes_state("fuelLevel")
     def fillFuelTank(self, fuelAmount: float) -> Dict[str, Union[str, float]]:
         """
         Fills the fuel tank of the vehicle. The fuel tank can hold up to 50 gallons.
@@ -229,6 +232,7 @@ class VehicleControlAPI:
         self.fuelLevel += fuelAmount
         return {"fuelLevel": self.fuelLevel}
 
+    @writes_state("doorStatus", "remainingUnlockedDoors")
     def lockDoors(self, unlock: bool, door: list[str]) -> Dict[str, Union[str, int]]:
         """
         Locks the doors of the vehicle.
@@ -260,6 +264,7 @@ class VehicleControlAPI:
                 "remainingUnlockedDoors": self.remainingUnlockedDoors,
             }
 
+    @writes_state("acMode", "acTemperature", "fanSpeed")
     def adjustClimateControl(
         self,
         temperature: float,
@@ -292,6 +297,7 @@ class VehicleControlAPI:
             "humidityLevel": self.humidityLevel,
         }
 
+    @writes_state()
     def get_outside_temperature_from_google(self) -> Dict[str, float]:
         """
         Gets the outside temperature.
@@ -303,6 +309,7 @@ class VehicleControlAPI:
             return LONG_WEATHER_EXTENSION
         return {"outsideTemperature": self._random.uniform(-10.0, 40.0)}
 
+    @writes_state()
     def get_outside_temperature_from_weather_com(self) -> Dict[str, float]:
         """
         Gets the outside temperature.
@@ -311,6 +318,7 @@ class VehicleControlAPI:
         """
         return {"error": 404}
 
+    @writes_state("headLightStatus")
     def setHeadlights(self, mode: str) -> Dict[str, str]:
         """
         Sets the headlights of the vehicle.
@@ -328,6 +336,7 @@ class VehicleControlAPI:
             self.headLightStatus = "off"
             return {"headlightStatus": "off"}
 
+    @writes_state()
     def displayCarStatus(self, option: str) -> Dict[str, Union[str, float, Dict[str, str]]]:
         """
         Displays the status of the vehicle based on the provided display option.
@@ -384,6 +393,7 @@ class VehicleControlAPI:
             status["error"] = "Invalid option"
         return status
 
+    @writes_state("parkingBrakeStatus")
     def activateParkingBrake(self, mode: str) -> Dict[str, Union[str, float]]:
         """
         Activates the parking brake of the vehicle.
@@ -421,6 +431,7 @@ class VehicleControlAPI:
                 }
             return {"parkingBrakeStatus": "released", "_parkingBrakeForce": 0.0, "_slopeAngle": 10.0}
 
+    @writes_state("brakePedalStatus")
     def pressBrakePedal(self, pedalPosition: float) -> Dict[str, Union[str, float]]:
         """
         Presses the brake pedal based on pedal position. The brake pedal will be kept pressed until released.
@@ -450,6 +461,7 @@ class VehicleControlAPI:
         self._brakePedalForce = force
         return {"brakePedalStatus": "pressed", "brakePedalForce": float(force)}
 
+    @writes_state("brakePedalStatus")
     def releaseBrakePedal(self) -> Dict[str, Union[str, float]]:
         """
         Releases the brake pedal of the vehicle.
@@ -461,6 +473,7 @@ class VehicleControlAPI:
         self._brakePedalForce = 0.0
         return {"brakePedalStatus": "released", "brakePedalForce": 0.0}
 
+    @writes_state("cruiseStatus", "distanceToNextVehicle")
     def setCruiseControl(
         self, speed: float, activate: bool, distanceToNextVehicle: float
     ) -> Dict[str, Union[str, float]]:
@@ -499,6 +512,7 @@ class VehicleControlAPI:
                 "distanceToNextVehicle": distanceToNextVehicle,
             }
 
+    @writes_state()
     def get_current_speed(self) -> Dict[str, float]:
         """
         Gets the current speed of the vehicle.
@@ -507,6 +521,7 @@ class VehicleControlAPI:
         """
         return {"currentSpeed": self._random.uniform(0.0, 120.0)}
 
+    @writes_state()
     def display_log(self, messages: List[str]):
         """
         Displays the log messages.
@@ -517,6 +532,7 @@ class VehicleControlAPI:
         """
         return {"log": messages}
 
+    @writes_state()
     def estimate_drive_feasibility_by_mileage(self, distance: float) -> Dict[str, bool]:
         """
         Estimates the milage of the vehicle given the distance needed to drive.
@@ -530,6 +546,7 @@ class VehicleControlAPI:
         else:
             return {"canDrive": True}
 
+    @writes_state()
     def liter_to_gallon(self, liter: float) -> Dict[str, float]:
         """
         Converts the liter to gallon.
@@ -540,6 +557,7 @@ class VehicleControlAPI:
         """
         return {"gallon": liter * 0.264172}
 
+    @writes_state()
     def gallon_to_liter(self, gallon: float) -> Dict[str, float]:
         """
         Converts the gallon to liter.
@@ -550,6 +568,7 @@ class VehicleControlAPI:
         """
         return {"liter": gallon * 3.78541}
 
+    @writes_state()
     def estimate_distance(self, cityA: str, cityB: str) -> Dict[str, float]:
         """
         Estimates the distance between two cities.
@@ -615,6 +634,7 @@ class VehicleControlAPI:
             distance["intermediaryCities"] = INTERMEDIARY_CITIES
         return distance
 
+    @writes_state()
     def get_zipcode_based_on_city(self, city: str) -> Dict[str, str]:
         """
         Gets the zipcode based on the city.
@@ -648,6 +668,7 @@ class VehicleControlAPI:
         else:
             return {"zipcode": "00000"}
 
+    @writes_state("destination")
     def set_navigation(self, destination: str) -> Dict[str, str]:
         """
         Navigates to the destination.
@@ -659,6 +680,7 @@ class VehicleControlAPI:
         self.destination = destination
         return {"status": "Navigating to " + destination}
 
+    @writes_state()
     def check_tire_pressure(self):
         """
         Checks the tire pressure of the vehicle.
@@ -694,6 +716,7 @@ class VehicleControlAPI:
             tire_status["car_info"] = CAR_STATUS_METADATA_EXTENSION
         return tire_status
 
+    @writes_state()
     def find_nearest_tire_shop(self) -> Dict[str, str]:
         """
         Finds the nearest tire shop.
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import GROUND_TRUTH_CACHE_PATH
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import ExecutionSession
+
+MULTI_TURN_EVAL_PATH = Path(__file__).parent
+
+
+@lru_cache(maxsize=1)
+def get_backend_source_hash() -> str:
+    """
+    Hash of the simulated backend source code and the code that executes calls against it.
+    Any change to either invalidates all cached ground truth traces.
+    """
+    source_files = sorted((MULTI_TURN_EVAL_PATH / "func_source_code").glob("*.py")) + [
+        MULTI_TURN_EVAL_PATH / "multi_turn_utils.py"
+    ]
+    hasher = hashlib.sha256()
+    for source_file in source_files:
+        hasher.update(source_file.name.encode("utf-8"))
+        hasher.update(source_file.read_bytes())
+    return hasher.hexdigest()
+
+
+def _get_trace_path(
+    test_entry: dict, multi_turn_ground_truth_list: list[list[str]], long_context: bool
+) -> Path:
+    # The entry content stands in for the dataset version, so that editing an entry or its ground truth invalidates its trace
+    entry_content = json.dumps(
+        [
+            VERSION_PREFIX,
+            test_entry["initial_config"],
+            test_entry["involved_classes"],
+            multi_turn_ground_truth_list,
+            long_context,
+        ],
+        sort_keys=True,
+    )
+    entry_hash = hashlib.sha256(entry_content.encode("utf-8")).hexdigest()[:16]
+    return (
+        GROUND_TRUTH_CACHE_PATH
+        / get_backend_source_hash()[:16]
+        / f"{test_entry['id']}_{entry_hash}.pkl"
+    )
+
+
+def get_ground_truth_trace(
+    multi_turn_ground_truth_list: list[list[str]],
+    test_entry: dict,
+    long_context: bool,
+) -> list[tuple[list[str], dict[str, dict]]]:
+    """
+    Return, for each turn, the execution results of the ground truth function calls and a snapshot of the backend state after that turn.
+
+    The ground truth is the same for every model, so the trace is computed once and persisted under `GROUND_TRUTH_CACHE_PATH`,
+    keyed on the entry ID, the entry content and the backend source hash.
+    """
+    trace_path = _get_trace_path(test_entry, multi_turn_ground_truth_list, long_context)
+    try:
+        with open(trace_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Corrupted or incompatible; recompute and overwrite it
+        pass
+
+    trace = []
+    with ExecutionSession(
+        test_entry["initial_config"], test_entry["involved_classes"], long_context
+    ) as execution_session:
+        for single_turn_ground_truth_list in multi_turn_ground_truth_list:
+            single_turn_ground_truth_execution_results, _ = execution_session.execute(
+                single_turn_ground_truth_list
+            )
+            trace.append(
+                (
+                    single_turn_ground_truth_execution_results,
+                    execution_session.snapshot_state(),
+                )
+            )
+
+    try:
+        serialized_trace = pickle.dumps(trace)
+    except Exception:
+        # Not every backend state can be pickled; such traces are just not persisted
+        return trace
+
+    trace_path.parent.mkdir(parents=True, exist_ok=True)
+    # Several evaluation processes may write the same trace; write to a temporary file first so that readers never see a partial one
+    temp_path = trace_path.with_name(
+        f"{trace_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    with open(temp_path, "wb") as f:
+        f.write(serialized_trace)
+    temp_path.replace(trace_path)
+
+    return trace
@@ -1,5 +1,10 @@
+from typing import Optional
+
+from bfcl_eval.eval_checker.multi_turn_eval.ground_truth_cache import (
+    get_ground_truth_trace,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
-    execute_multi_turn_func_call,
+    ExecutionSession,
     is_empty_execute_response,
 )
 
@@ -23,110 +28,103 @@ def multi_turn_checker(
     test_category: str = test_entry_id.rsplit("_", 1)[0]
     execution_results: list[dict] = []
     all_turn_model_execution_results: list[str] = []
+    long_context: bool = "long_context" in test_category or "composite" in test_category
 
-    # First execute all the function calls
-    for turn_index, single_turn_ground_truth_list in enumerate(
-        multi_turn_ground_truth_list
-    ):
-        single_turn_model_response_list = multi_turn_model_result_list_decoded[turn_index]
+    # The ground truth execution doesn't depend on the model, so it is cached across models and runs
+    ground_truth_trace = get_ground_truth_trace(
+        multi_turn_ground_truth_list, test_entry, long_context
+    )
 
-        # Note that we combine all the sub-step results into a single list, for easier comparison
-        single_turn_model_execution_results = []
-        single_turn_model_execution_results_uncombined = []
-        single_turn_ground_truth_execution_results = []
-        model_instances = {}  # Will be overwritten in the for loop
-        single_step_model_execution_results = []  # Will be overwritten in the for loop
+    # Attributes found equal to the ground truth so far, so unchanged ones aren't compared again in later turns
+    verified_attributes: dict[str, dict] = {}
+
+    # The backend instances the model works against throughout this entry
+    with ExecutionSession(
+        initial_config, involved_classes, long_context=long_context
+    ) as execution_session:
+        # First execute all the function calls
+        for turn_index, single_turn_ground_truth_list in enumerate(
+            multi_turn_ground_truth_list
+        ):
+            single_turn_model_response_list = multi_turn_model_result_list_decoded[turn_index]
+
+            # Note that we combine all the sub-step results into a single list, for easier comparison
+            single_turn_model_execution_results = []
+            single_turn_model_execution_results_uncombined = []
+            single_step_model_execution_results = []  # Will be overwritten in the for loop
     
-        for single_step_model_response in single_turn_model_response_list:
-            single_step_model_execution_results, model_instances = (
-                execute_multi_turn_func_call(
-                    func_call_list=single_step_model_response,
-                    initial_config=initial_config,
-                    involved_classes=involved_classes,
-                    model_name=model_name,
-                    test_entry_id=test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=True,
+            for single_step_model_response in single_turn_model_response_list:
+                single_step_model_execution_results, _ = execution_session.execute(
+                    single_step_model_response
                 )
-            )
-            single_turn_model_execution_results.extend(single_step_model_execution_results)
-            single_turn_model_execution_results_uncombined.append(single_step_model_execution_results)
-
-        # Execute the ground truth function calls
-        single_turn_ground_truth_execution_results, ground_truth_instances = (
-            execute_multi_turn_func_call(
-                func_call_list=single_turn_ground_truth_list,
-                initial_config=initial_config,
-                involved_classes=involved_classes,
-                model_name=model_name + "_ground_truth",
-                test_entry_id=test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=True,
-            )
-        )
+                single_turn_model_execution_results.extend(single_step_model_execution_results)
+                single_turn_model_execution_results_uncombined.append(single_step_model_execution_results)
 
-        all_turn_model_execution_results.extend(single_turn_model_execution_results)
-        execution_results.append(
-            {
-                "model": single_turn_model_execution_results_uncombined,
-                "ground_truth": single_turn_ground_truth_execution_results,
-            }
-        )
+            single_turn_ground_truth_execution_results, ground_truth_state = (
+                ground_truth_trace[turn_index]
+            )
 
-        # If the ground truth list is not empty, then the model response list should not be empty
-        if len(single_turn_ground_truth_list) > 0:
-            if not single_turn_model_response_list or is_empty_execute_response(
-                single_turn_model_response_list
-            ):
-                return {
-                    "valid": False,
-                    "error_message": f"Model response list is empty for turn {turn_index}",
-                    "error_type": "multi_turn:empty_turn_model_response",
-                    "details": {
-                        "execution_result": execution_results,
-                    },
+            all_turn_model_execution_results.extend(single_turn_model_execution_results)
+            execution_results.append(
+                {
+                    "model": single_turn_model_execution_results_uncombined,
+                    "ground_truth": single_turn_ground_truth_execution_results,
                 }
+            )
 
-        # If the ground truth list is empty, this is the turn where the model should eventually fail to achieve the user request.
-        # The actual check for irrelevance is done in the multi_turn_irrelevance_checker function
-        # Note: If the model outputs any function call in this turn, we will still execute it so that the state check at the next turn is accurate.
-        if not single_turn_ground_truth_list:
-            continue
+            # If the ground truth list is not empty, then the model response list should not be empty
+            if len(single_turn_ground_truth_list) > 0:
+                if not single_turn_model_response_list or is_empty_execute_response(
+                    single_turn_model_response_list
+                ):
+                    return {
+                        "valid": False,
+                        "error_message": f"Model response list is empty for turn {turn_index}",
+                        "error_type": "multi_turn:empty_turn_model_response",
+                        "details": {
+                            "execution_result": execution_results,
+                        },
+                    }
+
+            # If the ground truth list is empty, this is the turn where the model should eventually fail to achieve the user request.
+            # The actual check for irrelevance is done in the multi_turn_irrelevance_checker function
+            # Note: If the model outputs any function call in this turn, we will still execute it so that the state check at the next turn is accurate.
+            if not single_turn_ground_truth_list:
+                continue
 
-        ## Check after each turn ##
-        assert len(model_instances) == len(
-            ground_truth_instances
-        ), f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instances)}"
-        assert set(model_instances.keys()) == set(ground_truth_instances.keys())
-
-        # Check the state of the instances
-        state_check_result = state_checker(model_instances, ground_truth_instances)
-        if not state_check_result["valid"]:
-            state_check_result["execution_result"] = execution_results
-            return state_check_result
-
-        # Check the response of the function calls
-        # We use the all_turn_model_execution_results to accomodate the situation where the model invokes a function in a previous turn, and thus don't need to invoke it again in the current turn.
-        response_check_result = response_checker(
-            all_turn_model_execution_results,
-            single_turn_ground_truth_execution_results,
-            turn_index,
-        )
-        if not response_check_result["valid"]:
-            return response_check_result
+            ## Check after each turn ##
+            model_state = execution_session.snapshot_state()
+            assert len(model_state) == len(
+                ground_truth_state
+            ), f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_state)}, Ground truth instances: {len(ground_truth_state)}"
+            assert set(model_state.keys()) == set(ground_truth_state.keys())
 
-        # # Check the method invoke order
-        # method_invoke_order_check_result = method_invoke_order_checker(
-        #     model_instances, ground_truth_instances
-        # )
-        # if not method_invoke_order_check_result["valid"]:
-        #     return method_invoke_order_check_result
+            # Check the state of the instances
+            state_check_result = state_checker(
+                model_state, ground_truth_state, verified_attributes
+            )
+            if not state_check_result["valid"]:
+                state_check_result["execution_result"] = execution_results
+                return state_check_result
+
+            # Check the response of the function calls
+            # We use the all_turn_model_execution_results to accomodate the situation where the model invokes a function in a previous turn, and thus don't need to invoke it again in the current turn.
+            response_check_result = response_checker(
+                all_turn_model_execution_results,
+                single_turn_ground_truth_execution_results,
+                turn_index,
+            )
+            if not response_check_result["valid"]:
+                return response_check_result
 
-    return {"valid": True}
+            # # Check the method invoke order
+            # method_invoke_order_check_result = method_invoke_order_checker(
+            #     model_instances, ground_truth_instances
+            # )
+            # if not method_invoke_order_check_result["valid"]:
+            #     return method_invoke_order_check_result
+
+        return {"valid": True}
 
 
 def multi_turn_irrelevance_checker(
@@ -159,26 +157,27 @@ def multi_turn_irrelevance_checker(
 #### Sub-Chekcers ####
 
 
-def state_checker(model_instances: dict, ground_truth_instances: dict):
+def state_checker(
+    model_state: dict, ground_truth_state: dict, verified_attributes: Optional[dict] = None
+):
     """
-    Checks if, after executing the function calls, the model_instance has the same state (defined by the attributes) as the ground_truth_instance.
-    It checks if every instance in the model_instances has the same attributes as their corresponding instance (of the same class) from ground_truth_instances.
+    Checks if, after executing the function calls, the model's instances have the same state (defined by the attributes) as the ground truth instances.
+    Both states are snapshots taken by `ExecutionSession.snapshot_state`, keyed by class name and then by attribute name.
+
+    `verified_attributes` can be shared across the turns of one entry. It remembers the attribute values that were found equal,
+    so that attributes left unchanged by both sides since (which are then the very same snapshot objects) are not compared again.
     """
-    for class_name, ground_truth_instance in ground_truth_instances.items():
-        model_instance = model_instances[class_name]
-        valid, differences = _compare_instances(model_instance, ground_truth_instance)
+    if verified_attributes is None:
+        verified_attributes = {}
+    for class_name, ground_truth_class_state in ground_truth_state.items():
+        model_class_state = model_state[class_name]
+        valid, differences = _compare_instances(
+            model_class_state,
+            ground_truth_class_state,
+            verified_attributes.setdefault(class_name, {}),
+        )
 
         if not valid:
-            model_instance_attributes = {
-                key: value
-                for key, value in vars(model_instance).items()
-                if not key.startswith("_")
-            }
-            ground_truth_instance_attributes = {
-                key: value
-                for key, value in vars(ground_truth_instance).items()
-                if not key.startswith("_")
-            }
             # Format the error message for better readability
             return {
                 "valid": False,
@@ -186,8 +185,8 @@ def state_checker(model_instances: dict, ground_truth_instances: dict):
                 "error_type": "multi_turn:instance_state_mismatch",
                 "details": {
                     "differences": differences,
-                    "model_instance_state": model_instance_attributes,
-                    "ground_truth_instance_state": ground_truth_instance_attributes,
+                    "model_instance_state": model_class_state,
+                    "ground_truth_instance_state": ground_truth_class_state,
                 },
             }
 
@@ -256,25 +255,30 @@ def method_invoke_order_checker(model_instances: dict, ground_truth_instances: d
 #### Helper functions ####
 
 
-def _compare_instances(model_obect, ground_truth_object):
+def _compare_instances(
+    model_class_state: dict, ground_truth_class_state: dict, verified_attributes: dict
+):
     """
-    Checks if the model_object has the same attributes as the ground_truth_object. They are instances of the same class.
+    Checks if the model's instance has the same attributes as the ground truth instance, given their state snapshots. They are instances of the same class.
     """
-    assert type(model_obect) == type(
-        ground_truth_object
-    ), "Objects are not of the same type."
     differences = {}
     valid = True
-    for attr_name in vars(ground_truth_object):
-        # We don't check for private attributes
-        if attr_name.startswith("_"):
+    for attr_name, ground_truth_attr in ground_truth_class_state.items():
+        model_attr = model_class_state.get(attr_name)
+
+        verified_pair = verified_attributes.get(attr_name)
+        if (
+            verified_pair is not None
+            and verified_pair[0] is model_attr
+            and verified_pair[1] is ground_truth_attr
+        ):
             continue
-        model_attr = getattr(model_obect, attr_name)
-        ground_truth_attr = getattr(ground_truth_object, attr_name)
 
         if model_attr != ground_truth_attr:
             valid = False
             differences[attr_name] = {"model": model_attr, "ground_truth": ground_truth_attr}
+        else:
+            verified_attributes[attr_name] = (model_attr, ground_truth_attr)
 
     return valid, differences
 
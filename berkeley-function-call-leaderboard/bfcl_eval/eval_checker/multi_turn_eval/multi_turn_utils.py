@@ -1,8 +1,16 @@
+import ast
+import copy
 import importlib
 import inspect
 import json
-import re
-import copy
+import operator
+from collections import defaultdict
+from functools import lru_cache
+from typing import NamedTuple
+
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_tracking import (
+    STATE_WRITES_ATTRIBUTE,
+)
 
 CLASS_FILE_PATH_MAPPING = {
     "GorillaFileSystem": "bfcl_eval.eval_checker.multi_turn_eval.func_source_code.gorilla_file_system",
@@ -20,137 +28,303 @@ STATELESS_CLASSES = [
     "MathAPI",
 ]
 
+# Method names that are never dispatched, even if a backend class happens to define them
+BLOCKED_METHOD_NAMES = {"kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"}
+
+
+# Arithmetic that models write in arguments (eg, `amount=100*1.1`), folded into a literal when the call is parsed
+ARITHMETIC_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+# Keeps `**` from producing numbers that take forever to compute
+MAX_POWER_EXPONENT = 10000
+# Side-effect-free builtins that can be called like a backend method (eg, `str(get_balance())`); backend methods take precedence
+SAFE_BUILTIN_FUNCTIONS = {
+    function.__name__: function
+    for function in [abs, bool, float, int, len, max, min, round, sorted, str, sum]
+}
+
+
+class ParsedCall(NamedTuple):
+    method_name: str
+    # Literal argument values; a nested call appears as another `ParsedCall`, and is executed before the outer one
+    args: tuple
+    kwargs: dict
+
+
+def _parse_argument(node: ast.expr):
+    if isinstance(node, ast.Call):
+        return _parse_call_node(node)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        elements = [_parse_argument(element) for element in node.elts]
+        if isinstance(node, ast.List):
+            return elements
+        return tuple(elements) if isinstance(node, ast.Tuple) else set(elements)
+    if isinstance(node, ast.Dict) and None not in node.keys:
+        return {
+            _parse_argument(key): _parse_argument(value)
+            for key, value in zip(node.keys, node.values)
+        }
+    if isinstance(node, (ast.BinOp, ast.UnaryOp)) and type(node.op) in ARITHMETIC_OPERATORS:
+        return _fold_arithmetic(node)
+    if isinstance(node, ast.Constant):
+        return node.value
+    # Variables, attribute access and other expressions are rejected. The message goes back to the model and into the
+    # response cache key, so it must only depend on the call itself.
+    if isinstance(node, ast.Name):
+        raise NameError(f"name '{node.id}' is not defined")
+    raise ValueError(f"Expression {ast.unparse(node)} is not allowed.")
+
+
+def _fold_arithmetic(node: ast.expr):
+    if isinstance(node, ast.UnaryOp):
+        operands = [_parse_argument(node.operand)]
+    else:
+        operands = [_parse_argument(node.left), _parse_argument(node.right)]
+
+    # Numbers only, except for joining two strings with `+`
+    is_string_concatenation = isinstance(node.op, ast.Add) and all(
+        isinstance(operand, str) for operand in operands
+    )
+    if not is_string_concatenation and not all(
+        isinstance(operand, (int, float, complex)) for operand in operands
+    ):
+        raise ValueError(f"Expression {ast.unparse(node)} is not allowed.")
+    if isinstance(node.op, ast.Pow) and abs(operands[1]) > MAX_POWER_EXPONENT:
+        raise ValueError(f"Exponent in {ast.unparse(node)} is too large.")
 
-def execute_multi_turn_func_call(
-    func_call_list: list[str],  # a list of strings of func calls
-    initial_config: dict,
-    involved_classes: list,
-    model_name: str,
-    test_entry_id: str,
-    long_context: bool = False,
-    is_evaL_run: bool = False,
-) -> tuple[list[str], dict]:
+    return ARITHMETIC_OPERATORS[type(node.op)](*operands)
+
+
+def _parse_call_node(node: ast.Call) -> ParsedCall:
+    if not isinstance(node.func, ast.Name):
+        raise ValueError(f"Function call {ast.unparse(node.func)} is not allowed.")
+    if node.func.id in BLOCKED_METHOD_NAMES:
+        raise ValueError(f"Function call {node.func.id} is not allowed.")
+    if any(keyword.arg is None for keyword in node.keywords):
+        raise ValueError("Unpacking keyword arguments is not allowed.")
+    keyword_names = set()
+    for keyword in node.keywords:
+        if keyword.arg in keyword_names:
+            # Same error as compiling the call would raise
+            raise SyntaxError(
+                f"keyword argument repeated: {keyword.arg}",
+                ("<string>", keyword.lineno, keyword.col_offset + 1, None),
+            )
+        keyword_names.add(keyword.arg)
+    return ParsedCall(
+        method_name=node.func.id,
+        args=tuple(_parse_argument(arg) for arg in node.args),
+        kwargs={keyword.arg: _parse_argument(keyword.value) for keyword in node.keywords},
+    )
+
+
+@lru_cache(maxsize=65536)
+def parse_func_call(func_call: str) -> ParsedCall:
     """
-    TODO: Add docstring
+    Parse a function call string, such as `cd(folder='document')`, into its method name and literal arguments.
+    The same calls are executed over and over (eg, the ground truth, for every model), so the result is cached; callers must not mutate it.
     """
-    if is_evaL_run:
-        model_name += "_eval"
-
-    class_method_name_mapping = {}
-    involved_instances = {}
-    for class_name in involved_classes:
-        module_name = CLASS_FILE_PATH_MAPPING[class_name]
-        # TODO: Handler the model name issue from handler more elegantly
-        instance_name = (
-            f"{model_name.replace('-', '_').replace('.', '_').replace('/', '_')}_{test_entry_id}_{class_name.lower()}_instance"
-        )
-        if instance_name not in globals():
-            module = importlib.import_module(module_name)
-            class_ = getattr(module, class_name)
-            class_instance = class_()
+    node = ast.parse(func_call.strip(), filename="<string>", mode="eval").body
+    if not isinstance(node, ast.Call):
+        raise ValueError(f"{func_call} is not a function call.")
+    return _parse_call_node(node)
+
+
+@lru_cache(maxsize=None)
+def get_class_method_names(class_name: str) -> tuple[str, ...]:
+    """
+    The public methods of a backend class that can be called by the model, computed once per class.
+    """
+    class_ = getattr(importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name]), class_name)
+    return tuple(
+        method_name
+        for method_name, _ in inspect.getmembers(class_, predicate=inspect.isfunction)
+        if not method_name.startswith("_") and method_name not in BLOCKED_METHOD_NAMES
+    )
+
+
+class ExecutionSession:
+    """
+    Owns the backend instances that one model (or the ground truth) works against for one test entry.
+
+    The instances are created from the entry's initial configuration when the session starts, and keep their state across
+    all the `execute` calls of the session, ie, across all steps and turns of the entry. Sessions share no state with each
+    other, so different entries and models can be executed concurrently from different threads.
+    Call `close` (or use the session as a context manager) to release the instances once the entry is done.
+    """
+
+    def __init__(
+        self, initial_config: dict, involved_classes: list, long_context: bool = False
+    ) -> None:
+        self.instances: dict = {}
+        # Method name -> (class name, bound method). Only the public methods of the involved classes can be called.
+        self._dispatch_table: dict = {}
+        # Class name -> attribute name -> number of calls so far that may have changed the attribute
+        self._state_versions: dict = {}
+        self._last_state_snapshot: dict = {}
+        # Class name -> attribute name -> (version, live value) at the time of the last snapshot
+        self._last_snapshot_versions: dict = {}
+        for class_name in involved_classes:
+            module = importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name])
+            class_instance = getattr(module, class_name)()
             if class_name not in STATELESS_CLASSES:
                 class_initial_config = initial_config.get(class_name, {})
                 # Deep copy the initial configuration to avoid mutation issues
                 class_instance._load_scenario(
                     copy.deepcopy(class_initial_config), long_context=long_context
                 )
-            globals()[instance_name] = class_instance
-        # This happens in subsequent turns
-        else:
-            class_instance = globals()[instance_name]
-
-        involved_instances[class_name] = class_instance
-
-        # Retrieve all method names and map them to the instance
-        for method_name, method in inspect.getmembers(
-            class_instance, predicate=inspect.ismethod
-        ):
-            # Skip private methods
-            if method_name.startswith("_"):
-                continue
-            class_method_name_mapping[method_name] = instance_name
+            self.instances[class_name] = class_instance
+            self._state_versions[class_name] = defaultdict(int)
 
-    execution_results = []
-    for func_call in func_call_list:
-        # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
+            for method_name in get_class_method_names(class_name):
+                self._dispatch_table[method_name] = (
+                    class_name,
+                    getattr(class_instance, method_name),
+                )
 
-        # Evaluate the function call
-        try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error. 
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
-
-            if type(func_call_result) == str:
-                pass
-            elif type(func_call_result) == dict:
-                # Some function returns a object instance, which is not serializable
-                try:
-                    func_call_result = json.dumps(func_call_result)
-                except:
-                    func_call_result = str(func_call_result)
-            else:
-                func_call_result = str(func_call_result)
+    def __enter__(self) -> "ExecutionSession":
+        return self
 
-            execution_results.append(func_call_result)
-        except Exception as e:
-            execution_results.append(f"Error during execution: {str(e)}")
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
-    return execution_results, involved_instances
+    def close(self) -> None:
+        self.instances = {}
+        self._dispatch_table = {}
+        self._state_versions = {}
+        self._last_state_snapshot = {}
+        self._last_snapshot_versions = {}
 
+    def snapshot_state(self) -> dict[str, dict]:
+        """
+        Take a read-only snapshot of the state of the stateful instances, ie, their public attributes, keyed by class name and attribute name.
 
-def is_empty_execute_response(input_list: list):
-    if len(input_list) == 0:
-        return True
-    if len(input_list) == 1 and len(input_list[0]) == 0:
-        return True
-    return False
+        Changes are tracked when they are written rather than found by comparing states: every call to a backend method bumps
+        the version of the attributes that the method declares with `writes_state` (all of them, if it declares nothing).
+        Snapshots share structure: an attribute whose version did not move since the previous snapshot of this session, and
+        that is still bound to the same object, reuses that snapshot's copy; only the other attributes are copied. An attribute
+        that is the very same object in two snapshots is therefore known to be unchanged, which `state_checker` uses to skip
+        re-comparing it.
+        """
+        state_snapshot = {}
+        snapshot_versions = {}
+        for class_name, class_instance in self.instances.items():
+            if class_name in STATELESS_CLASSES:
+                continue
+            previous_class_snapshot = self._last_state_snapshot.get(class_name, {})
+            previous_class_versions = self._last_snapshot_versions.get(class_name, {})
+            state_versions = self._state_versions[class_name]
+            class_snapshot = {}
+            class_versions = {}
+            for attr_name, value in vars(class_instance).items():
+                if attr_name.startswith("_"):
+                    continue
+                version = state_versions[attr_name]
+                previous_version = previous_class_versions.get(attr_name)
+                if (
+                    previous_version is not None
+                    and previous_version[0] == version
+                    and previous_version[1] is value
+                ):
+                    class_snapshot[attr_name] = previous_class_snapshot[attr_name]
+                else:
+                    class_snapshot[attr_name] = copy.deepcopy(value)
+                class_versions[attr_name] = (version, value)
+            state_snapshot[class_name] = class_snapshot
+            snapshot_versions[class_name] = class_versions
 
+        self._last_state_snapshot = state_snapshot
+        self._last_snapshot_versions = snapshot_versions
+        return state_snapshot
 
-def _process_method_calls(function_call_string: str, instance_mapping: dict) -> str:
-    """
-    Prepends the instance name to the function name for each of the function name represented in the string, you will
-    also be provided with the mapping of method name to instance name.
+    def _invoke(self, parsed_call: ParsedCall):
+        class_name, method = self._dispatch_table.get(
+            parsed_call.method_name,
+            (None, SAFE_BUILTIN_FUNCTIONS.get(parsed_call.method_name)),
+        )
+        if method is None:
+            raise NameError(f"name '{parsed_call.method_name}' is not defined")
+        # The parsed arguments are cached and shared, so the backend gets its own copy to mutate
+        args = [self._resolve_argument(arg) for arg in copy.deepcopy(parsed_call.args)]
+        kwargs = {
+            key: self._resolve_argument(value)
+            for key, value in copy.deepcopy(parsed_call.kwargs).items()
+        }
+        try:
+            return method(*args, **kwargs)
+        finally:
+            # A method that fails halfway may still have changed the state
+            if class_name is not None:
+                self._bump_state_versions(class_name, method)
 
-    Example input:
-    ```
-    f(x = g((1, 2), h(3)), y = (4), z = (5, 6))
-    ```
+    def _bump_state_versions(self, class_name: str, method) -> None:
+        written_attr_names = getattr(method, STATE_WRITES_ATTRIBUTE, None)
+        if written_attr_names is None:
+            written_attr_names = [
+                attr_name
+                for attr_name in vars(self.instances[class_name])
+                if not attr_name.startswith("_")
+            ]
+        state_versions = self._state_versions[class_name]
+        for attr_name in written_attr_names:
+            state_versions[attr_name] += 1
 
-    Example return:
-    ```
-    a.f(x=a.g((1, 2), a.h(3)), y=(4), z=(5, 6))
-    ```
+    def _resolve_argument(self, value):
+        if isinstance(value, ParsedCall):
+            # Backend methods may return their live state (eg, `get_tweet`); the outer method gets a copy, so that it can never
+            # keep a reference that lets one attribute change when another is written
+            return copy.deepcopy(self._invoke(value))
+        if isinstance(value, (list, tuple, set)):
+            return type(value)(self._resolve_argument(element) for element in value)
+        if isinstance(value, dict):
+            return {key: self._resolve_argument(element) for key, element in value.items()}
+        return value
 
-    Args:
-        function_call_string (str): The function call string to parse.
-        class_mapping (dict): A dictionary mapping method names to instance names.
+    def execute(self, func_call_list: list[str]) -> tuple[list[str], dict]:
+        """
+        Execute a list of function call strings against the session's instances, in order.
 
-    Returns:
-        str: The parsed function call string with instance names prepended to method names.
-    """
+        Each call is parsed into a method name and literal arguments (arithmetic on literals is folded), and the method is
+        looked up in the session's dispatch table, then among a few side-effect-free builtins; nothing is `eval`ed, so only
+        the public methods of the involved classes and those builtins can ever be reached.
+
+        Returns the execution result of each call, as a string, and the instances keyed by class name.
+        """
+        execution_results = []
+        for func_call in func_call_list:
+            try:
+                func_call_result = self._invoke(parse_func_call(func_call))
+
+                if type(func_call_result) == str:
+                    pass
+                elif type(func_call_result) == dict:
+                    # Some function returns a object instance, which is not serializable
+                    try:
+                        func_call_result = json.dumps(func_call_result)
+                    except:
+                        func_call_result = str(func_call_result)
+                else:
+                    func_call_result = str(func_call_result)
 
-    def replace_function(match):
-        func_name = match.group(1)
-        if func_name in instance_mapping:
-            return f"{instance_mapping[func_name]}.{func_name}"
-        return func_name
+                execution_results.append(func_call_result)
+            except Exception as e:
+                execution_results.append(f"Error during execution: {str(e)}")
 
-    # Regular expression to match function names
-    pattern = r"\b([a-zA-Z_]\w*)\s*(?=\()"
+        return execution_results, self.instances
 
-    # Replace function names with their class-prepended versions
-    processed_string = re.sub(pattern, replace_function, function_call_string)
 
-    return processed_string
+def is_empty_execute_response(input_list: list):
+    if len(input_list) == 0:
+        return True
+    if len(input_list) == 1 and len(input_list[0]) == 0:
+        return True
+    return False
@@ -2,7 +2,7 @@ import json
 import os
 import time
 
-from anthropic import Anthropic, RateLimitError
+from anthropic import Anthropic, AsyncAnthropic, RateLimitError
 from anthropic.types import TextBlock, ToolUseBlock
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
@@ -27,6 +27,7 @@ class ClaudeHandler(BaseHandler):
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.Anthropic
         self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.async_client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     def decode_ast(self, result, language="Python"):
         if "FC" not in self.model_name:
@@ -78,6 +79,14 @@ class ClaudeHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self.async_client.messages.create(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
     def _get_max_tokens(self):
         """
         max_tokens is required to be set when querying, so we default to the model's max tokens
@@ -94,6 +103,14 @@ class ClaudeHandler(BaseHandler):
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_FC_request(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_FC_request(inference_data)
+        )
+
+    def _prepare_FC_request(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {
             "message": repr(inference_data["message"]),
             "tools": inference_data["tools"],
@@ -115,14 +132,14 @@ class ClaudeHandler(BaseHandler):
 
         # Need to set timeout to avoid auto-error when requesting large context length
         # https://github.com/anthropics/anthropic-sdk-python#long-requests
-        return self.generate_with_backoff(
-            model=self.model_name.strip("-FC"),
-            max_tokens=self._get_max_tokens(),
-            tools=inference_data["tools"],
-            temperature=self.temperature,
-            messages=messages,
-            timeout=1200,
-        )
+        return {
+            "model": self.model_name.strip("-FC"),
+            "max_tokens": self._get_max_tokens(),
+            "tools": inference_data["tools"],
+            "temperature": self.temperature,
+            "messages": messages,
+            "timeout": 1200,
+        }
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         for round_idx in range(len(test_entry["question"])):
@@ -243,6 +260,14 @@ class ClaudeHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_prompting_request(inference_data))
+
+    async def _query_prompting_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_prompting_request(inference_data)
+        )
+
+    def _prepare_prompting_request(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {
             "message": repr(inference_data["message"]),
             "system_prompt": inference_data["system_prompt"],
@@ -264,14 +289,14 @@ class ClaudeHandler(BaseHandler):
 
         # Need to set timeout to avoid auto-error when requesting large context length
         # https://github.com/anthropics/anthropic-sdk-python#long-requests
-        return self.generate_with_backoff(
-            model=self.model_name,
-            max_tokens=self._get_max_tokens(),
-            temperature=self.temperature,
-            system=inference_data["system_prompt"],
-            messages=inference_data["message"],
-            timeout=1200,
-        )
+        return {
+            "model": self.model_name,
+            "max_tokens": self._get_max_tokens(),
+            "temperature": self.temperature,
+            "system": inference_data["system_prompt"],
+            "messages": inference_data["message"],
+            "timeout": 1200,
+        }
 
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
@@ -19,10 +19,11 @@ class DatabricksHandler(OpenAICompletionsHandler):
         self.model_style = ModelStyle.OpenAI_Completions
 
         # NOTE: To run the Databricks model, you need to provide your own Databricks API key and your own Azure endpoint URL.
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             api_key=os.getenv("DATABRICKS_API_KEY"),
             base_url=os.getenv("DATABRICKS_AZURE_ENDPOINT_URL"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     def decode_ast(self, result, language="Python"):
         func = re.sub(r"'([^']*)'", r"\1", result)
@@ -7,7 +7,8 @@ class DMCitoHandler(MiningHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url= os.getenv("DMCITO_BASE_URL"),
             api_key=os.getenv("DMCITO_API_KEY"),
-        )
\ No newline at end of file
+        )
+        self.client = OpenAI(**self.client_kwargs)
\ No newline at end of file
@@ -11,10 +11,11 @@ class FireworksHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.FIREWORK_AI
 
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://api.fireworks.ai/inference/v1",
             api_key=os.getenv("FIREWORKS_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     #### FC methods ####
 
@@ -8,4 +8,5 @@ class FunctionaryHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
 
-        self.client = OpenAI(base_url="http://localhost:8000/v1", api_key="functionary")
+        self.client_kwargs = dict(base_url="http://localhost:8000/v1", api_key="functionary")
+        self.client = OpenAI(**self.client_kwargs)
@@ -80,9 +80,25 @@ class GeminiHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_message_pattern=r".*RESOURCE_EXHAUSTED.*")
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self.client.aio.models.generate_content(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_FC_request(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_FC_request(inference_data)
+        )
+
+    def _prepare_FC_request(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {
             "message": repr(inference_data["message"]),
             "tools": inference_data["tools"],
@@ -101,11 +117,11 @@ class GeminiHandler(BaseHandler):
         if len(inference_data["tools"]) > 0:
             config.tools = [Tool(function_declarations=inference_data["tools"])]
 
-        return self.generate_with_backoff(
-            model=self.model_name.replace("-FC", ""),
-            contents=inference_data["message"],
-            config=config,
-        )
+        return {
+            "model": self.model_name.replace("-FC", ""),
+            "contents": inference_data["message"],
+            "config": config,
+        }
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
 
@@ -237,6 +253,14 @@ class GeminiHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_prompting_request(inference_data))
+
+    async def _query_prompting_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_prompting_request(inference_data)
+        )
+
+    def _prepare_prompting_request(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {
             "message": repr(inference_data["message"]),
             "system_prompt": inference_data.get("system_prompt", None),
@@ -250,12 +274,11 @@ class GeminiHandler(BaseHandler):
         if "system_prompt" in inference_data:
             config.system_instruction = inference_data["system_prompt"]
 
-        api_response = self.generate_with_backoff(
-            model=self.model_name.replace("-FC", ""),
-            contents=inference_data["message"],
-            config=config,
-        )
-        return api_response
+        return {
+            "model": self.model_name.replace("-FC", ""),
+            "contents": inference_data["message"],
+            "config": config,
+        }
 
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
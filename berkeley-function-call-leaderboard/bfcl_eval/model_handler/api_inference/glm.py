@@ -10,9 +10,10 @@ import httpx
 class GLMAPIHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             api_key=os.getenv("GLM_API_KEY"),
             base_url="https://open.bigmodel.cn/api/paas/v4/",
             timeout=httpx.Timeout(timeout=300.0, connect=8.0)
         )
+        self.client = OpenAI(**self.client_kwargs)
         self.is_fc_model = True
@@ -9,6 +9,7 @@ class GoGoAgentHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature)
         self.is_fc_model = False
 
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://api.gogoagent.ai", api_key=os.getenv("GOGOAGENT_API_KEY")
         )
+        self.client = OpenAI(**self.client_kwargs)
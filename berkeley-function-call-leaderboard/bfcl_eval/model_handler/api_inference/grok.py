@@ -9,10 +9,11 @@ from typing import Any
 class GrokHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://api.x.ai/v1",
             api_key=os.getenv("GROK_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
         self.is_fc_model = "FC" in self.model_name
 
     @override
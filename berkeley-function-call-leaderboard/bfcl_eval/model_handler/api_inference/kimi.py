@@ -8,7 +8,8 @@ class KimiHandler(OpenAICompletionsHandler):
     def __init__(self, model_name: str, temperature: float) -> None:
         super().__init__(model_name, temperature)
 
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://platform.moonshot.ai", 
             api_key=os.getenv("KIMI_API_KEY")
         )
+        self.client = OpenAI(**self.client_kwargs)
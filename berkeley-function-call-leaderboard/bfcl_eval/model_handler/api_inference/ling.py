@@ -19,7 +19,8 @@ class LingAPIHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
         api_url = "https://bailingchat.alipay.com"
-        self.client = OpenAI(base_url=api_url, api_key=os.getenv("LING_API_KEY"))
+        self.client_kwargs = dict(base_url=api_url, api_key=os.getenv("LING_API_KEY"))
+        self.client = OpenAI(**self.client_kwargs)
 
     @retry_with_backoff(error_type=[RateLimitError, json.JSONDecodeError])
     def generate_with_backoff(self, **kwargs):
@@ -13,10 +13,11 @@ class MiningHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url= os.getenv("MINING_BASE_URL"),
             api_key=os.getenv("MINING_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     def decode_ast(self, result, language="Python"):
         decoded_output = []
@@ -60,6 +60,22 @@ class MistralHandler(BaseHandler):
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        start_time = time.time()
+        api_response = self.client.chat.complete(**self._prepare_FC_request(inference_data))
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    async def _query_FC_async(self, inference_data: dict):
+        start_time = time.time()
+        api_response = await self.client.chat.complete_async(
+            **self._prepare_FC_request(inference_data)
+        )
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    def _prepare_FC_request(self, inference_data: dict) -> dict:
         message = inference_data["message"]
         tool = inference_data["tools"]
         inference_data["inference_input_log"] = {
@@ -67,16 +83,12 @@ class MistralHandler(BaseHandler):
             "tools": tool,
         }
 
-        start_time = time.time()
-        api_response = self.client.chat.complete(
-            model=self.model_name.replace("-FC", ""),
-            messages=message,
-            tools=tool,
-            temperature=self.temperature,
-        )
-        end_time = time.time()
-
-        return api_response, end_time - start_time
+        return {
+            "model": self.model_name.replace("-FC", ""),
+            "messages": message,
+            "tools": tool,
+            "temperature": self.temperature,
+        }
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -160,19 +172,33 @@ class MistralHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
-        message = inference_data["message"]
-        inference_data["inference_input_log"] = {"message": message}
-
         start_time = time.time()
         api_response = self.client.chat.complete(
-            model=self.model_name,
-            messages=message,
-            temperature=self.temperature,
+            **self._prepare_prompting_request(inference_data)
         )
         end_time = time.time()
 
         return api_response, end_time - start_time
 
+    async def _query_prompting_async(self, inference_data: dict):
+        start_time = time.time()
+        api_response = await self.client.chat.complete_async(
+            **self._prepare_prompting_request(inference_data)
+        )
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    def _prepare_prompting_request(self, inference_data: dict) -> dict:
+        message = inference_data["message"]
+        inference_data["inference_input_log"] = {"message": message}
+
+        return {
+            "model": self.model_name,
+            "messages": message,
+            "temperature": self.temperature,
+        }
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
         test_category: str = test_entry["id"].rsplit("_", 1)[0]
@@ -9,10 +9,11 @@ class NovitaHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.NOVITA_AI
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://api.novita.ai/v3/openai",
             api_key=os.getenv("NOVITA_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     #### FC methods ####
 
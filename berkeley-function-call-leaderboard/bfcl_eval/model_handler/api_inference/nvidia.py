@@ -15,10 +15,11 @@ class NvidiaHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://integrate.api.nvidia.com/v1",
             api_key=os.getenv("NVIDIA_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     def decode_ast(self, result, language="Python"):
         result = result.replace("\n", "")
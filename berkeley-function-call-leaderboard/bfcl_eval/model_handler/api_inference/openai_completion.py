@@ -1,6 +1,7 @@
 import json
 import os
 import time
+from functools import cached_property
 from typing import Any
 
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
@@ -16,14 +17,17 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 
 
 class OpenAICompletionsHandler(BaseHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Both the sync and the async client are built from these, so that they send identical requests.
+        # Subclasses pointing at other OpenAI-compatible endpoints set their own `client_kwargs` before building `self.client`.
+        self.client_kwargs = dict(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(**self.client_kwargs)
 
     def decode_ast(self, result, language="Python"):
         if "FC" in self.model_name or self.is_fc_model:
@@ -50,9 +54,47 @@ class OpenAICompletionsHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self.async_client.chat.completions.create(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
+    @cached_property
+    def async_client(self) -> AsyncOpenAI:
+        return AsyncOpenAI(**self.client_kwargs)
+
+    def _supports_native_async(self, query_method_name: str) -> bool:
+        """
+        Whether `query_method_name` can be served by `AsyncOpenAI` directly.
+        Subclasses that customise the blocking query path (different SDK client, request shape or retry policy) fall back to running it in a worker thread.
+        """
+        handler_class = type(self)
+        return (
+            isinstance(self.client, OpenAI)
+            # A client built without updating `client_kwargs` would send the async requests elsewhere
+            and self.client.base_url == self.async_client.base_url
+            and getattr(handler_class, query_method_name)
+            is getattr(OpenAICompletionsHandler, query_method_name)
+            and handler_class.generate_with_backoff
+            is OpenAICompletionsHandler.generate_with_backoff
+        )
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_FC_request(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        if not self._supports_native_async("_query_FC"):
+            return await super()._query_FC_async(inference_data)
+        return await self.generate_with_backoff_async(
+            **self._prepare_FC_request(inference_data)
+        )
+
+    def _prepare_FC_request(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -67,7 +109,7 @@ class OpenAICompletionsHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -194,15 +236,25 @@ class OpenAICompletionsHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
-        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+        return self.generate_with_backoff(**self._prepare_prompting_request(inference_data))
 
-        return self.generate_with_backoff(
-            messages=inference_data["message"],
-            model=self.model_name,
-            temperature=self.temperature,
-            store=False,
+    async def _query_prompting_async(self, inference_data: dict):
+        if not self._supports_native_async("_query_prompting"):
+            return await super()._query_prompting_async(inference_data)
+        return await self.generate_with_backoff_async(
+            **self._prepare_prompting_request(inference_data)
         )
 
+    def _prepare_prompting_request(self, inference_data: dict) -> dict:
+        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+
+        return {
+            "messages": inference_data["message"],
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "store": False,
+        }
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
         test_category: str = test_entry["id"].rsplit("_", 1)[0]
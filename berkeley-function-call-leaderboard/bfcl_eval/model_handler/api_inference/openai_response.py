@@ -15,7 +15,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 from openai.types.responses import Response
 
 
@@ -23,7 +23,10 @@ class OpenAIResponsesHandler(BaseHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Responses
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Both clients are built from the same options, so that they send identical requests
+        self.client_kwargs = dict(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(**self.client_kwargs)
+        self.async_client = AsyncOpenAI(**self.client_kwargs)
 
     @staticmethod
     def _substitute_prompt_role(prompts: list[dict]) -> list[dict]:
@@ -61,9 +64,25 @@ class OpenAIResponsesHandler(BaseHandler):
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def generate_with_backoff_async(self, **kwargs):
+        start_time = time.time()
+        api_response = await self.async_client.responses.create(**kwargs)
+        end_time = time.time()
+
+        return api_response, end_time - start_time
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_FC_request(inference_data))
+
+    async def _query_FC_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_FC_request(inference_data)
+        )
+
+    def _prepare_FC_request(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
 
@@ -87,7 +106,7 @@ class OpenAIResponsesHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         for round_idx in range(len(test_entry["question"])):
@@ -181,6 +200,14 @@ class OpenAIResponsesHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
+        return self.generate_with_backoff(**self._prepare_prompting_request(inference_data))
+
+    async def _query_prompting_async(self, inference_data: dict):
+        return await self.generate_with_backoff_async(
+            **self._prepare_prompting_request(inference_data)
+        )
+
+    def _prepare_prompting_request(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
 
         kwargs = {
@@ -195,7 +222,7 @@ class OpenAIResponsesHandler(BaseHandler):
         if "o3" not in self.model_name and "o4-mini" not in self.model_name:
             kwargs["temperature"] = self.temperature
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
@@ -20,10 +20,11 @@ class QwenAPIHandler(OpenAICompletionsHandler):
     def __init__(self, model_name, temperature) -> None:
         super().__init__(model_name, temperature)
         self.model_style = ModelStyle.OpenAI_Completions
-        self.client = OpenAI(
+        self.client_kwargs = dict(
             base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
             api_key=os.getenv("QWEN_API_KEY"),
         )
+        self.client = OpenAI(**self.client_kwargs)
 
     #### FC methods ####
 
@@ -1,6 +1,6 @@
-import json
+import asyncio
 import time
-from copy import deepcopy
+from typing import Optional
 
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.default_prompts import (
@@ -10,12 +10,21 @@ from bfcl_eval.constants.default_prompts import (
 )
 from bfcl_eval.constants.eval_config import RESULT_PATH
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
-    STATELESS_CLASSES,
-    execute_multi_turn_func_call,
+    ExecutionSession,
     is_empty_execute_response,
 )
 from bfcl_eval.model_handler.model_style import ModelStyle
-from bfcl_eval.utils import load_file, make_json_serializable, sort_key
+from bfcl_eval.model_handler.rate_limiter import RateLimiter, get_rate_limiter
+from bfcl_eval.model_handler.response_cache import ResponseCache
+from bfcl_eval.model_handler.result_store import ResultStore
+from bfcl_eval.utils import (
+    append_to_result_log,
+    compact_result_log,
+    json_dumps,
+    load_file,
+    make_json_serializable,
+    sort_key,
+)
 from overrides import final
 
 
@@ -32,6 +41,10 @@ class BaseHandler:
         )
         self.temperature = temperature
         self.is_fc_model = False  # Whether the model is a function calling model
+        # Set by the generation pipeline when `--cache-dir` is given
+        self.response_cache: Optional[ResponseCache] = None
+        # Set by the generation pipeline when `--result-store sqlite` is given
+        self.result_store: Optional[ResultStore] = None
 
     def inference(self, test_entry: dict, include_input_log: bool, exclude_state_log: bool):
         # This method is used to retrive model response for each model.
@@ -54,9 +67,51 @@ class BaseHandler:
             else:
                 return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    async def inference_async(
+        self, test_entry: dict, include_input_log: bool, exclude_state_log: bool
+    ):
+        """
+        Asyncio counterpart of `inference`, used by the `--async-mode` generation engine.
+        Model queries go through `_query_FC_async` / `_query_prompting_async`, so a single event loop can keep many entries in flight.
+        """
+        # FC model
+        # TODO: Let all models have the is_fc_model attribute and remove the "FC" check
+        if "FC" in self.model_name or self.is_fc_model:
+            if "multi_turn" in test_entry["id"]:
+                return await self._inference_multi_turn_FC(
+                    test_entry, include_input_log, exclude_state_log, use_async_client=True
+                )
+            else:
+                return await self._inference_single_turn_FC(
+                    test_entry, include_input_log, use_async_client=True
+                )
+        # Prompting model
+        else:
+            if "multi_turn" in test_entry["id"]:
+                return await self._inference_multi_turn_prompting(
+                    test_entry, include_input_log, exclude_state_log, use_async_client=True
+                )
+            else:
+                return await self._inference_single_turn_prompting(
+                    test_entry, include_input_log, use_async_client=True
+                )
+
     @final
     def inference_multi_turn_FC(
         self, test_entry: dict, include_input_log: bool, exclude_state_log: bool
+    ) -> tuple[list[list], dict]:
+        return _run_to_completion(
+            self._inference_multi_turn_FC(
+                test_entry, include_input_log, exclude_state_log, use_async_client=False
+            )
+        )
+
+    async def _inference_multi_turn_FC(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        use_async_client: bool,
     ) -> tuple[list[list], dict]:
         initial_config: dict = test_entry["initial_config"]
         involved_classes: list = test_entry["involved_classes"]
@@ -79,230 +134,206 @@ class BaseHandler:
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
 
         all_reasoning_content: list[list] = []
-        # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
-        if not exclude_state_log:
-            _, involved_instances = execute_multi_turn_func_call(
-                [],
-                initial_config,
-                involved_classes,
-                self.model_name_underline_replaced,
-                test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=False,
-            )
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
-            all_inference_log.append(state_log)
-
-        inference_data: dict = {}
-        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
-        inference_data = self._compile_tools(inference_data, test_entry)
-
-        all_multi_turn_messages: list[list[dict]] = test_entry["question"]
-        for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
-            current_turn_message: list[dict]
-
-            if str(turn_idx) in holdout_function:
-                test_entry["function"].extend(holdout_function[str(turn_idx)])
-                # Since we have added new functions, we need to recompile the tools
-                inference_data = self._compile_tools(inference_data, test_entry)
-                assert (
-                    len(current_turn_message) == 0
-                ), "Holdout turn should not have user message."
-                current_turn_message = [
-                    {
-                        "role": "user",
-                        "content": DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_FC,
-                    }
-                ]
+        # The backend instances the model works against throughout this entry
+        with ExecutionSession(
+            initial_config,
+            involved_classes,
+            long_context=("long_context" in test_category or "composite" in test_category),
+        ) as execution_session:
+            # Log the initial state of all the instances
+            if not exclude_state_log:
+                state_log = []
+                # Snapshots share the attributes that didn't change since the previous one, and are never modified by later turns
+                for class_name, class_state in execution_session.snapshot_state().items():
+                    state_log.append(
+                        {
+                            "role": "state_info",
+                            "class_name": class_name,
+                            "content": class_state,
+                        }
+                    )
+                all_inference_log.append(state_log)
 
-            if turn_idx == 0:
-                inference_data = self.add_first_turn_message_FC(
-                    inference_data, current_turn_message
-                )
-            else:
-                inference_data = self._add_next_turn_user_message_FC(
-                    inference_data, current_turn_message
-                )
+            inference_data: dict = {}
+            inference_data = self._pre_query_processing_FC(inference_data, test_entry)
+            inference_data = self._compile_tools(inference_data, test_entry)
+
+            all_multi_turn_messages: list[list[dict]] = test_entry["question"]
+            for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
+                current_turn_message: list[dict]
+
+                if str(turn_idx) in holdout_function:
+                    test_entry["function"].extend(holdout_function[str(turn_idx)])
+                    # Since we have added new functions, we need to recompile the tools
+                    inference_data = self._compile_tools(inference_data, test_entry)
+                    assert (
+                        len(current_turn_message) == 0
+                    ), "Holdout turn should not have user message."
+                    current_turn_message = [
+                        {
+                            "role": "user",
+                            "content": DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_FC,
+                        }
+                    ]
 
-            current_turn_response = []
-            current_turn_inference_log: list[dict] = {
-                "begin_of_turn_query": current_turn_message
-            }
-            current_turn_input_token_count: list[float] = []
-            current_turn_output_token_count: list[float] = []
-            current_turn_latency: list[float] = []
-            current_turn_reasoning_content = []
-
-            count = 0
-            while True:
-                print("-" * 100)
-                print(
-                    f"ID: {test_entry_id.replace('multi_turn_', '')}, Turn: {turn_idx}, Step: {count}"
-                )
-                current_step_inference_log: list[dict] = []
-                # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
-                current_turn_inference_log[f"step_{count}"] = current_step_inference_log
+                if turn_idx == 0:
+                    inference_data = self.add_first_turn_message_FC(
+                        inference_data, current_turn_message
+                    )
+                else:
+                    inference_data = self._add_next_turn_user_message_FC(
+                        inference_data, current_turn_message
+                    )
 
-                api_response, query_latency = self._query_FC(inference_data)
+                current_turn_response = []
+                current_turn_inference_log: list[dict] = {
+                    "begin_of_turn_query": current_turn_message
+                }
+                current_turn_input_token_count: list[float] = []
+                current_turn_output_token_count: list[float] = []
+                current_turn_latency: list[float] = []
+                current_turn_reasoning_content = []
+
+                count = 0
+                while True:
+                    print("-" * 100)
+                    print(
+                        f"ID: {test_entry_id.replace('multi_turn_', '')}, Turn: {turn_idx}, Step: {count}"
+                    )
+                    current_step_inference_log: list[dict] = []
+                    # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
+                    current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
-                # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
-                if include_input_log:
-                    current_step_inference_log.append(
-                        {
-                            "role": "inference_input",
-                            "content": inference_data.get("inference_input_log", ""),
-                        }
+                    api_response, query_latency = await self._dispatch_query(
+                        self._query_FC, self._query_FC_async, inference_data, use_async_client
                     )
 
-                # Try parsing the model response
-                model_response_data = self._parse_query_response_FC(api_response)
-                model_responses = model_response_data["model_responses"]
+                    # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
+                    # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
+                    if include_input_log:
+                        current_step_inference_log.append(
+                            {
+                                "role": "inference_input",
+                                "content": inference_data.get("inference_input_log", ""),
+                            }
+                        )
 
-                # Add the assistant message to the chat history
-                inference_data = self._add_assistant_message_FC(
-                    inference_data, model_response_data
-                )
+                    # Try parsing the model response
+                    model_response_data = self._parse_query_response_FC(api_response)
+                    self.rate_limiter.record_token_usage(
+                        model_response_data["input_token"], model_response_data["output_token"]
+                    )
+                    model_responses = model_response_data["model_responses"]
 
-                # Process the metadata
-                current_turn_input_token_count.append(model_response_data["input_token"])
-                current_turn_output_token_count.append(model_response_data["output_token"])
-                current_turn_latency.append(query_latency)
+                    # Add the assistant message to the chat history
+                    inference_data = self._add_assistant_message_FC(
+                        inference_data, model_response_data
+                    )
 
-                current_turn_response.append(model_responses)
+                    # Process the metadata
+                    current_turn_input_token_count.append(model_response_data["input_token"])
+                    current_turn_output_token_count.append(model_response_data["output_token"])
+                    current_turn_latency.append(query_latency)
 
-                reasoning_content = model_response_data.get("reasoning_content", "")
-                current_turn_reasoning_content.append(reasoning_content)
+                    current_turn_response.append(model_responses)
 
-                log_entry = {
-                    "role": "assistant",
-                    "content": model_responses,
-                }
-                if reasoning_content:
-                    log_entry["reasoning_content"] = reasoning_content
+                    reasoning_content = model_response_data.get("reasoning_content", "")
+                    current_turn_reasoning_content.append(reasoning_content)
 
-                current_step_inference_log.append(log_entry)
+                    log_entry = {
+                        "role": "assistant",
+                        "content": model_responses,
+                    }
+                    if reasoning_content:
+                        log_entry["reasoning_content"] = reasoning_content
 
-                # Try decoding the model response
-                try:
-                    decoded_model_responses = self.decode_execute(model_responses)
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": "Successfully decoded model response.",
-                            "model_response_decoded": decoded_model_responses,
-                        }
-                    )
+                    current_step_inference_log.append(log_entry)
 
-                    if is_empty_execute_response(decoded_model_responses):
-                        print("Empty response from the model. Proceed to next turn.")
+                    # Try decoding the model response
+                    try:
+                        decoded_model_responses = self.decode_execute(model_responses)
                         current_step_inference_log.append(
                             {
                                 "role": "handler_log",
-                                "content": f"Empty response from the model. Proceed to next turn.",
+                                "content": "Successfully decoded model response.",
                                 "model_response_decoded": decoded_model_responses,
                             }
                         )
-                        break
 
-                except Exception as e:
-                    print("Failed to decode the model response. Proceed to next turn.")
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": f"Error decoding the model response. Proceed to next turn.",
-                            "error": str(e),
-                        }
-                    )
-                    break
-
-                # Obtain the execution results
-                execution_results, involved_instances = execute_multi_turn_func_call(
-                    decoded_model_responses,
-                    initial_config,
-                    involved_classes,
-                    self.model_name_underline_replaced,
-                    test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=False,
-                )
+                        if is_empty_execute_response(decoded_model_responses):
+                            print("Empty response from the model. Proceed to next turn.")
+                            current_step_inference_log.append(
+                                {
+                                    "role": "handler_log",
+                                    "content": f"Empty response from the model. Proceed to next turn.",
+                                    "model_response_decoded": decoded_model_responses,
+                                }
+                            )
+                            break
+
+                    except Exception as e:
+                        print("Failed to decode the model response. Proceed to next turn.")
+                        current_step_inference_log.append(
+                            {
+                                "role": "handler_log",
+                                "content": f"Error decoding the model response. Proceed to next turn.",
+                                "error": str(e),
+                            }
+                        )
+                        break
 
-                # Add the execution results to the chat history for the next turn
-                inference_data = self._add_execution_results_FC(
-                    inference_data, execution_results, model_response_data
-                )
+                    # Obtain the execution results
+                    execution_results, _ = execution_session.execute(decoded_model_responses)
 
-                for execution_result in execution_results:
-                    current_step_inference_log.append(
-                        {
-                            "role": "tool",
-                            "content": execution_result,
-                        }
+                    # Add the execution results to the chat history for the next turn
+                    inference_data = self._add_execution_results_FC(
+                        inference_data, execution_results, model_response_data
                     )
 
-                count += 1
-                # Force quit after too many steps
-                if count > MAXIMUM_STEP_LIMIT:
-                    force_quit = True
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": f"Model has been forced to quit after {MAXIMUM_STEP_LIMIT} steps.",
-                        }
-                    )
+                    for execution_result in execution_results:
+                        current_step_inference_log.append(
+                            {
+                                "role": "tool",
+                                "content": execution_result,
+                            }
+                        )
 
-                    break
+                    count += 1
+                    # Force quit after too many steps
+                    if count > MAXIMUM_STEP_LIMIT:
+                        force_quit = True
+                        current_step_inference_log.append(
+                            {
+                                "role": "handler_log",
+                                "content": f"Model has been forced to quit after {MAXIMUM_STEP_LIMIT} steps.",
+                            }
+                        )
 
-            # Add to the total list
-            all_model_response.append(current_turn_response)
-            all_inference_log.append(current_turn_inference_log)
-            all_reasoning_content.append(current_turn_reasoning_content)
-            total_input_token_count.append(current_turn_input_token_count)
-            total_output_token_count.append(current_turn_output_token_count)
-            total_latency.append(current_turn_latency)
+                        break
 
-            if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if class_name in STATELESS_CLASSES:
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
-                all_inference_log.append(state_log)
+                # Add to the total list
+                all_model_response.append(current_turn_response)
+                all_inference_log.append(current_turn_inference_log)
+                all_reasoning_content.append(current_turn_reasoning_content)
+                total_input_token_count.append(current_turn_input_token_count)
+                total_output_token_count.append(current_turn_output_token_count)
+                total_latency.append(current_turn_latency)
+
+                if not exclude_state_log:
+                    state_log = []
+                    # Snapshots share the attributes that didn't change since the previous one, and are never modified by later turns
+                    for class_name, class_state in execution_session.snapshot_state().items():
+                        state_log.append(
+                            {
+                                "role": "state_info",
+                                "class_name": class_name,
+                                "content": class_state,
+                            }
+                        )
+                    all_inference_log.append(state_log)
 
-            if force_quit:
-                break
+                if force_quit:
+                    break
 
         metadata = {
             "input_token_count": total_input_token_count,
@@ -322,6 +353,19 @@ class BaseHandler:
     @final
     def inference_multi_turn_prompting(
         self, test_entry: dict, include_input_log: bool, exclude_state_log: bool
+    ) -> tuple[list[list], dict]:
+        return _run_to_completion(
+            self._inference_multi_turn_prompting(
+                test_entry, include_input_log, exclude_state_log, use_async_client=False
+            )
+        )
+
+    async def _inference_multi_turn_prompting(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        use_async_client: bool,
     ) -> tuple[list[list], dict]:
         initial_config: dict = test_entry["initial_config"]
         involved_classes: list = test_entry["involved_classes"]
@@ -343,226 +387,202 @@ class BaseHandler:
         all_inference_log: list[list[dict]] = []
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
 
-        # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
-        if not exclude_state_log:
-            _, involved_instances = execute_multi_turn_func_call(
-                [],
-                initial_config,
-                involved_classes,
-                self.model_name_underline_replaced,
-                test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=False,
-            )
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
-            all_inference_log.append(state_log)
+        # The backend instances the model works against throughout this entry
+        with ExecutionSession(
+            initial_config,
+            involved_classes,
+            long_context=("long_context" in test_category or "composite" in test_category),
+        ) as execution_session:
+            # Log the initial state of all the instances
+            if not exclude_state_log:
+                state_log = []
+                # Snapshots share the attributes that didn't change since the previous one, and are never modified by later turns
+                for class_name, class_state in execution_session.snapshot_state().items():
+                    state_log.append(
+                        {
+                            "role": "state_info",
+                            "class_name": class_name,
+                            "content": class_state,
+                        }
+                    )
+                all_inference_log.append(state_log)
 
-        inference_data: dict = self._pre_query_processing_prompting(test_entry)
+            inference_data: dict = self._pre_query_processing_prompting(test_entry)
 
-        all_multi_turn_messages: list[list[dict]] = test_entry["question"]
-        for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
-            current_turn_message: list[dict]
-
-            if str(turn_idx) in holdout_function:
-                assert (
-                    len(current_turn_message) == 0
-                ), "Holdout turn should not have user message."
-                current_turn_message = [
-                    {
-                        "role": "user",
-                        "content": DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_PROMPTING.format(
-                            functions=holdout_function[str(turn_idx)]
-                        ),
-                    }
-                ]
+            all_multi_turn_messages: list[list[dict]] = test_entry["question"]
+            for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
+                current_turn_message: list[dict]
 
-            if turn_idx == 0:
-                inference_data = self.add_first_turn_message_prompting(
-                    inference_data, current_turn_message
-                )
-            else:
-                inference_data = self._add_next_turn_user_message_prompting(
-                    inference_data, current_turn_message
-                )
+                if str(turn_idx) in holdout_function:
+                    assert (
+                        len(current_turn_message) == 0
+                    ), "Holdout turn should not have user message."
+                    current_turn_message = [
+                        {
+                            "role": "user",
+                            "content": DEFAULT_USER_PROMPT_FOR_ADDITIONAL_FUNCTION_PROMPTING.format(
+                                functions=holdout_function[str(turn_idx)]
+                            ),
+                        }
+                    ]
 
-            current_turn_response = []
-            current_turn_reasoning_content = []
-            current_turn_inference_log: list[dict] = {
-                "begin_of_turn_query": current_turn_message
-            }
-            current_turn_input_token_count: list[float] = []
-            current_turn_output_token_count: list[float] = []
-            current_turn_latency: list[float] = []
-
-            count = 0
-            while True:
-                print("-" * 100)
-                print(
-                    f"ID: {test_entry_id.replace('multi_turn_', '')}, Turn: {turn_idx}, Step: {count}"
-                )
-                current_step_inference_log: list[dict] = []
-                # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
-                current_turn_inference_log[f"step_{count}"] = current_step_inference_log
+                if turn_idx == 0:
+                    inference_data = self.add_first_turn_message_prompting(
+                        inference_data, current_turn_message
+                    )
+                else:
+                    inference_data = self._add_next_turn_user_message_prompting(
+                        inference_data, current_turn_message
+                    )
 
-                api_response, query_latency = self._query_prompting(inference_data)
+                current_turn_response = []
+                current_turn_reasoning_content = []
+                current_turn_inference_log: list[dict] = {
+                    "begin_of_turn_query": current_turn_message
+                }
+                current_turn_input_token_count: list[float] = []
+                current_turn_output_token_count: list[float] = []
+                current_turn_latency: list[float] = []
+
+                count = 0
+                while True:
+                    print("-" * 100)
+                    print(
+                        f"ID: {test_entry_id.replace('multi_turn_', '')}, Turn: {turn_idx}, Step: {count}"
+                    )
+                    current_step_inference_log: list[dict] = []
+                    # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
+                    current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
-                # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
-                if include_input_log:
-                    current_step_inference_log.append(
-                        {
-                            "role": "inference_input",
-                            "content": inference_data.get("inference_input_log", ""),
-                        }
+                    api_response, query_latency = await self._dispatch_query(
+                        self._query_prompting, self._query_prompting_async, inference_data, use_async_client
                     )
 
-                # Try parsing the model response
-                model_response_data = self._parse_query_response_prompting(api_response)
-                model_responses = model_response_data["model_responses"]
+                    # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
+                    # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
+                    if include_input_log:
+                        current_step_inference_log.append(
+                            {
+                                "role": "inference_input",
+                                "content": inference_data.get("inference_input_log", ""),
+                            }
+                        )
 
-                # Add the assistant message to the chat history
-                inference_data = self._add_assistant_message_prompting(
-                    inference_data, model_response_data
-                )
+                    # Try parsing the model response
+                    model_response_data = self._parse_query_response_prompting(api_response)
+                    self.rate_limiter.record_token_usage(
+                        model_response_data["input_token"], model_response_data["output_token"]
+                    )
+                    model_responses = model_response_data["model_responses"]
 
-                # Process the metadata
-                current_turn_input_token_count.append(model_response_data["input_token"])
-                current_turn_output_token_count.append(model_response_data["output_token"])
-                current_turn_latency.append(query_latency)
+                    # Add the assistant message to the chat history
+                    inference_data = self._add_assistant_message_prompting(
+                        inference_data, model_response_data
+                    )
 
-                current_turn_response.append(model_responses)
-                reasoning_content = model_response_data.get("reasoning_content", "")
-                current_turn_reasoning_content.append(reasoning_content)
+                    # Process the metadata
+                    current_turn_input_token_count.append(model_response_data["input_token"])
+                    current_turn_output_token_count.append(model_response_data["output_token"])
+                    current_turn_latency.append(query_latency)
 
-                log_entry = {
-                    "role": "assistant",
-                    "content": model_responses,
-                }
-                if reasoning_content:
-                    log_entry["reasoning_content"] = reasoning_content
+                    current_turn_response.append(model_responses)
+                    reasoning_content = model_response_data.get("reasoning_content", "")
+                    current_turn_reasoning_content.append(reasoning_content)
 
-                current_step_inference_log.append(log_entry)
+                    log_entry = {
+                        "role": "assistant",
+                        "content": model_responses,
+                    }
+                    if reasoning_content:
+                        log_entry["reasoning_content"] = reasoning_content
 
-                # Try decoding the model response
-                try:
-                    decoded_model_responses = self.decode_execute(model_responses)
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": "Successfully decoded model response.",
-                            "model_response_decoded": decoded_model_responses,
-                        }
-                    )
+                    current_step_inference_log.append(log_entry)
 
-                    model_response_data["model_responses_decoded"] = decoded_model_responses
-                    if is_empty_execute_response(decoded_model_responses):
-                        print("Empty response from the model. Proceed to next turn.")
+                    # Try decoding the model response
+                    try:
+                        decoded_model_responses = self.decode_execute(model_responses)
                         current_step_inference_log.append(
                             {
                                 "role": "handler_log",
-                                "content": f"Empty response from the model. Proceed to next turn.",
+                                "content": "Successfully decoded model response.",
                                 "model_response_decoded": decoded_model_responses,
                             }
                         )
-                        break
 
-                except Exception as e:
-                    print("Failed to decode the model response. Proceed to next turn.")
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": f"Error decoding the model response. Proceed to next turn.",
-                            "error": str(e),
-                        }
-                    )
-                    break
-
-                # Obtain the execution results
-                execution_results, involved_instances = execute_multi_turn_func_call(
-                    decoded_model_responses,
-                    initial_config,
-                    involved_classes,
-                    self.model_name_underline_replaced,
-                    test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=False,
-                )
+                        model_response_data["model_responses_decoded"] = decoded_model_responses
+                        if is_empty_execute_response(decoded_model_responses):
+                            print("Empty response from the model. Proceed to next turn.")
+                            current_step_inference_log.append(
+                                {
+                                    "role": "handler_log",
+                                    "content": f"Empty response from the model. Proceed to next turn.",
+                                    "model_response_decoded": decoded_model_responses,
+                                }
+                            )
+                            break
+
+                    except Exception as e:
+                        print("Failed to decode the model response. Proceed to next turn.")
+                        current_step_inference_log.append(
+                            {
+                                "role": "handler_log",
+                                "content": f"Error decoding the model response. Proceed to next turn.",
+                                "error": str(e),
+                            }
+                        )
+                        break
 
-                # Add the execution results to the chat history for the next turn
-                inference_data = self._add_execution_results_prompting(
-                    inference_data, execution_results, model_response_data
-                )
+                    # Obtain the execution results
+                    execution_results, _ = execution_session.execute(decoded_model_responses)
 
-                for execution_result in execution_results:
-                    current_step_inference_log.append(
-                        {
-                            "role": "tool",
-                            "content": execution_result,
-                        }
+                    # Add the execution results to the chat history for the next turn
+                    inference_data = self._add_execution_results_prompting(
+                        inference_data, execution_results, model_response_data
                     )
 
-                count += 1
-                # Force quit after too many steps
-                if count > MAXIMUM_STEP_LIMIT:
-                    force_quit = True
-                    current_step_inference_log.append(
-                        {
-                            "role": "handler_log",
-                            "content": f"Model has been forced to quit after {MAXIMUM_STEP_LIMIT} steps.",
-                        }
-                    )
-                    break
+                    for execution_result in execution_results:
+                        current_step_inference_log.append(
+                            {
+                                "role": "tool",
+                                "content": execution_result,
+                            }
+                        )
 
-            # Add to the total list
-            all_model_response.append(current_turn_response)
-            all_reasoning_content.append(current_turn_reasoning_content)
-            all_inference_log.append(current_turn_inference_log)
-            total_input_token_count.append(current_turn_input_token_count)
-            total_output_token_count.append(current_turn_output_token_count)
-            total_latency.append(current_turn_latency)
+                    count += 1
+                    # Force quit after too many steps
+                    if count > MAXIMUM_STEP_LIMIT:
+                        force_quit = True
+                        current_step_inference_log.append(
+                            {
+                                "role": "handler_log",
+                                "content": f"Model has been forced to quit after {MAXIMUM_STEP_LIMIT} steps.",
+                            }
+                        )
+                        break
 
-            if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if class_name in STATELESS_CLASSES:
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
-                all_inference_log.append(state_log)
+                # Add to the total list
+                all_model_response.append(current_turn_response)
+                all_reasoning_content.append(current_turn_reasoning_content)
+                all_inference_log.append(current_turn_inference_log)
+                total_input_token_count.append(current_turn_input_token_count)
+                total_output_token_count.append(current_turn_output_token_count)
+                total_latency.append(current_turn_latency)
+
+                if not exclude_state_log:
+                    state_log = []
+                    # Snapshots share the attributes that didn't change since the previous one, and are never modified by later turns
+                    for class_name, class_state in execution_session.snapshot_state().items():
+                        state_log.append(
+                            {
+                                "role": "state_info",
+                                "class_name": class_name,
+                                "content": class_state,
+                            }
+                        )
+                    all_inference_log.append(state_log)
 
-            if force_quit:
-                break
+                if force_quit:
+                    break
 
         metadata = {
             "input_token_count": total_input_token_count,
@@ -582,6 +602,13 @@ class BaseHandler:
     @final
     def inference_single_turn_FC(
         self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        return _run_to_completion(
+            self._inference_single_turn_FC(test_entry, include_input_log, use_async_client=False)
+        )
+
+    async def _inference_single_turn_FC(
+        self, test_entry: dict, include_input_log: bool, use_async_client: bool
     ) -> tuple[any, dict]:
         inference_data: dict = {}
         inference_data = self._pre_query_processing_FC(inference_data, test_entry)
@@ -590,10 +617,15 @@ class BaseHandler:
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_FC(inference_data)
+        api_response, query_latency = await self._dispatch_query(
+            self._query_FC, self._query_FC_async, inference_data, use_async_client
+        )
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_FC(api_response)
+        self.rate_limiter.record_token_usage(
+            model_response_data["input_token"], model_response_data["output_token"]
+        )
 
         # Process the metadata
         metadata = {}
@@ -619,16 +651,28 @@ class BaseHandler:
     @final
     def inference_single_turn_prompting(
         self, test_entry: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        return _run_to_completion(
+            self._inference_single_turn_prompting(test_entry, include_input_log, use_async_client=False)
+        )
+
+    async def _inference_single_turn_prompting(
+        self, test_entry: dict, include_input_log: bool, use_async_client: bool
     ) -> tuple[any, dict]:
         inference_data: dict = self._pre_query_processing_prompting(test_entry)
         inference_data = self.add_first_turn_message_prompting(
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_prompting(inference_data)
+        api_response, query_latency = await self._dispatch_query(
+            self._query_prompting, self._query_prompting_async, inference_data, use_async_client
+        )
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_prompting(api_response)
+        self.rate_limiter.record_token_usage(
+            model_response_data["input_token"], model_response_data["output_token"]
+        )
 
         # Process the metadata
         metadata = {}
@@ -651,6 +695,48 @@ class BaseHandler:
 
         return model_response_data["model_responses"], metadata
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        # Providers enforce their limits per model, so each model gets its own limiter, shared by all its handler instances
+        return get_rate_limiter(self.model_name)
+
+    @final
+    async def _dispatch_query(
+        self, query, async_query, inference_data: dict, use_async_client: bool
+    ):
+        """
+        Send one model query once the provider's rate limiter admits it.
+        If a response cache is configured, identical requests are answered from the cache without calling the model.
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(
+                self.model_name, self.temperature, query.__name__, inference_data
+            )
+            cached_value = self.response_cache.get(cache_key)
+            if cached_value is not None:
+                api_response, query_latency, cached_inference_data = cached_value
+                # Replay everything the query did to `inference_data`, including changes made in place to nested values
+                # (eg, Claude marking messages with `cache_control`), so the next step builds the same request as the original run
+                inference_data.clear()
+                inference_data.update(cached_inference_data)
+                return api_response, query_latency
+
+        if use_async_client:
+            async with self.rate_limiter.async_slot():
+                api_response, query_latency = await async_query(inference_data)
+        else:
+            with self.rate_limiter.slot():
+                api_response, query_latency = query(inference_data)
+
+        if cache_key is not None:
+            # `put` serializes the value right away, so this records `inference_data` as the query left it
+            self.response_cache.put(
+                cache_key, (api_response, query_latency, inference_data)
+            )
+
+        return api_response, query_latency
+
     def decode_ast(self, result, language="Python"):
         """
         This method takes raw model output (from `_parse_query_response_xxx`) and convert it to standard AST checker input.
@@ -665,23 +751,7 @@ class BaseHandler:
 
     @final
     def write(self, result, result_dir, update_mode=False):
-        model_name_dir = self.model_name.replace("/", "_")
-        model_result_dir = result_dir / model_name_dir
-        model_result_dir.mkdir(parents=True, exist_ok=True)
-
-        if isinstance(result, dict):
-            result = [result]
-
-        # Collect and format each entry for JSON compatibility
-        entries_to_write = [make_json_serializable(entry) for entry in result]
-
-        # Group entries by their `test_category` for efficient file handling
-        file_entries = {}
-        for entry in entries_to_write:
-            test_category = entry["id"].rsplit("_", 1)[0]
-            file_name = f"{VERSION_PREFIX}_{test_category}_result.json"
-            file_path = model_result_dir / file_name
-            file_entries.setdefault(file_path, []).append(entry)
+        file_entries = self._group_entries_by_result_file(result, result_dir)
 
         for file_path, entries in file_entries.items():
             if update_mode:
@@ -698,16 +768,59 @@ class BaseHandler:
 
                 # Sort entries by `id` and write them back to ensure order consistency
                 sorted_entries = sorted(existing_entries.values(), key=sort_key)
-                with open(file_path, "w") as f:
+                with open(file_path, "w", encoding="utf-8") as f:
                     for entry in sorted_entries:
-                        f.write(json.dumps(entry) + "\n")
+                        f.write(json_dumps(entry) + "\n")
 
             else:
                 # Normal mode: Append in sorted order
                 entries.sort(key=sort_key)
-                with open(file_path, "a") as f:
+                with open(file_path, "a", encoding="utf-8") as f:
                     for entry in entries:
-                        f.write(json.dumps(entry) + "\n")
+                        f.write(json_dumps(entry) + "\n")
+
+    @final
+    def write_to_result_log(self, result, result_dir):
+        """
+        Persist results as soon as they complete, in any order.
+        Entries are appended to a per-category log next to the result file; call `compact_result_logs` once generation is done to merge them into the ID-sorted result files.
+        With a result store, entries are upserted into the store instead, and there is no log to compact.
+        """
+        if self.result_store is not None:
+            self.result_store.upsert(result if isinstance(result, list) else [result])
+            return
+
+        file_entries = self._group_entries_by_result_file(result, result_dir)
+
+        for file_path, entries in file_entries.items():
+            append_to_result_log(file_path, entries)
+
+    @final
+    def compact_result_logs(self, result_dir):
+        model_result_dir = result_dir / self.model_name.replace("/", "_")
+        for log_path in model_result_dir.glob("*_result.json.log"):
+            compact_result_log(log_path.with_suffix(""))
+
+    def _group_entries_by_result_file(self, result, result_dir) -> dict:
+        model_name_dir = self.model_name.replace("/", "_")
+        model_result_dir = result_dir / model_name_dir
+        model_result_dir.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(result, dict):
+            result = [result]
+
+        # Collect and format each entry for JSON compatibility
+        entries_to_write = [make_json_serializable(entry) for entry in result]
+
+        # Group entries by their `test_category` for efficient file handling
+        file_entries = {}
+        for entry in entries_to_write:
+            test_category = entry["id"].rsplit("_", 1)[0]
+            file_name = f"{VERSION_PREFIX}_{test_category}_result.json"
+            file_path = model_result_dir / file_name
+            file_entries.setdefault(file_path, []).append(entry)
+
+        return file_entries
 
     #### FC methods ####
 
@@ -718,6 +831,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_FC_async(self, inference_data: dict):
+        """
+        Async version of `_query_FC`, used in `--async-mode`. Must return the same `(api_response, latency)` tuple.
+        Handlers whose SDK ships an async client should override this. By default, the blocking `_query_FC` is run in a worker thread.
+        """
+        return await asyncio.to_thread(self._query_FC, inference_data)
+
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -808,6 +928,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _query_prompting_async(self, inference_data: dict):
+        """
+        Async version of `_query_prompting`, used in `--async-mode`. Must return the same `(api_response, latency)` tuple.
+        Handlers whose SDK ships an async client should override this. By default, the blocking `_query_prompting` is run in a worker thread.
+        """
+        return await asyncio.to_thread(self._query_prompting, inference_data)
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -880,3 +1007,16 @@ class BaseHandler:
         By default, execution results are added back as a `user` role message, as most models don't support the `tool` role in prompting mode.
         """
         raise NotImplementedError
+
+
+def _run_to_completion(coroutine):
+    """
+    Drive an inference coroutine created with `use_async_client=False` on the calling thread.
+    In that mode nothing is ever awaited on, so no event loop is needed; this keeps the blocking path free of any loop that handler SDKs might conflict with.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+    coroutine.close()
+    raise RuntimeError("Inference coroutine suspended while running in blocking mode.")
@@ -1,14 +1,27 @@
 import os
+import re
 import subprocess
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional
 import traceback
+from copy import deepcopy
+from itertools import islice
 
 import requests
-from bfcl_eval.constants.eval_config import RESULT_PATH, VLLM_PORT
+from bfcl_eval.constants.eval_config import (
+    DEFAULT_MAX_CONCURRENCY,
+    RESULT_PATH,
+    VLLM_PORT,
+)
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.local_inference.server_pool import (
+    acquire_pooled_server,
+    build_server_command,
+    get_server_base_url,
+    release_pooled_server,
+)
 from bfcl_eval.model_handler.model_style import ModelStyle
 from bfcl_eval.model_handler.utils import (
     default_decode_ast_prompting,
@@ -20,6 +33,11 @@ from openai import OpenAI
 from overrides import EnforceOverrides, final, override
 from tqdm import tqdm
 
+# Rough sizes of a request, used to estimate how many requests fit in the server's KV cache
+ESTIMATED_PROMPT_TOKEN_COUNT = 2000
+ESTIMATED_OUTPUT_TOKEN_COUNT = 500
+MAX_ESTIMATED_CONCURRENCY = 512
+
 
 class OSSHandler(BaseHandler, EnforceOverrides):
     def __init__(self, model_name, temperature, dtype="bfloat16") -> None:
@@ -39,6 +57,18 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         self.base_url = f"http://{self.vllm_host}:{self.vllm_port}/v1"
         self.client = OpenAI(base_url=self.base_url, api_key="EMPTY")
 
+        # Token counts of the first-turn prompts of the entries not sent yet, by entry ID, tokenized in one batch before inference starts
+        self._prompt_token_counts: dict[str, tuple[str, int]] = {}
+        # Average of the counts above, used to estimate how many requests fit in the server's KV cache
+        self._average_prompt_token_count: Optional[float] = None
+        # The last prompt sent for each entry in flight and its token count, by entry ID, so that later steps only tokenize what was added
+        self._previous_prompts: dict[str, tuple[str, int]] = {}
+        # The first-turn messages, functions and formatted prompt of each entry not sent yet, from ordering the entries,
+        # so that the entry's first query doesn't format the same prompt again
+        self._first_turn_prompts: dict[str, tuple[list, list, str]] = {}
+        # The ID of the entry each worker thread is running
+        self._current_entry = threading.local()
+
     @override
     def inference(self, test_entry: dict, include_input_log: bool, exclude_state_log: bool):
         """
@@ -51,6 +81,14 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             "OSS Models should call the batch_inference method instead."
         )
 
+    @override
+    async def inference_async(
+        self, test_entry: dict, include_input_log: bool, exclude_state_log: bool
+    ):
+        raise NotImplementedError(
+            "OSS Models should call the batch_inference method instead."
+        )
+
     @override
     def decode_ast(self, result, language="Python"):
         return default_decode_ast_prompting(result, language)
@@ -70,7 +108,9 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         local_model_path: Optional[str],
         include_input_log: bool,
         exclude_state_log: bool,
-        update_mode: bool,
+        use_server_pool: bool = False,
+        server_idle_timeout: float = 1800,
+        max_concurrency: Optional[int] = None,
         result_dir=RESULT_PATH,
     ):
         """
@@ -120,52 +160,37 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 )
         print(f"Max context length: {self.max_context_length}")
 
-        if not skip_server_setup:
-            if backend == "vllm":
-                process = subprocess.Popen(
-                    [
-                        "vllm",
-                        "serve",
-                        str(self.model_path_or_id),
-                        "--port",
-                        str(self.vllm_port),
-                        "--dtype",
-                        str(self.dtype),
-                        "--tensor-parallel-size",
-                        str(num_gpus),
-                        "--gpu-memory-utilization",
-                        str(gpu_memory_utilization),
-                        "--trust-remote-code",
-                    ],
-                    stdout=subprocess.PIPE,  # Capture stdout
-                    stderr=subprocess.PIPE,  # Capture stderr
-                    text=True,  # To get the output as text instead of bytes
-                )
-            elif backend == "sglang":
-
-                process = subprocess.Popen(
-                    [
-                        "python",
-                        "-m",
-                        "sglang.launch_server",
-                        "--model-path",
-                        str(self.model_path_or_id),
-                        "--port",
-                        str(self.vllm_port),
-                        "--dtype",
-                        str(self.dtype),
-                        "--tp",
-                        str(num_gpus),
-                        "--mem-fraction-static",
-                        str(gpu_memory_utilization),
-                        "--trust-remote-code",
-                    ],
-                    stdout=subprocess.PIPE,  # Capture stdout
-                    stderr=subprocess.PIPE,  # Capture stderr
-                    text=True,  # To get the output as text instead of bytes
-                )
-            else:
-                raise ValueError(f"Backend {backend} is not supported.")
+        test_entries = self._order_by_shared_prompt_prefix(test_entries)
+
+        # With the server pool, the server is shared with other runs and outlives this one; otherwise, we launch our own and tear it down at the end
+        launch_server = not skip_server_setup and not use_server_pool
+        pooled_server = None
+        if not skip_server_setup and use_server_pool:
+            pooled_server = acquire_pooled_server(
+                backend=backend,
+                model_path_or_id=self.model_path_or_id,
+                dtype=self.dtype,
+                num_gpus=num_gpus,
+                gpu_memory_utilization=gpu_memory_utilization,
+                idle_timeout=server_idle_timeout,
+            )
+            self.base_url = get_server_base_url(pooled_server)
+            self.client = OpenAI(base_url=self.base_url, api_key="EMPTY")
+
+        if launch_server:
+            process = subprocess.Popen(
+                build_server_command(
+                    backend=backend,
+                    model_path_or_id=self.model_path_or_id,
+                    port=self.vllm_port,
+                    dtype=self.dtype,
+                    num_gpus=num_gpus,
+                    gpu_memory_utilization=gpu_memory_utilization,
+                ),
+                stdout=subprocess.PIPE,  # Capture stdout
+                stderr=subprocess.PIPE,  # Capture stderr
+                text=True,  # To get the output as text instead of bytes
+            )
 
             stop_event = threading.Event()
             # Event to signal threads to stop; no need to see logs after server is ready
@@ -195,7 +220,7 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             server_ready = False
             while not server_ready:
                 # Check if the process has terminated unexpectedly
-                if not skip_server_setup and process.poll() is not None:
+                if launch_server and process.poll() is not None:
                     # Output the captured logs
                     stdout, stderr = process.communicate()
                     print(stdout)
@@ -213,38 +238,61 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                     # If the connection is not ready, wait and try again
                     time.sleep(1)
 
-            if not skip_server_setup:
+            if launch_server:
                 # Signal threads to stop reading output
                 stop_event.set()
 
+            if max_concurrency is None:
+                max_concurrency = self._estimate_max_concurrency(backend)
+            print(f"Sending at most {max_concurrency} requests to the server at a time.")
+
             # Once the server is ready, make the completion requests
-            futures = []
-            with ThreadPoolExecutor(max_workers=100) as executor:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
                 with tqdm(
                     total=len(test_entries),
                     desc=f"Generating results for {self.model_name}",
                 ) as pbar:
 
-                    for test_case in test_entries:
-                        future = executor.submit(
-                            self._multi_threaded_inference,
-                            test_case,
-                            include_input_log,
-                            exclude_state_log,
-                        )
-                        futures.append(future)
-
-                    for future in futures:
-                        # This will wait for the task to complete, so that we are always writing in order
-                        result = future.result()
-                        self.write(result, result_dir, update_mode=update_mode)
-                        pbar.update()
+                    pending_futures = set()
+                    test_entry_iterator = iter(test_entries)
+                    try:
+                        while True:
+                            # Only submit new entries as earlier ones finish, so that the client memory and the server queue stay bounded
+                            for test_case in islice(
+                                test_entry_iterator, max_concurrency - len(pending_futures)
+                            ):
+                                pending_futures.add(
+                                    executor.submit(
+                                        self._multi_threaded_inference,
+                                        test_case,
+                                        include_input_log,
+                                        exclude_state_log,
+                                    )
+                                )
+                            if not pending_futures:
+                                break
+
+                            done_futures, pending_futures = wait(
+                                pending_futures, return_when=FIRST_COMPLETED
+                            )
+                            for future in done_futures:
+                                # Persist each result as soon as it completes, so a slow entry never holds back the ones behind it
+                                result = future.result()
+                                self.write_to_result_log(result, result_dir)
+                                pbar.update()
+                    finally:
+                        # Merge the logs into the ID-sorted result files, also keeping whatever finished if we are interrupted
+                        self.compact_result_logs(result_dir)
 
         except Exception as e:
             raise e
 
         finally:
-            if not skip_server_setup:
+            if pooled_server is not None:
+                # Leave the server running for later runs; it shuts itself down once idle
+                release_pooled_server(pooled_server)
+
+            if launch_server:
                 # Ensure the server process is terminated properly
                 process.terminate()
                 try:
@@ -261,6 +309,205 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 stdout_thread.join()
                 stderr_thread.join()
 
+    @final
+    def _order_by_shared_prompt_prefix(self, test_entries: list[dict]) -> list[dict]:
+        """
+        Reorder the entries so that requests whose formatted prompts share a long prefix (eg, the same system prompt and function docs) are sent back to back.
+        This lets the prefix cache of vLLM/SGLang reuse the KV cache of the shared prefix instead of recomputing it.
+        For multi-turn entries, the first-turn prompt is used; later turns extend it.
+        """
+        formatted_prompts = {}
+        failed_entry_ids = []
+        for test_entry in test_entries:
+            # Only the first turn is formatted, so the later turns are not copied, and the initial state of the backends
+            # (large for long-context entries) is only read
+            first_turn_entry = deepcopy(
+                {
+                    key: value
+                    for key, value in test_entry.items()
+                    if key not in ("question", "initial_config")
+                }
+            )
+            first_turn_entry["question"] = deepcopy(test_entry["question"][:1])
+            if "initial_config" in test_entry:
+                first_turn_entry["initial_config"] = test_entry["initial_config"]
+
+            try:
+                inference_data = self._pre_query_processing_prompting(first_turn_entry)
+                inference_data = self.add_first_turn_message_prompting(
+                    inference_data, first_turn_entry["question"][0]
+                )
+                formatted_prompt = self._format_prompt(
+                    inference_data["message"], inference_data["function"]
+                )
+            except NotImplementedError:
+                # The handler doesn't format prompts itself, so there is nothing to order by
+                formatted_prompts[test_entry["id"]] = ""
+                continue
+            except Exception:
+                # Ordering is only an optimization, so the entry is still sent; the same error will surface during its inference
+                if not failed_entry_ids:
+                    print(
+                        f"❗️ Failed to format the first-turn prompt of {test_entry['id']} while ordering the requests:"
+                    )
+                    traceback.print_exc(limit=10)
+                failed_entry_ids.append(test_entry["id"])
+                formatted_prompts[test_entry["id"]] = ""
+                continue
+
+            formatted_prompts[test_entry["id"]] = formatted_prompt
+            self._first_turn_prompts[test_entry["id"]] = (
+                inference_data["message"],
+                inference_data["function"],
+                formatted_prompt,
+            )
+
+        if len(failed_entry_ids) > 1:
+            print(
+                f"❗️ Failed to format the first-turn prompt of {len(failed_entry_ids)} entries in total; they are sent first, without reordering."
+            )
+
+        self._batch_count_prompt_tokens(
+            {
+                test_entry_id: prompt
+                for test_entry_id, prompt in formatted_prompts.items()
+                if prompt
+            }
+        )
+
+        # Sorting the prompts lexicographically puts prompts with the longest common prefixes next to each other
+        ordered_test_entries = sorted(
+            test_entries, key=lambda test_entry: formatted_prompts[test_entry["id"]]
+        )
+
+        total_prompt_length = sum(len(prompt) for prompt in formatted_prompts.values())
+        if total_prompt_length > 0:
+            shared_ratio_before = (
+                _count_shared_prefix_length(test_entries, formatted_prompts)
+                / total_prompt_length
+            )
+            shared_ratio_after = (
+                _count_shared_prefix_length(ordered_test_entries, formatted_prompts)
+                / total_prompt_length
+            )
+            print(
+                f"Prefix sharing between consecutive prompts: {shared_ratio_after:.1%} of prompt characters "
+                f"(was {shared_ratio_before:.1%} in ID order)."
+            )
+
+        return ordered_test_entries
+
+    @final
+    def _estimate_max_concurrency(self, backend: str) -> int:
+        """
+        Estimate how many requests fit in the server's KV cache at once, from the KV cache size the server reports and the average prompt length.
+        Sending more than that only makes requests wait (or get preempted) in the server queue.
+        """
+        server_root_url = self.base_url.removesuffix("/v1")
+        kv_cache_token_capacity = None
+        try:
+            if backend == "vllm":
+                metrics = requests.get(f"{server_root_url}/metrics", timeout=10).text
+                num_gpu_blocks = re.search(r'num_gpu_blocks="(\d+)"', metrics)
+                block_size = re.search(r'block_size="(\d+)"', metrics)
+                if num_gpu_blocks and block_size:
+                    kv_cache_token_capacity = int(num_gpu_blocks.group(1)) * int(
+                        block_size.group(1)
+                    )
+            elif backend == "sglang":
+                server_info = requests.get(
+                    f"{server_root_url}/get_server_info", timeout=10
+                ).json()
+                kv_cache_token_capacity = server_info.get("max_total_num_tokens")
+        except (requests.exceptions.RequestException, ValueError):
+            pass
+
+        if not kv_cache_token_capacity:
+            print(
+                f"Could not read the KV cache capacity from the server. Falling back to {DEFAULT_MAX_CONCURRENCY} concurrent requests."
+            )
+            return DEFAULT_MAX_CONCURRENCY
+
+        average_prompt_token_count = (
+            self._average_prompt_token_count or ESTIMATED_PROMPT_TOKEN_COUNT
+        )
+        estimated_request_token_count = (
+            average_prompt_token_count + ESTIMATED_OUTPUT_TOKEN_COUNT
+        )
+        return max(
+            1,
+            min(
+                MAX_ESTIMATED_CONCURRENCY,
+                int(kv_cache_token_capacity // estimated_request_token_count),
+            ),
+        )
+
+    @final
+    def _batch_count_prompt_tokens(self, formatted_prompts: dict[str, str]) -> None:
+        """
+        Tokenize the first-turn prompts of all entries (by entry ID) in one call, which the fast (Rust) tokenizers parallelize internally,
+        and keep their token counts until each entry's first query.
+        """
+        if not formatted_prompts:
+            return
+        try:
+            all_token_ids = self.tokenizer(
+                list(formatted_prompts.values()), add_special_tokens=False
+            )["input_ids"]
+        except Exception:
+            # Fall back to tokenizing each prompt on demand in `_query_prompting`
+            return
+        for (test_entry_id, formatted_prompt), token_ids in zip(
+            formatted_prompts.items(), all_token_ids
+        ):
+            self._prompt_token_counts[test_entry_id] = (formatted_prompt, len(token_ids))
+        self._average_prompt_token_count = sum(
+            len(token_ids) for token_ids in all_token_ids
+        ) / len(all_token_ids)
+
+    @final
+    def _get_formatted_prompt(self, message: list[dict], function: list[dict]) -> str:
+        """
+        Format the prompt, reusing the one formatted while ordering the entries if this is the entry's first query.
+        `_format_prompt` only depends on the messages and the functions, so the prompt can be reused when they are equal.
+        """
+        first_turn_prompt = self._first_turn_prompts.pop(
+            getattr(self._current_entry, "id", None), None
+        )
+        if first_turn_prompt is not None:
+            first_turn_message, first_turn_function, formatted_prompt = first_turn_prompt
+            if message == first_turn_message and function == first_turn_function:
+                return formatted_prompt
+        return self._format_prompt(message, function)
+
+    @final
+    def _count_prompt_tokens(self, formatted_prompt: str) -> int:
+        """
+        Count the tokens in the formatted prompt without re-tokenizing the whole conversation on every step.
+        In a multi-turn conversation, the prompt usually extends the previous step's prompt, so only the new suffix is tokenized.
+        The count can be off by a token at the boundary, which is fine for the token count metadata and the `max_tokens` budget.
+        This bookkeeping is kept by entry ID rather than in `inference_data`, so that it is not part of the response cache key.
+        """
+        test_entry_id = getattr(self._current_entry, "id", None)
+        first_turn_prompt, first_turn_token_count = self._prompt_token_counts.pop(
+            test_entry_id, (None, None)
+        )
+        previous_prompt, previous_token_count = self._previous_prompts.get(
+            test_entry_id, (None, None)
+        )
+
+        if formatted_prompt == first_turn_prompt:
+            token_count = first_turn_token_count
+        elif previous_prompt is not None and formatted_prompt.startswith(previous_prompt):
+            new_suffix = formatted_prompt[len(previous_prompt) :]
+            token_count = previous_token_count + len(self.tokenizer.tokenize(new_suffix))
+        else:
+            token_count = len(self.tokenizer.tokenize(formatted_prompt))
+
+        if test_entry_id is not None:
+            self._previous_prompts[test_entry_id] = (formatted_prompt, token_count)
+        return token_count
+
     @final
     def _multi_threaded_inference(
         self, test_case, include_input_log: bool, exclude_state_log: bool
@@ -270,6 +517,7 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         """
         assert type(test_case["function"]) is list
 
+        self._current_entry.id = test_case["id"]
         try:
             if "multi_turn" in test_case["id"]:
                 model_responses, metadata = self.inference_multi_turn_prompting(
@@ -292,6 +540,12 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             metadata = {
                 "traceback": traceback.format_exc(),
             }
+        finally:
+            self._current_entry.id = None
+            # Left over if the first query was answered from the response cache, or never sent
+            self._first_turn_prompts.pop(test_case["id"], None)
+            self._prompt_token_counts.pop(test_case["id"], None)
+            self._previous_prompts.pop(test_case["id"], None)
 
         result_to_write = {
             "id": test_case["id"],
@@ -318,11 +572,11 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         function: list[dict] = inference_data["function"]
         message: list[dict] = inference_data["message"]
 
-        formatted_prompt: str = self._format_prompt(message, function)
+        formatted_prompt: str = self._get_formatted_prompt(message, function)
         inference_data["inference_input_log"] = {"formatted_prompt": formatted_prompt}
 
         # Tokenize the formatted prompt to get token count
-        input_token_count = len(self.tokenizer.tokenize(formatted_prompt))
+        input_token_count = self._count_prompt_tokens(formatted_prompt)
 
         # Determine the number of tokens to request. Cap it at 4096 if the model has a larger limit.
         if self.max_context_length < input_token_count + 2:
@@ -422,3 +676,17 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             )
 
         return inference_data
+
+
+def _count_shared_prefix_length(test_entries: list[dict], formatted_prompts: dict) -> int:
+    """
+    Total length of the prefixes that each prompt shares with the one sent right before it.
+    """
+    shared_prefix_length = 0
+    for previous_entry, current_entry in zip(test_entries, test_entries[1:]):
+        shared_prefix_length += len(
+            os.path.commonprefix(
+                [formatted_prompts[previous_entry["id"]], formatted_prompts[current_entry["id"]]]
+            )
+        )
+    return shared_prefix_length
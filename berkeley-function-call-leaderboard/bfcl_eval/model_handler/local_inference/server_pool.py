@@ -0,0 +1,352 @@
+import argparse
+import hashlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import requests
+from bfcl_eval.constants.eval_config import SERVER_POOL_PATH
+
+# Pooled servers hold on to their GPU memory, so by default only one is kept alive at a time
+MAX_POOLED_SERVERS = 1
+# How often the watchdog checks whether its server has become idle, in seconds
+WATCHDOG_INTERVAL = 30
+# How long to wait for a server to shut down gracefully before killing it, in seconds
+SHUTDOWN_TIMEOUT = 15
+
+
+def build_server_command(
+    backend: str,
+    model_path_or_id: str,
+    port: int,
+    dtype: str,
+    num_gpus: int,
+    gpu_memory_utilization: float,
+) -> list[str]:
+    if backend == "vllm":
+        return [
+            "vllm",
+            "serve",
+            str(model_path_or_id),
+            "--port",
+            str(port),
+            "--dtype",
+            str(dtype),
+            "--tensor-parallel-size",
+            str(num_gpus),
+            "--gpu-memory-utilization",
+            str(gpu_memory_utilization),
+            "--trust-remote-code",
+        ]
+    elif backend == "sglang":
+        return [
+            "python",
+            "-m",
+            "sglang.launch_server",
+            "--model-path",
+            str(model_path_or_id),
+            "--port",
+            str(port),
+            "--dtype",
+            str(dtype),
+            "--tp",
+            str(num_gpus),
+            "--mem-fraction-static",
+            str(gpu_memory_utilization),
+            "--trust-remote-code",
+        ]
+    else:
+        raise ValueError(f"Backend {backend} is not supported.")
+
+
+def get_server_key(backend: str, model_path_or_id: str, dtype: str, num_gpus: int) -> str:
+    serialized_key = json.dumps([backend, str(model_path_or_id), str(dtype), num_gpus])
+    return hashlib.sha256(serialized_key.encode("utf-8")).hexdigest()[:16]
+
+
+def check_server_pool_supported() -> None:
+    # The registry lock (`fcntl`) and the process management (process groups, `SIGKILL`, `os.kill(pid, 0)`) are POSIX-only
+    if sys.platform == "win32":
+        raise RuntimeError(
+            "`--server-pool` is not supported on Windows. Run without it to launch a server for this run only."
+        )
+
+
+@contextmanager
+def _registry_lock():
+    SERVER_POOL_PATH.mkdir(parents=True, exist_ok=True)
+    # Imported here, so that this module, which every OSS handler imports, still imports on Windows
+    import fcntl
+
+    with open(SERVER_POOL_PATH / ".lock", "w", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_entry(key: str) -> Optional[dict]:
+    try:
+        with open(SERVER_POOL_PATH / f"{key}.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _load_all_entries() -> list[dict]:
+    return [
+        entry
+        for entry in (_load_entry(path.stem) for path in SERVER_POOL_PATH.glob("*.json"))
+        if entry is not None
+    ]
+
+
+def _save_entry(entry: dict) -> None:
+    temp_path = SERVER_POOL_PATH / f"{entry['key']}.json.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=4)
+    temp_path.replace(SERVER_POOL_PATH / f"{entry['key']}.json")
+
+
+def _remove_entry(key: str) -> None:
+    (SERVER_POOL_PATH / f"{key}.json").unlink(missing_ok=True)
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _get_live_clients(entry: dict) -> list[int]:
+    return [pid for pid in entry["clients"] if _is_process_alive(pid)]
+
+
+def _stop_server(entry: dict) -> None:
+    """
+    Terminate the watchdog and the server together; they share the same process group.
+    Must be called with the registry lock held.
+    """
+    _remove_entry(entry["key"])
+    try:
+        os.killpg(entry["pid"], signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    deadline = time.time() + SHUTDOWN_TIMEOUT
+    while time.time() < deadline:
+        if not _is_process_alive(entry["pid"]):
+            print(f"Pooled server for {entry['model_path_or_id']} stopped successfully.")
+            return
+        time.sleep(1)
+    try:
+        os.killpg(entry["pid"], signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    print(f"Pooled server for {entry['model_path_or_id']} killed.")
+
+
+def _find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def is_server_healthy(base_url: str) -> bool:
+    try:
+        return requests.get(f"{base_url}/models", timeout=5).status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+def get_server_base_url(entry: dict) -> str:
+    return f"http://localhost:{entry['port']}/v1"
+
+
+def acquire_pooled_server(
+    backend: str,
+    model_path_or_id: str,
+    dtype: str,
+    num_gpus: int,
+    gpu_memory_utilization: float,
+    idle_timeout: float,
+) -> dict:
+    """
+    Attach to the pooled server for this model configuration, starting one if needed, and wait until it is ready.
+
+    Pooled servers are keyed by (backend, model path, dtype, tensor parallel size) and registered under `SERVER_POOL_PATH`.
+    Each one runs under a watchdog process that is detached from the current run, so later runs can attach to it instead of loading the weights again.
+    The watchdog shuts the server down once no `bfcl` process has used it for `idle_timeout` seconds.
+
+    The returned registry entry must be handed back to `release_pooled_server` once the caller is done with the server.
+    """
+    check_server_pool_supported()
+    key = get_server_key(backend, model_path_or_id, dtype, num_gpus)
+    with _registry_lock():
+        entries = {}
+        for entry in _load_all_entries():
+            # The watchdog removes its own entry on exit, but not if it was killed
+            if _is_process_alive(entry["pid"]):
+                entries[entry["key"]] = entry
+            else:
+                _remove_entry(entry["key"])
+
+        entry = entries.pop(key, None)
+        if entry is not None:
+            print(f"Attaching to pooled {backend} server for {model_path_or_id} on port {entry['port']}.")
+        else:
+            # Make room for the new server, starting with the least recently used one
+            for other_entry in sorted(entries.values(), key=lambda e: e["last_used"]):
+                if len(entries) < MAX_POOLED_SERVERS:
+                    break
+                if _get_live_clients(other_entry):
+                    continue
+                _stop_server(other_entry)
+                entries.pop(other_entry["key"])
+            if len(entries) >= MAX_POOLED_SERVERS:
+                raise RuntimeError(
+                    f"Cannot start a pooled server for {model_path_or_id}: the pooled servers for {[e['model_path_or_id'] for e in entries.values()]} are still in use by other processes."
+                )
+
+            port = _find_free_port()
+            log_path = SERVER_POOL_PATH / f"{key}.log"
+            server_command = build_server_command(
+                backend, model_path_or_id, port, dtype, num_gpus, gpu_memory_utilization
+            )
+            with open(log_path, "w", encoding="utf-8") as log_file:
+                process = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-m",
+                        __name__,
+                        "watchdog",
+                        "--key",
+                        key,
+                        "--idle-timeout",
+                        str(idle_timeout),
+                        "--",
+                        *server_command,
+                    ],
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    # Detach from this process, so the server outlives the current run
+                    start_new_session=True,
+                )
+            entry = {
+                "key": key,
+                "pid": process.pid,
+                "port": port,
+                "backend": backend,
+                "model_path_or_id": str(model_path_or_id),
+                "dtype": str(dtype),
+                "num_gpus": num_gpus,
+                "log_path": str(log_path),
+                "clients": [],
+                "last_used": time.time(),
+            }
+            print(
+                f"Started pooled {backend} server for {model_path_or_id} on port {port}. Server logs are written to {log_path}."
+            )
+
+        entry["clients"] = _get_live_clients(entry) + [os.getpid()]
+        entry["last_used"] = time.time()
+        _save_entry(entry)
+
+    base_url = get_server_base_url(entry)
+    while not is_server_healthy(base_url):
+        if not _is_process_alive(entry["pid"]):
+            with _registry_lock():
+                _remove_entry(key)
+            with open(entry["log_path"], encoding="utf-8", errors="replace") as f:
+                print(f.read())
+            raise Exception("Pooled server terminated unexpectedly.")
+        time.sleep(1)
+    print("server is ready!")
+
+    return entry
+
+
+def release_pooled_server(entry: dict) -> None:
+    """
+    Detach from a pooled server. The server keeps running until its idle timeout expires.
+    """
+    with _registry_lock():
+        entry = _load_entry(entry["key"])
+        if entry is None:
+            return
+        entry["clients"] = [
+            pid for pid in _get_live_clients(entry) if pid != os.getpid()
+        ]
+        entry["last_used"] = time.time()
+        _save_entry(entry)
+
+
+def stop_all_pooled_servers() -> None:
+    with _registry_lock():
+        for entry in _load_all_entries():
+            _stop_server(entry)
+
+
+def _run_watchdog(key: str, idle_timeout: float, server_command: list[str]) -> int:
+    server_process = subprocess.Popen(server_command)
+    # `_stop_server` signals the whole process group; just make sure the server goes down with us
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        while True:
+            try:
+                return_code = server_process.wait(timeout=WATCHDOG_INTERVAL)
+                print(f"Server exited with code {return_code}.")
+                with _registry_lock():
+                    _remove_entry(key)
+                return return_code
+            except subprocess.TimeoutExpired:
+                pass
+
+            with _registry_lock():
+                entry = _load_entry(key)
+                if entry is None:
+                    return 0
+                if (
+                    not _get_live_clients(entry)
+                    and time.time() - entry["last_used"] > idle_timeout
+                ):
+                    print(f"Server has been idle for more than {idle_timeout} seconds. Shutting down.")
+                    _remove_entry(key)
+                    return 0
+    finally:
+        if server_process.poll() is None:
+            server_process.terminate()
+            try:
+                server_process.wait(timeout=SHUTDOWN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                server_process.kill()
+                server_process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stop", help="Stop all pooled servers.")
+    watchdog_parser = subparsers.add_parser("watchdog")
+    watchdog_parser.add_argument("--key", type=str, required=True)
+    watchdog_parser.add_argument("--idle-timeout", type=float, required=True)
+    watchdog_parser.add_argument("server_command", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.command == "stop":
+        stop_all_pooled_servers()
+    else:
+        server_command = args.server_command
+        if server_command and server_command[0] == "--":
+            server_command = server_command[1:]
+        sys.exit(_run_watchdog(args.key, args.idle_timeout, server_command))
@@ -0,0 +1,315 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Back off this long after the first throttled request when the provider gives no hint; doubles on every consecutive throttle
+BASE_THROTTLE_DELAY = 2
+MAX_THROTTLE_DELAY = 65
+# Only halve the concurrency limit once per cooldown, so a burst of 429s from requests that were already in flight counts as one signal
+CONCURRENCY_DECREASE_COOLDOWN = 1
+# How often an async waiter re-checks for a free concurrency slot
+CONCURRENCY_POLL_INTERVAL = 0.05
+
+RATE_LIMIT_STATUS_CODES = {429, 503}
+RATE_LIMIT_MESSAGE_PATTERN = re.compile(
+    r"rate.?limit|too many requests|resource_exhausted|throttl", re.IGNORECASE
+)
+# Headers that tell us when the exhausted budget is replenished, in order of preference
+RESET_HEADERS = [
+    "retry-after-ms",
+    "retry-after",
+    "x-ratelimit-reset-requests",
+    "x-ratelimit-reset-tokens",
+    "anthropic-ratelimit-requests-reset",
+    "anthropic-ratelimit-tokens-reset",
+]
+# Durations such as "1s", "6m0s" or "120ms", as used in the `x-ratelimit-reset-*` headers
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class _TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: float) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.level = capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(
+            self.capacity, self.level + (now - self.last_refill) * self.rate_per_second
+        )
+        self.last_refill = now
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate_per_second)
+
+    def consume(self, amount: float, now: float) -> None:
+        # The level may go negative (eg, a response used more tokens than were left), which delays the following requests
+        self._refill(now)
+        self.level -= amount
+
+
+class RateLimiter:
+    """
+    Shared admission control for all requests sent to one model endpoint.
+
+    Requests are admitted when the request and token buckets have budget, the provider has not asked us to back off, and fewer requests than the current concurrency limit are in flight.
+    The concurrency limit follows AIMD: it starts unbounded, is halved when the provider throttles us, and grows by roughly one for every window of successful requests.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._request_bucket: Optional[_TokenBucket] = None
+        self._token_bucket: Optional[_TokenBucket] = None
+        self._concurrency_limit: Optional[float] = None
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._consecutive_throttles = 0
+
+    def configure(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        with self._condition:
+            self._request_bucket = (
+                # Allow at most one second worth of requests in a burst
+                _TokenBucket(requests_per_minute / 60, max(1, requests_per_minute / 60))
+                if requests_per_minute
+                else None
+            )
+            self._token_bucket = (
+                _TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+                if tokens_per_minute
+                else None
+            )
+
+    def _try_acquire(self) -> float:
+        """
+        Take a slot if one is available. Otherwise, return how long to wait before trying again.
+        Must be called with the lock held.
+        """
+        now = time.monotonic()
+        wait_time = self._blocked_until - now
+        if self._request_bucket is not None:
+            wait_time = max(wait_time, self._request_bucket.time_until_available(1, now))
+        if self._token_bucket is not None:
+            wait_time = max(wait_time, self._token_bucket.time_until_available(1, now))
+        if (
+            self._concurrency_limit is not None
+            and self._in_flight >= int(self._concurrency_limit)
+        ):
+            wait_time = max(wait_time, CONCURRENCY_POLL_INTERVAL)
+
+        if wait_time > 0:
+            return wait_time
+
+        self._in_flight += 1
+        if self._request_bucket is not None:
+            self._request_bucket.consume(1, now)
+        return 0
+
+    def _release(self, succeeded: bool) -> None:
+        # Throttled requests are reported through `on_rate_limited` by whoever handles the error, so they are not counted here
+        with self._condition:
+            self._in_flight -= 1
+            if succeeded:
+                self._consecutive_throttles = 0
+                if self._concurrency_limit is not None:
+                    self._concurrency_limit += 1 / self._concurrency_limit
+            self._condition.notify_all()
+
+    def _acquire(self) -> None:
+        with self._condition:
+            while (wait_time := self._try_acquire()) > 0:
+                self._condition.wait(timeout=wait_time)
+
+    async def _acquire_async(self) -> None:
+        while True:
+            with self._condition:
+                wait_time = self._try_acquire()
+            if wait_time == 0:
+                return
+            await asyncio.sleep(wait_time)
+
+    @contextmanager
+    def _hold(self):
+        slot = _Slot(self)
+        token = _held_slot.set(slot)
+        try:
+            yield
+        except BaseException:
+            slot.release(succeeded=False)
+            raise
+        finally:
+            _held_slot.reset(token)
+        slot.release(succeeded=True)
+
+    @contextmanager
+    def slot(self):
+        self._acquire()
+        with self._hold():
+            yield
+
+    @asynccontextmanager
+    async def async_slot(self):
+        await self._acquire_async()
+        with self._hold():
+            yield
+
+    def record_token_usage(self, input_token, output_token) -> None:
+        if self._token_bucket is None:
+            return
+        # Some handlers report "N/A" when the provider doesn't return token usage
+        token_count = sum(
+            count for count in (input_token, output_token) if isinstance(count, (int, float))
+        )
+        with self._condition:
+            self._token_bucket.consume(token_count, time.monotonic())
+
+    def on_rate_limited(self, error: BaseException) -> float:
+        """
+        Record that the provider throttled a request, and return how long the caller should wait before retrying it.
+        Every other request to the same provider is held back until then as well.
+        """
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease >= CONCURRENCY_DECREASE_COOLDOWN:
+                # Count the throttled request itself, which may have already released its slot
+                current_limit = self._in_flight + 1
+                if self._concurrency_limit is not None:
+                    current_limit = min(current_limit, self._concurrency_limit)
+                self._concurrency_limit = max(1, current_limit / 2)
+                self._last_decrease = now
+
+            self._consecutive_throttles += 1
+            delay = get_retry_after(error)
+            if delay is None:
+                delay = min(
+                    MAX_THROTTLE_DELAY,
+                    BASE_THROTTLE_DELAY * 2 ** (self._consecutive_throttles - 1),
+                )
+            self._blocked_until = max(self._blocked_until, now + delay)
+            delay = self._blocked_until - now
+
+        # Spread out the retries so that they don't all hit the endpoint at the same instant
+        return delay + random.uniform(0, 1)
+
+
+class _Slot:
+    """
+    A concurrency slot taken by one query. It can be given up and taken again, so that each attempt of a retried query goes through admission on its own.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter) -> None:
+        self.rate_limiter = rate_limiter
+        self.held = True
+
+    def release(self, succeeded: bool) -> None:
+        if self.held:
+            self.held = False
+            self.rate_limiter._release(succeeded)
+
+    def reacquire(self) -> None:
+        if not self.held:
+            self.rate_limiter._acquire()
+            self.held = True
+
+    async def reacquire_async(self) -> None:
+        if not self.held:
+            await self.rate_limiter._acquire_async()
+            self.held = True
+
+
+# The slot held by the query running in the current thread or task; `asyncio.to_thread` carries it over to the worker thread
+_held_slot: ContextVar[Optional[_Slot]] = ContextVar("held_slot", default=None)
+
+
+def release_held_slot() -> None:
+    """
+    Give up the slot of the current query, if it holds one, so that it doesn't count as in flight while it backs off before a retry.
+    """
+    if (slot := _held_slot.get()) is not None:
+        slot.release(succeeded=False)
+
+
+def reacquire_held_slot() -> None:
+    """
+    Wait for admission again before retrying a query that gave up its slot with `release_held_slot`.
+    """
+    if (slot := _held_slot.get()) is not None:
+        slot.reacquire()
+
+
+async def reacquire_held_slot_async() -> None:
+    if (slot := _held_slot.get()) is not None:
+        await slot.reacquire_async()
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_name: str) -> RateLimiter:
+    with _rate_limiters_lock:
+        if model_name not in _rate_limiters:
+            _rate_limiters[model_name] = RateLimiter()
+        return _rate_limiters[model_name]
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    for attribute in ["status_code", "code"]:
+        if getattr(error, attribute, None) in RATE_LIMIT_STATUS_CODES:
+            return True
+    return bool(
+        RATE_LIMIT_MESSAGE_PATTERN.search(type(error).__name__)
+        or RATE_LIMIT_MESSAGE_PATTERN.search(str(error))
+    )
+
+
+def _parse_reset_header(name: str, value: str) -> Optional[float]:
+    value = value.strip()
+    if name == "retry-after-ms":
+        return float(value) / 1000
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if durations := DURATION_PATTERN.findall(value):
+        return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in durations)
+    # Otherwise, it is an absolute time, either as an HTTP date or an RFC 3339 timestamp
+    try:
+        reset_time = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        reset_time = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return (reset_time - datetime.now(timezone.utc)).total_seconds()
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Extract how long the provider asked us to wait from the response headers attached to the error, if any.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    for name in RESET_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            delay = _parse_reset_header(name, value)
+        except (TypeError, ValueError):
+            continue
+        return min(max(0.0, delay), MAX_THROTTLE_DELAY)
+    return None
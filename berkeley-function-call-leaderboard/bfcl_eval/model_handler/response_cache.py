@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from bfcl_eval.utils import make_json_serializable
+
+CACHE_FILE_SUFFIX = ".pkl"
+# Part of every key; bump it when the layout of the cached values changes, so that older entries are never read
+CACHE_FORMAT_VERSION = 2
+# Written by the query itself, so it is not part of the request content
+EXCLUDED_INFERENCE_DATA_KEYS = {"inference_input_log"}
+
+
+class ResponseCache:
+    """
+    On-disk cache of model responses, keyed on a hash of the model, the temperature and the compiled request.
+
+    Each entry is stored as its own pickle file. A file's modification time is bumped whenever it is read,
+    and once the cache grows beyond `max_size_bytes` the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._total_size = sum(
+            path.stat().st_size for path in self.cache_dir.rglob(f"*{CACHE_FILE_SUFFIX}")
+        )
+
+    @staticmethod
+    def make_key(
+        model_name: str, temperature: float, query_name: str, inference_data: dict
+    ) -> str:
+        request_content = {
+            key: value
+            for key, value in inference_data.items()
+            if key not in EXCLUDED_INFERENCE_DATA_KEYS
+        }
+        # SDK objects in the chat history (eg, assistant messages from the previous turn) are keyed on their string form
+        serialized_request = json.dumps(
+            [
+                CACHE_FORMAT_VERSION,
+                model_name,
+                temperature,
+                query_name,
+                make_json_serializable(request_content),
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(serialized_request.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            # Mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Corrupted, or written by an incompatible SDK version; treat it as a miss and overwrite it later
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            serialized_value = pickle.dumps(value)
+        except Exception:
+            # Some SDK response objects can't be pickled; those responses are simply not cached
+            return
+
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never see a partial entry
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(serialized_value)
+        with self._lock:
+            previous_size = path.stat().st_size if path.exists() else 0
+            temp_path.replace(path)
+            self._total_size += len(serialized_value) - previous_size
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache is back under its size limit.
+        Must be called with the lock held.
+        """
+        entries = []
+        for path in self.cache_dir.rglob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Recount from disk, since other processes may share the same cache directory
+        self._total_size = sum(size for _, size, _ in entries)
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, path in entries:
+            if self._total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total_size -= size
@@ -0,0 +1,234 @@
+import argparse
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import PROJECT_ROOT, RESULT_PATH
+from bfcl_eval.utils import (
+    extract_test_category_from_id,
+    json_dumps,
+    json_loads,
+    sort_key,
+    write_result_manifest,
+)
+
+RESULT_STORE_FILE_NAME = "results.sqlite"
+# Fields that get a column of their own, so they can be read without parsing the rest of the entry (eg, the inference log)
+PROJECTED_FIELDS = ["result", "latency", "input_token_count", "output_token_count"]
+
+
+def get_result_store_path(model_result_dir: Path) -> Path:
+    # Doesn't end with `.json`, so it is never picked up as a result file
+    return Path(model_result_dir) / RESULT_STORE_FILE_NAME
+
+
+class ResultStore:
+    """
+    SQLite store of the generation results of one model, used instead of the per-category result files with `--result-store sqlite`.
+
+    There is one row per entry ID, so new results are upserted in place without rewriting the rest of the category.
+    The result, latency and token counts each have their own column, and all other fields share one column, so reads can be
+    restricted to some of the fields: only the IDs to resume generation, or only the result and latency to evaluate.
+    The store can be exported to the usual result files with `export_to_result_files`.
+    """
+
+    def __init__(self, model_result_dir: Path) -> None:
+        self.model_result_dir = Path(model_result_dir)
+        self.path = get_result_store_path(self.model_result_dir)
+        self.model_result_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            # Lets the evaluation read the store while generation is still writing to it
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS results (
+                    id TEXT PRIMARY KEY,
+                    test_category TEXT NOT NULL,
+                    field_names TEXT NOT NULL,
+                    {", ".join(f"{field} TEXT" for field in PROJECTED_FIELDS)},
+                    other_fields TEXT NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_test_category ON results (test_category)"
+            )
+
+    @staticmethod
+    def exists(model_result_dir: Path) -> bool:
+        return get_result_store_path(model_result_dir).exists()
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=60)
+        try:
+            # Commits on success, rolls back on error
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def upsert(self, entries: list[dict]) -> None:
+        """
+        Insert the entries, replacing any existing entry with the same ID.
+        Like `make_json_serializable`, values that can't be serialized to JSON are stored as their string form.
+        """
+        rows = []
+        for entry in entries:
+            other_fields = {
+                field: value
+                for field, value in entry.items()
+                if field != "id" and field not in PROJECTED_FIELDS
+            }
+            rows.append(
+                (
+                    entry["id"],
+                    extract_test_category_from_id(entry["id"]),
+                    # Remembers the field order, so that loaded entries are identical to the ones written
+                    json_dumps(list(entry)),
+                    *[
+                        json_dumps(entry[field], default=str) if field in entry else None
+                        for field in PROJECTED_FIELDS
+                    ],
+                    json_dumps(other_fields, default=str),
+                )
+            )
+
+        with self._connect() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO results VALUES ({', '.join('?' * (len(PROJECTED_FIELDS) + 4))})",
+                rows,
+            )
+
+    def load_ids(self, test_category: str) -> set[str]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT id FROM results WHERE test_category = ?", (test_category,)
+            )
+            return {entry_id for (entry_id,) in rows}
+
+    def load_entries(
+        self, test_category: str, fields: Optional[list[str]] = None
+    ) -> list[dict]:
+        """
+        Load the entries of a test category, sorted by ID.
+        If `fields` is given, only the ID and those fields are loaded; they must be among `PROJECTED_FIELDS`.
+        """
+        if fields is None:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    f"SELECT id, field_names, {', '.join(PROJECTED_FIELDS)}, other_fields FROM results WHERE test_category = ?",
+                    (test_category,),
+                ).fetchall()
+            entries = [self._decode_row(row) for row in rows]
+
+        else:
+            unknown_fields = [field for field in fields if field not in PROJECTED_FIELDS]
+            if unknown_fields:
+                raise ValueError(
+                    f"Fields {unknown_fields} can't be loaded on their own; only {PROJECTED_FIELDS} can."
+                )
+            with self._connect() as connection:
+                rows = connection.execute(
+                    f"SELECT {', '.join(['id', *fields])} FROM results WHERE test_category = ?",
+                    (test_category,),
+                ).fetchall()
+            entries = []
+            for entry_id, *values in rows:
+                entry = {"id": entry_id}
+                for field, value in zip(fields, values):
+                    # NULL means the entry doesn't have the field at all
+                    if value is not None:
+                        entry[field] = json_loads(value)
+                entries.append(entry)
+
+        entries.sort(key=sort_key)
+        return entries
+
+    @staticmethod
+    def _decode_row(row: tuple) -> dict:
+        entry_id, field_names, *projected_values, other_fields = row
+        values = json_loads(other_fields)
+        for field, value in zip(PROJECTED_FIELDS, projected_values):
+            if value is not None:
+                values[field] = json_loads(value)
+        values["id"] = entry_id
+        return {field: values[field] for field in json_loads(field_names)}
+
+    def delete_test_category(self, test_category: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results WHERE test_category = ?", (test_category,))
+
+    def get_test_categories(self) -> list[str]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT DISTINCT test_category FROM results ORDER BY test_category"
+            )
+            return [test_category for (test_category,) in rows]
+
+    def get_fingerprint(self, test_category: str) -> str:
+        """
+        Hash of the stored entries of a test category; it changes whenever an entry is added, replaced or deleted.
+        """
+        hasher = hashlib.sha256()
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT id, field_names, {', '.join(PROJECTED_FIELDS)}, other_fields FROM results WHERE test_category = ? ORDER BY id",
+                (test_category,),
+            )
+            for row in rows:
+                hasher.update(json.dumps(row).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def export_to_result_files(self) -> list[Path]:
+        """
+        Write each test category in the store to its result file (`BFCL_v3_TEST_CATEGORY_result.json`), replacing the existing file.
+        Returns the paths of the written files.
+        """
+        result_file_paths = []
+        for test_category in self.get_test_categories():
+            entries = self.load_entries(test_category)
+            result_file_path = (
+                self.model_result_dir / f"{VERSION_PREFIX}_{test_category}_result.json"
+            )
+            # Write to a temporary file first so that the result file is never left half-written
+            temp_file_path = result_file_path.with_name(result_file_path.name + ".tmp")
+            with open(temp_file_path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json_dumps(entry) + "\n")
+            temp_file_path.replace(result_file_path)
+            write_result_manifest(result_file_path, [entry["id"] for entry in entries])
+            result_file_paths.append(result_file_path)
+        return result_file_paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser(
+        "export", help="Export the result stores to the per-category result files."
+    )
+    export_parser.add_argument("--model", nargs="+", type=str, default=None)
+    export_parser.add_argument("--result-dir", default=None, type=str)
+    args = parser.parse_args()
+
+    if args.result_dir is not None:
+        result_dir = PROJECT_ROOT / args.result_dir
+    else:
+        result_dir = RESULT_PATH
+
+    if args.model is not None:
+        model_result_dirs = [result_dir / model.replace("/", "_") for model in args.model]
+    else:
+        model_result_dirs = sorted(path for path in result_dir.iterdir() if path.is_dir())
+
+    for model_result_dir in model_result_dirs:
+        if not ResultStore.exists(model_result_dir):
+            print(f"No result store found in {model_result_dir}.")
+            continue
+        for result_file_path in ResultStore(model_result_dir).export_to_result_files():
+            print(f"Exported {result_file_path}.")
@@ -1,6 +1,8 @@
 import ast
 import builtins
 import copy
+import hashlib
+import inspect
 import json
 import operator
 import re
@@ -12,6 +14,13 @@ from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.model_style import ModelStyle
 from bfcl_eval.model_handler.parser.java_parser import parse_java_function_call
 from bfcl_eval.model_handler.parser.js_parser import parse_javascript_function_call
+from bfcl_eval.model_handler.rate_limiter import (
+    is_rate_limit_error,
+    reacquire_held_slot,
+    reacquire_held_slot_async,
+    release_held_slot,
+)
+from bfcl_eval.utils import json_dumps
 from tenacity import (
     retry,
     retry_if_exception_message,
@@ -65,136 +74,168 @@ def _cast_to_openai_type(properties, mapping):
     return properties
 
 
+# Compiled tools, keyed on a hash of the model style, the type mapping and the function doc. Function docs repeat across
+# hundreds of entries (eg, the multi-turn class docs), so each one is compiled once per process and model style.
+# Threads may race to compile the same doc, which is harmless; they produce the same tool.
+_COMPILED_TOOL_CACHE: dict[str, Optional[dict]] = {}
+# Marks a doc that is not in the cache yet; `None` is a valid cached tool, for model styles that drop the doc
+_NOT_COMPILED = object()
+
+
 def convert_to_tool(functions, mapping, model_style):
-    functions = copy.deepcopy(functions)
+    """
+    Compile function docs into the tool format of `model_style`.
+
+    Tools are cached per function doc, so a doc that was already compiled for this model style (in another entry, or before a
+    held-out function was added to the entry) is not deep-copied and rewritten again. The returned list and the top-level
+    dict of each tool are new, so callers may add keys to them (eg, Claude's `cache_control`), but everything nested in
+    them is shared between calls and must not be modified.
+    """
+    mapping_key = json_dumps(mapping)
     oai_tool = []
     for item in functions:
-        if "." in item["name"] and model_style in [
-            ModelStyle.OpenAI_Completions,
-            ModelStyle.OpenAI_Responses,
-            ModelStyle.Mistral,
-            ModelStyle.GOOGLE,
-            ModelStyle.OSSMODEL,
-            ModelStyle.Anthropic,
-            ModelStyle.COHERE,
-            ModelStyle.AMAZON,
-            ModelStyle.NOVITA_AI,
-        ]:
-            # OAI does not support "." in the function name so we replace it with "_". ^[a-zA-Z0-9_-]{1,64}$ is the regex for the name.
-            item["name"] = re.sub(r"\.", "_", item["name"])
+        # Not `sort_keys`: the key order of a doc ends up in the prompt of some models, so it is part of the content
+        cache_key = hashlib.sha256(
+            json_dumps([model_style.value, mapping_key, item]).encode("utf-8")
+        ).hexdigest()
+        tool = _COMPILED_TOOL_CACHE.get(cache_key, _NOT_COMPILED)
+        if tool is _NOT_COMPILED:
+            tool = _compile_tool(copy.deepcopy(item), mapping, model_style)
+            _COMPILED_TOOL_CACHE[cache_key] = tool
+        if tool is not None:
+            oai_tool.append(dict(tool))
 
-        item["parameters"]["type"] = "object"
-        item["parameters"]["properties"] = _cast_to_openai_type(
-            item["parameters"]["properties"], mapping
-        )
+    return oai_tool
 
-        if model_style == ModelStyle.Anthropic:
-            item["input_schema"] = item["parameters"]
-            del item["parameters"]
 
-        if model_style == ModelStyle.AMAZON:
-            item["inputSchema"] = {"json": item["parameters"]}
-            del item["parameters"]
+def _compile_tool(item, mapping, model_style) -> Optional[dict]:
+    if "." in item["name"] and model_style in [
+        ModelStyle.OpenAI_Completions,
+        ModelStyle.OpenAI_Responses,
+        ModelStyle.Mistral,
+        ModelStyle.GOOGLE,
+        ModelStyle.OSSMODEL,
+        ModelStyle.Anthropic,
+        ModelStyle.COHERE,
+        ModelStyle.AMAZON,
+        ModelStyle.NOVITA_AI,
+    ]:
+        # OAI does not support "." in the function name so we replace it with "_". ^[a-zA-Z0-9_-]{1,64}$ is the regex for the name.
+        item["name"] = re.sub(r"\.", "_", item["name"])
+
+    item["parameters"]["type"] = "object"
+    item["parameters"]["properties"] = _cast_to_openai_type(
+        item["parameters"]["properties"], mapping
+    )
 
-        if model_style in [
-            ModelStyle.GOOGLE,
-            ModelStyle.WRITER,
-        ]:
-            # Remove fields that are not supported by Gemini or Palmyra.
-            # No `optional` field in function schema.
-            if "optional" in item["parameters"]:
-                del item["parameters"]["optional"]
-            for params in item["parameters"]["properties"].values():
-                if "description" not in params:
-                    params["description"] = ""
-                # No `default` field in GOOGLE or Palmyra's schema.
-                if "default" in params:
-                    params["description"] += f" Default is: {str(params['default'])}."
-                    del params["default"]
-                # No `optional` field in parameter schema as well.
-                if "optional" in params:
-                    params["description"] += f" Optional: {str(params['optional'])}."
-                    del params["optional"]
-                # No `required` field in parameter schema as well.
-                if "required" in params:
-                    params["description"] += f" Required: {str(params['required'])}."
-                    del params["required"]
-                # No `maximum` field.
-                if "maximum" in params:
-                    params["description"] += f" Maximum value: {str(params['maximum'])}."
-                    del params["maximum"]
-                # No `minItems` field.
-                if "minItems" in params:
-                    params[
-                        "description"
-                    ] += f" Minimum number of items: {str(params['minItems'])}."
-                    del params["minItems"]
-                # No `maxItems` field.
-                if "maxItems" in params:
-                    params[
-                        "description"
-                    ] += f" Maximum number of items: {str(params['maxItems'])}."
-                    del params["maxItems"]
-                # No `additionalProperties` field.
-                if "additionalProperties" in params:
-                    params[
-                        "description"
-                    ] += f" Additional properties: {str(params['additionalProperties'])}."
-                    del params["additionalProperties"]
-                # For Gemini, only `enum` field when the type is `string`.
-                # For Palmyra, `enum` field is not supported.
-                if "enum" in params and (
-                    model_style == ModelStyle.WRITER
-                    or (model_style == ModelStyle.GOOGLE and params["type"] != "string")
-                ):
-                    params["description"] += f" Enum values: {str(params['enum'])}."
-                    del params["enum"]
-                # No `format` when type is `string`
-                if "format" in params and params["type"] == "string":
-                    params["description"] += f" Format: {str(params['format'])}."
-                    del params["format"]
-
-        # Process the return field
-        if "response" in item:
-            if model_style in [
-                ModelStyle.Anthropic,
-                ModelStyle.GOOGLE,
-                ModelStyle.FIREWORK_AI,
-                ModelStyle.WRITER,
-                ModelStyle.AMAZON,
-                ModelStyle.NOVITA_AI,
-            ]:
-                item[
+    if model_style == ModelStyle.Anthropic:
+        item["input_schema"] = item["parameters"]
+        del item["parameters"]
+
+    if model_style == ModelStyle.AMAZON:
+        item["inputSchema"] = {"json": item["parameters"]}
+        del item["parameters"]
+
+    if model_style in [
+        ModelStyle.GOOGLE,
+        ModelStyle.WRITER,
+    ]:
+        # Remove fields that are not supported by Gemini or Palmyra.
+        # No `optional` field in function schema.
+        if "optional" in item["parameters"]:
+            del item["parameters"]["optional"]
+        for params in item["parameters"]["properties"].values():
+            if "description" not in params:
+                params["description"] = ""
+            # No `default` field in GOOGLE or Palmyra's schema.
+            if "default" in params:
+                params["description"] += f" Default is: {str(params['default'])}."
+                del params["default"]
+            # No `optional` field in parameter schema as well.
+            if "optional" in params:
+                params["description"] += f" Optional: {str(params['optional'])}."
+                del params["optional"]
+            # No `required` field in parameter schema as well.
+            if "required" in params:
+                params["description"] += f" Required: {str(params['required'])}."
+                del params["required"]
+            # No `maximum` field.
+            if "maximum" in params:
+                params["description"] += f" Maximum value: {str(params['maximum'])}."
+                del params["maximum"]
+            # No `minItems` field.
+            if "minItems" in params:
+                params[
                     "description"
-                ] += f" The response field has the following schema: {json.dumps(item['response'])}"
-                del item["response"]
-
+                ] += f" Minimum number of items: {str(params['minItems'])}."
+                del params["minItems"]
+            # No `maxItems` field.
+            if "maxItems" in params:
+                params[
+                    "description"
+                ] += f" Maximum number of items: {str(params['maxItems'])}."
+                del params["maxItems"]
+            # No `additionalProperties` field.
+            if "additionalProperties" in params:
+                params[
+                    "description"
+                ] += f" Additional properties: {str(params['additionalProperties'])}."
+                del params["additionalProperties"]
+            # For Gemini, only `enum` field when the type is `string`.
+            # For Palmyra, `enum` field is not supported.
+            if "enum" in params and (
+                model_style == ModelStyle.WRITER
+                or (model_style == ModelStyle.GOOGLE and params["type"] != "string")
+            ):
+                params["description"] += f" Enum values: {str(params['enum'])}."
+                del params["enum"]
+            # No `format` when type is `string`
+            if "format" in params and params["type"] == "string":
+                params["description"] += f" Format: {str(params['format'])}."
+                del params["format"]
+
+    # Process the return field
+    if "response" in item:
         if model_style in [
             ModelStyle.Anthropic,
             ModelStyle.GOOGLE,
-            ModelStyle.OSSMODEL,
-        ]:
-            oai_tool.append(item)
-        elif model_style in [
-            ModelStyle.OpenAI_Responses
-        ]:
-            oai_tool.append({"type": "function", 
-                             "name": item["name"], 
-                             "description": item["description"], 
-                             "parameters": item["parameters"]})
-        elif model_style in [
-            ModelStyle.COHERE,
-            ModelStyle.OpenAI_Completions,
-            ModelStyle.Mistral,
             ModelStyle.FIREWORK_AI,
             ModelStyle.WRITER,
+            ModelStyle.AMAZON,
             ModelStyle.NOVITA_AI,
         ]:
-            oai_tool.append({"type": "function", "function": item})
-        elif model_style == ModelStyle.AMAZON:
-            oai_tool.append({"toolSpec": item})
-
-    return oai_tool
+            item[
+                "description"
+            ] += f" The response field has the following schema: {json.dumps(item['response'])}"
+            del item["response"]
+
+    if model_style in [
+        ModelStyle.Anthropic,
+        ModelStyle.GOOGLE,
+        ModelStyle.OSSMODEL,
+    ]:
+        return item
+    elif model_style in [
+        ModelStyle.OpenAI_Responses
+    ]:
+        return {"type": "function", 
+                "name": item["name"], 
+                "description": item["description"], 
+                "parameters": item["parameters"]}
+    elif model_style in [
+        ModelStyle.COHERE,
+        ModelStyle.OpenAI_Completions,
+        ModelStyle.Mistral,
+        ModelStyle.FIREWORK_AI,
+        ModelStyle.WRITER,
+        ModelStyle.NOVITA_AI,
+    ]:
+        return {"type": "function", "function": item}
+    elif model_style == ModelStyle.AMAZON:
+        return {"toolSpec": item}
+
+    # Other model styles don't take tools in this form
+    return None
 
 
 def convert_to_function_call(function_call_list):
@@ -766,6 +807,8 @@ def retry_with_backoff(
 ) -> Callable:
     """
     Decorator to retry a function with exponential backoff based on specified error types or result conditions.
+    Rate limit errors instead wait as long as the handler's shared `RateLimiter` dictates, so that concurrent requests to the same provider back off together.
+    The query gives up its rate limiter slot while it waits, and each retry is admitted by the limiter again.
 
     Note:
         At least one of `error_type` or `error_message_pattern` must be provided.
@@ -803,8 +846,20 @@ def retry_with_backoff(
         # Combine all conditions using logical OR
         retry_policy = reduce(operator.or_, conditions)
 
-        @retry(
-            wait=wait_random_exponential(min=min_wait, max=max_wait),
+        exponential_wait = wait_random_exponential(min=min_wait, max=max_wait)
+
+        def wait_for_rate_limit(retry_state) -> float:
+            # When the provider throttles us, wait as long as it asks for (shared with all other requests to the same model), instead of a blind exponential backoff
+            error = retry_state.outcome.exception()
+            handler = retry_state.args[0] if retry_state.args else None
+            # Don't hold on to the rate limiter slot while sleeping; the next attempt is admitted again in `wrapped`
+            release_held_slot()
+            if is_rate_limit_error(error) and hasattr(handler, "rate_limiter"):
+                return handler.rate_limiter.on_rate_limited(error)
+            return exponential_wait(retry_state)
+
+        retry_decorator = retry(
+            wait=wait_for_rate_limit,
             retry=retry_policy,
             before_sleep=lambda retry_state: print(
                 f"Attempt {retry_state.attempt_number} failed. "
@@ -813,8 +868,21 @@ def retry_with_backoff(
             ),
             **kwargs,
         )
-        def wrapped(*args, **inner_kwargs):
-            return func(*args, **inner_kwargs)
+
+        # tenacity retries coroutine functions with an async sleep, so the event loop is never blocked
+        if inspect.iscoroutinefunction(func):
+
+            @retry_decorator
+            async def wrapped(*args, **inner_kwargs):
+                await reacquire_held_slot_async()
+                return await func(*args, **inner_kwargs)
+
+        else:
+
+            @retry_decorator
+            def wrapped(*args, **inner_kwargs):
+                reacquire_held_slot()
+                return func(*args, **inner_kwargs)
 
         return wrapped
 
@@ -0,0 +1,86 @@
+import time
+
+from bfcl_eval.constants.eval_config import POSSIBLE_ANSWER_PATH, PROMPT_PATH
+from bfcl_eval.utils import JSON_BACKENDS, JSONCodec
+from tabulate import tabulate
+
+"""
+This script benchmarks the JSON backends of `bfcl_eval.utils` on the dataset files shipped in `data/`.
+For each installed backend, it times decoding every line of every file, and encoding the decoded entries back, and checks
+that the decoded entries are identical to the standard library's. Files are only encoded with a fast backend when it is picked
+explicitly with `BFCL_JSON_BACKEND`, since its output is formatted differently.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard/bfcl_eval/scripts
+python benchmark_json_io.py
+```
+"""
+
+NUM_RUNS = 3
+
+
+def get_available_codecs() -> list[JSONCodec]:
+    codecs = []
+    for backend in JSON_BACKENDS:
+        try:
+            codecs.append(JSONCodec(backend))
+        except ImportError:
+            print(f"Skipping {backend}, which is not installed.")
+    return codecs
+
+
+def best_time(function) -> float:
+    run_times = []
+    for _ in range(NUM_RUNS):
+        start_time = time.perf_counter()
+        function()
+        run_times.append(time.perf_counter() - start_time)
+    return min(run_times)
+
+
+dataset_files = sorted(PROMPT_PATH.glob("*.json")) + sorted(POSSIBLE_ANSWER_PATH.glob("*.json"))
+dataset_lines = [file_path.read_bytes().splitlines() for file_path in dataset_files]
+total_size_mb = sum(file_path.stat().st_size for file_path in dataset_files) / 1024**2
+# The largest file is reported on its own, since it dominates the loading time of a full run
+largest_file_index = max(range(len(dataset_files)), key=lambda i: dataset_files[i].stat().st_size)
+
+codecs = get_available_codecs()
+reference_entries = [[JSONCodec("json").loads(line) for line in lines] for lines in dataset_lines]
+
+rows = []
+for codec in codecs:
+    decoded_entries = [[codec.loads(line) for line in lines] for lines in dataset_lines]
+    if decoded_entries != reference_entries:
+        raise AssertionError(f"The {codec.backend} backend decodes the dataset differently.")
+
+    decode_time = best_time(
+        lambda: [[codec.loads(line) for line in lines] for lines in dataset_lines]
+    )
+    largest_file_decode_time = best_time(
+        lambda: [codec.loads(line) for line in dataset_lines[largest_file_index]]
+    )
+    encode_time = best_time(
+        lambda: [[codec.dumps(entry) for entry in entries] for entries in reference_entries]
+    )
+    rows.append([codec.backend, decode_time, largest_file_decode_time, encode_time])
+
+baseline_decode_time, baseline_largest_file_decode_time, baseline_encode_time = rows[-1][1:]
+print(
+    f"{len(dataset_files)} dataset files, {total_size_mb:.1f} MB in total; the largest is {dataset_files[largest_file_index].name}. Best of {NUM_RUNS} runs."
+)
+print(
+    tabulate(
+        [
+            [
+                backend,
+                f"{decode_time:.3f}s ({baseline_decode_time / decode_time:.1f}x)",
+                f"{largest_file_decode_time:.3f}s ({baseline_largest_file_decode_time / largest_file_decode_time:.1f}x)",
+                f"{encode_time:.3f}s ({baseline_encode_time / encode_time:.1f}x)",
+            ]
+            for backend, decode_time, largest_file_decode_time, encode_time in rows
+        ],
+        headers=["Backend", "Decode all", "Decode largest", "Encode all"],
+        tablefmt="pretty",
+    )
+)
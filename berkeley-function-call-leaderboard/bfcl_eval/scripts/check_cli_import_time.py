@@ -0,0 +1,66 @@
+import statistics
+import subprocess
+import sys
+import time
+
+"""
+This script checks that the `bfcl` CLI starts up quickly, ie, that `bfcl --help` doesn't import the model handlers, their SDKs, or the evaluation stack.
+It runs `bfcl --help` in a fresh interpreter several times and fails if the median wall time exceeds the budget.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard/bfcl_eval/scripts
+python check_cli_import_time.py
+```
+
+To find out what is being imported, run `python -X importtime -m bfcl_eval --help`.
+"""
+
+# In seconds, for the whole `bfcl --help` run, including interpreter startup
+IMPORT_TIME_BUDGET_SECONDS = 1.0
+NUM_RUNS = 5
+# Modules that must not be imported just to print the help message
+HEAVY_MODULES = [
+    "bfcl_eval._llm_response_generation",
+    "bfcl_eval.eval_checker.eval_runner",
+    "bfcl_eval.model_handler.base_handler",
+    "numpy",
+    "pandas",
+]
+
+
+def time_cli_help() -> float:
+    start_time = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "bfcl_eval", "--help"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start_time
+
+
+def get_imported_heavy_modules() -> list[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, bfcl_eval.__main__; print('\\n'.join(sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    imported_modules = set(output.splitlines())
+    return [module for module in HEAVY_MODULES if module in imported_modules]
+
+
+imported_heavy_modules = get_imported_heavy_modules()
+run_times = [time_cli_help() for _ in range(NUM_RUNS)]
+median_run_time = statistics.median(run_times)
+
+print(f"`bfcl --help` took {median_run_time:.3f}s (median of {NUM_RUNS} runs), the budget is {IMPORT_TIME_BUDGET_SECONDS:.3f}s.")
+if imported_heavy_modules:
+    print(f"The following modules should not be imported at CLI startup: {imported_heavy_modules}")
+if median_run_time > IMPORT_TIME_BUDGET_SECONDS or imported_heavy_modules:
+    sys.exit(1)
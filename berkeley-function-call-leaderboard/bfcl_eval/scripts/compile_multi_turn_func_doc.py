@@ -40,7 +40,7 @@ for class_name in CLASS_FILE_PATH_MAPPING.keys():
 # Store the methods one json file per class
 for class_name, file_name in CLASS_FILE_PATH_MAPPING.items():
 
-    with open(MULTI_TURN_FUNC_DOC_PATH / f"{file_name.rsplit('.')[-1]}.json", "w") as f:
+    with open(MULTI_TURN_FUNC_DOC_PATH / f"{file_name.rsplit('.')[-1]}.json", "w", encoding="utf-8") as f:
         for method_name, method_json in class_method_name_mapping[class_name].items():
             f.write(method_json)
             f.write("\n")
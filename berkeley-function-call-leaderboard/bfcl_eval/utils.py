@@ -1,14 +1,110 @@
+import importlib.util
 import json
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Callable, Iterator, NamedTuple, Optional, Union
 
 from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING, TEST_FILE_MAPPING, VERSION_PREFIX
+from bfcl_eval.constants.eval_config import POSSIBLE_ANSWER_PATH, PROMPT_PATH
+
+JSON_BACKENDS = ["orjson", "msgspec", "json"]
+
+
+class JSONCodec:
+    """
+    Decodes and encodes the dataset, result and score files with one of `JSON_BACKENDS`.
+
+    orjson and msgspec are several times faster than the standard library `json` module. Whatever they can't handle
+    (eg, integers beyond 64 bits, or `NaN` literals in the input) falls back to `json`, so decoding gives the same values and
+    raises the same errors with every backend. Encoding does not: the fast backends write compact, raw UTF-8 JSON, and write
+    `NaN` and infinity as `null`.
+    """
+
+    def __init__(self, backend: str) -> None:
+        if backend == "orjson":
+            import orjson
+
+            self._fast_loads = orjson.loads
+            self._fast_dumps = lambda value, default: orjson.dumps(
+                value, default=default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        elif backend == "msgspec":
+            import msgspec
+
+            self._fast_loads = msgspec.json.decode
+            self._fast_dumps = lambda value, default: msgspec.json.encode(
+                value, enc_hook=default
+            ).decode("utf-8")
+        elif backend == "json":
+            self._fast_loads = None
+            self._fast_dumps = None
+        else:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Choose from {JSON_BACKENDS}.")
+        self.backend = backend
+
+    def loads(self, data: Union[str, bytes]):
+        if self._fast_loads is not None:
+            try:
+                return self._fast_loads(data)
+            except Exception:
+                # Either the standard library can decode it after all, or it raises the usual `json.JSONDecodeError`
+                pass
+        return json.loads(data)
+
+    def dumps(self, value, default: Optional[Callable] = None) -> str:
+        if self._fast_dumps is not None:
+            try:
+                return self._fast_dumps(value, default)
+            except Exception:
+                pass
+        return json.dumps(value, default=default)
+
+
+def get_json_codec(backend: Optional[str] = None) -> JSONCodec:
+    """
+    By default, the fastest installed backend is used.
+    """
+    if backend is None:
+        backend = next(
+            (
+                candidate
+                for candidate in JSON_BACKENDS
+                if candidate == "json" or importlib.util.find_spec(candidate) is not None
+            )
+        )
+    return JSONCodec(backend)
+
+
+# Set the `BFCL_JSON_BACKEND` environment variable to pick one of `JSON_BACKENDS` explicitly
+JSON_BACKEND = os.getenv("BFCL_JSON_BACKEND")
+# Decoding gives the same values with every backend, so it uses the fastest installed one unless told otherwise
+JSON_CODEC = get_json_codec(JSON_BACKEND)
+# Encoding changes the format of the written files, so it sticks to `json` unless a fast backend is picked explicitly
+JSON_ENCODING_CODEC = JSONCodec(JSON_BACKEND or "json")
+
+
+def json_loads(data: Union[str, bytes]):
+    return JSON_CODEC.loads(data)
+
+
+def json_dumps(value, default: Optional[Callable] = None) -> str:
+    """
+    Encode a value on a single line. By default, the output is exactly that of `json.dumps`, so the result and score files
+    don't depend on which packages are installed. Persistent cache keys and fingerprints must use `json.dumps` directly,
+    so that they don't change when `BFCL_JSON_BACKEND` is set either.
+    """
+    return JSON_ENCODING_CODEC.dumps(value, default)
 
 
 def extract_test_category(input_string: Union[str, Path]) -> str:
     input_string = str(input_string)
+    # The dataset, result and score files of known test categories are looked up by name; anything else goes through the pattern
+    test_category = _FILE_NAME_TO_TEST_CATEGORY.get(os.path.basename(input_string))
+    if test_category is not None:
+        return test_category
+
     pattern = rf".*{VERSION_PREFIX}_(\w+?)(?:_unused)?(?:_score|_result)?\.json"
     match = re.search(pattern, input_string)
 
@@ -26,6 +122,12 @@ def extract_test_category_from_id(test_entry_id: str) -> str:
 
 
 def find_file_with_suffix(folder_path: Path, suffix: str) -> Path:
+    test_category = TEST_CATEGORY_CATALOGUE.get(suffix)
+    if test_category is not None:
+        for file_name in test_category.file_names:
+            if (folder_path / file_name).exists():
+                return folder_path / file_name
+
     for json_file in folder_path.glob("*.json"):
         if extract_test_category(json_file) == suffix:
             return json_file
@@ -33,7 +135,7 @@ def find_file_with_suffix(folder_path: Path, suffix: str) -> Path:
 
 
 def is_multi_turn(test_category):
-    return "multi_turn" in test_category
+    return _get_test_category_flag(test_category, "is_multi_turn")
 
 
 def contain_multi_turn_irrelevance(test_category):
@@ -49,7 +151,7 @@ def is_rest(test_category):
 
 
 def is_relevance_or_irrelevance(test_category):
-    return "relevance" in test_category or "irrelevance" in test_category
+    return _get_test_category_flag(test_category, "is_relevance_or_irrelevance")
 
 
 def is_chatable(test_category):
@@ -57,29 +159,202 @@ def is_chatable(test_category):
 
 
 def is_java(test_category):
-    return "java" in test_category
+    return _get_test_category_flag(test_category, "is_java")
 
 
 def is_js(test_category):
-    return "javascript" in test_category
+    return _get_test_category_flag(test_category, "is_js")
 
 
 def is_sql(test_category):
     return "sql" in test_category
 
 
+class TestCategory(NamedTuple):
+    name: str
+    # The dataset file name, the same in `PROMPT_PATH` and `POSSIBLE_ANSWER_PATH`
+    file_name: str
+    result_file_name: str
+    score_file_name: str
+    prompt_path: Path
+    possible_answer_path: Path
+    is_multi_turn: bool
+    is_java: bool
+    is_js: bool
+    is_relevance_or_irrelevance: bool
+    # Chatable, SQL and executable categories are not evaluated in the current iteration of the benchmark
+    is_evaluated: bool
+
+    @property
+    def file_names(self) -> tuple[str, str, str]:
+        return (self.file_name, self.result_file_name, self.score_file_name)
+
+
+# How each flag of a `TestCategory` follows from the name. Only applied directly to names outside the catalogue (eg, entry IDs).
+_TEST_CATEGORY_FLAG_RULES: dict[str, Callable[[str], bool]] = {
+    "is_multi_turn": lambda name: "multi_turn" in name,
+    "is_java": lambda name: "java" in name,
+    "is_js": lambda name: "javascript" in name,
+    "is_relevance_or_irrelevance": lambda name: "relevance" in name or "irrelevance" in name,
+}
+
+
+def _build_test_category(test_category: str, file_name: str) -> TestCategory:
+    return TestCategory(
+        name=test_category,
+        file_name=file_name,
+        result_file_name=file_name.replace(".json", "_result.json"),
+        score_file_name=file_name.replace(".json", "_score.json"),
+        prompt_path=PROMPT_PATH / file_name,
+        possible_answer_path=POSSIBLE_ANSWER_PATH / file_name,
+        **{flag: rule(test_category) for flag, rule in _TEST_CATEGORY_FLAG_RULES.items()},
+        is_evaluated=not (
+            is_chatable(test_category) or is_sql(test_category) or is_executable(test_category)
+        ),
+    )
+
+
+# Everything about each test category that would otherwise be recomputed from its name over and over, built once per process
+TEST_CATEGORY_CATALOGUE: dict[str, TestCategory] = {
+    test_category: _build_test_category(test_category, file_name)
+    for test_category, file_name in TEST_FILE_MAPPING.items()
+}
+# Dataset, result or score file name -> test category
+_FILE_NAME_TO_TEST_CATEGORY = {
+    file_name: test_category.name
+    for test_category in TEST_CATEGORY_CATALOGUE.values()
+    for file_name in test_category.file_names
+}
+
+
+def _get_test_category_flag(test_category: str, flag: str) -> bool:
+    """
+    Known test categories are answered by the catalogue, so that it is the single source of truth for them.
+    """
+    catalogued_test_category = TEST_CATEGORY_CATALOGUE.get(test_category)
+    if catalogued_test_category is not None:
+        return getattr(catalogued_test_category, flag)
+    return _TEST_CATEGORY_FLAG_RULES[flag](test_category)
+
+
+# Valid `--test-category` argument -> the test categories it stands for; collections take precedence over test categories
+_TEST_CATEGORY_ARGUMENT_MAPPING = {
+    **{test_category: (test_category,) for test_category in TEST_FILE_MAPPING},
+    **{
+        collection: tuple(test_categories)
+        for collection, test_categories in TEST_COLLECTION_MAPPING.items()
+    },
+}
+
+
+def iter_jsonl(file_path) -> Iterator[dict]:
+    """
+    Decode a JSON Lines file one entry at a time, without reading the whole file into memory first.
+    """
+    with open(file_path, "rb") as f:
+        for line in f:
+            yield json_loads(line)
+
+
 def load_file(file_path, sort_by_id=False):
-    result = []
-    with open(file_path) as f:
-        file = f.readlines()
-        for line in file:
-            result.append(json.loads(line))
+    result = list(iter_jsonl(file_path))
 
     if sort_by_id:
         result.sort(key=sort_key)
     return result
 
 
+def get_result_log_path(result_file_path: Path) -> Path:
+    """
+    The append log that sits next to a result file while generation is in progress.
+    It doesn't end with `.json`, so it is never picked up as a result file by the evaluation pipeline.
+    """
+    return result_file_path.with_name(result_file_path.name + ".log")
+
+
+def append_to_result_log(result_file_path: Path, entries: list[dict]) -> None:
+    with open(get_result_log_path(result_file_path), "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json_dumps(entry) + "\n")
+        # Flush right away, so that a crash only ever loses entries that are still in flight
+        f.flush()
+
+
+def compact_result_log(result_file_path: Path) -> None:
+    """
+    Merge the append log of a result file back into the result file itself.
+    Entries from the log take precedence over existing entries with the same ID, and the merged entries are written back sorted by ID.
+    """
+    log_path = get_result_log_path(result_file_path)
+    if not log_path.exists():
+        return
+
+    merged_entries = {}
+    if result_file_path.exists():
+        merged_entries = {entry["id"]: entry for entry in load_file(result_file_path)}
+
+    with open(log_path, "rb") as f:
+        for line in f:
+            try:
+                entry = json_loads(line)
+            except json.JSONDecodeError:
+                # The last line can be truncated if the process was killed mid-write; that entry will be regenerated
+                continue
+            merged_entries[entry["id"]] = entry
+
+    sorted_entries = sorted(merged_entries.values(), key=sort_key)
+    # Write to a temporary file first so that the result file is never left half-written
+    temp_file_path = result_file_path.with_name(result_file_path.name + ".tmp")
+    with open(temp_file_path, "w", encoding="utf-8") as f:
+        for entry in sorted_entries:
+            f.write(json_dumps(entry) + "\n")
+    temp_file_path.replace(result_file_path)
+    log_path.unlink()
+    write_result_manifest(result_file_path, [entry["id"] for entry in sorted_entries])
+
+
+def get_result_manifest_path(result_file_path: Path) -> Path:
+    """
+    The manifest of IDs present in a result file, used to resume generation without parsing the result file.
+    Like the append log, it doesn't end with `.json`.
+    """
+    return result_file_path.with_name(result_file_path.name + ".manifest")
+
+
+def _get_file_fingerprint(file_path: Path) -> list[int]:
+    stat = file_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def write_result_manifest(result_file_path: Path, ids: list[str]) -> None:
+    manifest = {
+        "result_file_fingerprint": _get_file_fingerprint(result_file_path),
+        "ids": ids,
+    }
+    with open(get_result_manifest_path(result_file_path), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+def load_result_ids(result_file_path: Path) -> set[str]:
+    """
+    Return the IDs of all entries in a result file.
+    The manifest is used if it still matches the result file's size and modification time; otherwise, the result file is parsed and the manifest is rebuilt.
+    """
+    manifest_path = get_result_manifest_path(result_file_path)
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest["result_file_fingerprint"] == _get_file_fingerprint(result_file_path):
+                return set(manifest["ids"])
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    ids = [entry["id"] for entry in iter_jsonl(result_file_path)]
+    write_result_manifest(result_file_path, ids)
+    return set(ids)
+
+
 def write_list_of_dicts_to_file(filename, data, subdir=None):
     if subdir:
         # Ensure the subdirectory exists
@@ -89,11 +364,11 @@ def write_list_of_dicts_to_file(filename, data, subdir=None):
         filename = os.path.join(subdir, filename)
 
     # Write the list of dictionaries to the file in JSON format
-    with open(filename, "w") as f:
+    with open(filename, "w", encoding="utf-8") as f:
         for i, entry in enumerate(data):
             # Go through each key-value pair in the dictionary to make sure the values are JSON serializable
             entry = make_json_serializable(entry)
-            json_str = json.dumps(entry)
+            json_str = json_dumps(entry)
             f.write(json_str)
             if i < len(data) - 1:
                 f.write("\n")
@@ -106,6 +381,9 @@ def make_json_serializable(value):
     elif isinstance(value, list):
         # If the value is a list, we need to process each element recursively
         return [make_json_serializable(item) for item in value]
+    elif value is None or isinstance(value, (str, int, float)):
+        # By far the most common leaves, and always serializable; no need to try
+        return value
     else:
         # Try to serialize the value directly, and if it fails, convert it to a string
         try:
@@ -129,7 +407,13 @@ def sort_key(entry):
 
     In either case, the universal index is enough to sort the entries.
     """
-    parts = entry["id"].rsplit("_", 1)
+    return _parse_sort_key(entry["id"])
+
+
+# The same IDs are sorted over and over (every dataset, result and score file), so each one is only parsed once
+@lru_cache(maxsize=None)
+def _parse_sort_key(entry_id: str) -> tuple[str, int]:
+    parts = entry_id.rsplit("_", 1)
     test_category, index = parts[0], parts[1]
     # This handles the case where the index is in the form TestCategory_Index-FuncDocSubIndex-PromptSubIndex
     if "-" in index:
@@ -186,18 +470,14 @@ def is_empty_output(decoded_output):
 
 def parse_test_category_argument(test_category_args):
     test_name_total = set()
-    test_filename_total = set()
 
     for test_category in test_category_args:
-        if test_category in TEST_COLLECTION_MAPPING:
-            for test_name in TEST_COLLECTION_MAPPING[test_category]:
-                test_name_total.add(test_name)
-                test_filename_total.add(TEST_FILE_MAPPING[test_name])
-        elif test_category in TEST_FILE_MAPPING:
-            test_name_total.add(test_category)
-            test_filename_total.add(TEST_FILE_MAPPING[test_category])
-        else:
+        if test_category not in _TEST_CATEGORY_ARGUMENT_MAPPING:
             # Invalid test category name
             raise Exception(f"Invalid test category name provided: {test_category}")
+        test_name_total.update(_TEST_CATEGORY_ARGUMENT_MAPPING[test_category])
 
-    return sorted(list(test_filename_total)), sorted(list(test_name_total))
+    test_filename_total = {
+        TEST_CATEGORY_CATALOGUE[test_name].file_name for test_name in test_name_total
+    }
+    return sorted(test_filename_total), sorted(test_name_total)